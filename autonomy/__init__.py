@@ -12,7 +12,7 @@ from autonomy.perception_providers import (
 from autonomy.planner import Planner
 from autonomy.policy_router import PolicyRouter, PolicyType
 from autonomy.robot_interface import RobotInterface
-from autonomy.sim_robot import SimRobot
+from autonomy.sim_robot import SceneConfig, SimRobot
 from autonomy.types import Goal, ObjClass
 
 __all__ = [
@@ -27,6 +27,7 @@ __all__ = [
     "PolicyRouter",
     "PolicyType",
     "RobotInterface",
+    "SceneConfig",
     "SimPerceptionProvider",
     "SimRobot",
     "StepExecutor",
@@ -2,14 +2,19 @@ from __future__ import annotations
 
 import time
 from statistics import mean
-from typing import List, Optional
+from typing import Dict, List, Optional
+
+import numpy as np
 
 from autonomy.executor import StepExecutor
+from autonomy.metrics import REGISTRY, MetricsRegistry
 from autonomy.perception import PerceptionModule
 from autonomy.planner import Planner
+from autonomy.rollout import RolloutPool
 from autonomy.sim_robot import SimRobot
 from autonomy.telemetry import metrics_dict, world_snapshot
-from autonomy.types import EpisodeMetrics, EpisodeResult, Goal, TelemetryFrame, WorldState
+from autonomy.timeline import BoundedTimeline
+from autonomy.types import EpisodeMetrics, EpisodeResult, Goal, PlanStep, TelemetryFrame, WorldState
 
 
 class Track1Agent:
@@ -22,6 +27,10 @@ class Track1Agent:
         sink,
         max_retries_per_step: int = 2,
         max_replans: int = 3,
+        lookahead: Optional[RolloutPool] = None,
+        timeline_limit: Optional[int] = None,
+        registry: MetricsRegistry = REGISTRY,
+        recorder=None,
     ) -> None:
         self.robot = robot
         self.planner = planner
@@ -30,22 +39,52 @@ class Track1Agent:
         self.sink = sink
         self.max_retries_per_step = max_retries_per_step
         self.max_replans = max_replans
+        self.lookahead = lookahead
+        # Frames kept in memory per episode timeline; older ones spill to a temp file.
+        self.timeline_limit = timeline_limit
+        # Optional LeRobotRecorder fed at control rate through the robot's command_observer.
+        self.recorder = recorder
+        self._camera_frames: Dict[str, object] = {}
+        self.last_lookahead: Dict[str, float] = {}
         self._recent_results: List[int] = []
+        self._episodes = registry.counter("autonomy_episodes_total", "Episodes run")
+        self._successes = registry.counter("autonomy_episode_successes_total", "Episodes that reached the goal")
+        self._failures = registry.counter(
+            "autonomy_episode_failures_total", "Failed episodes by fail reason", ["fail_reason"]
+        )
+        self._retries = registry.counter("autonomy_step_retries_total", "Failed step attempts that were retried")
+        self._replans = registry.counter("autonomy_replans_total", "Replans by triggering reason", ["reason"])
+        self._tick_seconds = registry.histogram("autonomy_tick_seconds", "Control loop tick latency")
+        self._perception_seconds = registry.histogram("autonomy_perception_seconds", "Perception update latency")
+        self._step_seconds = registry.histogram("autonomy_step_seconds", "Step execution latency", ["action"])
 
     def run_episode(self, goal: Goal, max_ticks: int = 80) -> EpisodeResult:
-        state = WorldState()
         metrics = EpisodeMetrics()
-        timeline: List[TelemetryFrame] = []
+        recording = self._start_recording(goal)
+        try:
+            return self._run_episode(goal, max_ticks, metrics)
+        finally:
+            if recording:
+                self.robot.command_observer = None
+                self.recorder.end_episode(success=metrics.success)
+
+    def _run_episode(self, goal: Goal, max_ticks: int, metrics: EpisodeMetrics) -> EpisodeResult:
+        state = WorldState()
+        timeline = BoundedTimeline(self.timeline_limit)
         start = time.monotonic()
 
         self.perception.reset()
-        state = self.perception.update(state, self.robot.observe())
+        state = self._perceive(state)
         plan = self.planner.build_plan(goal, state)
         cursor = 0
         retries_on_step = 0
         replans = 0
 
+        tick_start: Optional[float] = None
         for tick in range(max_ticks):
+            if tick_start is not None:
+                self._tick_seconds.observe(time.perf_counter() - tick_start)
+            tick_start = time.perf_counter()
             state.tick = tick
 
             if self.robot.verify_goal(goal):
@@ -59,6 +98,7 @@ class Track1Agent:
                 cursor = 0
                 replans += 1
                 metrics.replans = replans
+                self._replans.labels("empty_plan").inc()
                 state.phase = "REPLAN_EMPTY_PLAN"
                 self._emit(timeline, state, metrics, plan, "REPLAN")
                 if replans > self.max_replans:
@@ -68,11 +108,19 @@ class Track1Agent:
 
             step = plan[cursor]
             state.phase = f"EXECUTE_{step.action}"
+            step_start = time.perf_counter()
             ok, err = self.executor.run_step(step, self.robot, goal, state)
+            step_elapsed = time.perf_counter() - step_start
+            self._step_seconds.labels(step.action).observe(step_elapsed)
+            metrics.last_step_ms = step_elapsed * 1000.0
+            metrics.total_step_ms += metrics.last_step_ms
             metrics.steps_executed += 1
 
-            state = self.perception.update(state, self.robot.observe())
+            state = self._perceive(state)
             state.held_object_id = self.robot.held_object_id
+            update_world = getattr(self.robot, "update_world", None)
+            if callable(update_world):
+                update_world(state.objects.values())
 
             self._update_robot_state(state, step)
 
@@ -82,15 +130,27 @@ class Track1Agent:
                 cursor += 1
             else:
                 state.last_error = err
+                if _reason(err).endswith("_timeout"):
+                    metrics.timeouts += 1
+                if self.executor.fault is not None:
+                    metrics.fail_reason = self.executor.fault
+                    state.phase = "ROBOT_FAULT"
+                    self._emit(timeline, state, metrics, plan, step.label())
+                    break
                 retries_on_step += 1
                 metrics.retries += 1
+                self._retries.inc()
 
                 if retries_on_step > self.max_retries_per_step:
                     replans += 1
                     metrics.replans = replans
+                    self._replans.labels(_reason(err)).inc()
                     retries_on_step = 0
+                    remaining = plan[cursor:]
                     cursor = 0
                     plan = self.planner.build_plan(goal, state)
+                    if self.lookahead is not None:
+                        plan = self._lookahead_plan(goal, step, plan, remaining)
                     state.phase = "REPLAN_AFTER_FAILURE"
                     if replans > self.max_replans:
                         metrics.fail_reason = err or "replan_budget_exceeded"
@@ -100,11 +160,19 @@ class Track1Agent:
             self._emit(timeline, state, metrics, plan, step.label())
         else:
             metrics.fail_reason = "max_ticks_exceeded"
+        if tick_start is not None:
+            self._tick_seconds.observe(time.perf_counter() - tick_start)
 
         metrics.duration_s = time.monotonic() - start
         if not metrics.success and metrics.fail_reason is None:
             metrics.fail_reason = "goal_not_reached"
 
+        self._episodes.inc()
+        if metrics.success:
+            self._successes.inc()
+        else:
+            self._failures.labels(_reason(metrics.fail_reason)).inc()
+
         self._recent_results.append(1 if metrics.success else 0)
         self._recent_results = self._recent_results[-10:]
 
@@ -114,6 +182,44 @@ class Track1Agent:
 
         return EpisodeResult(goal=goal, metrics=metrics, timeline=timeline)
 
+    def _perceive(self, state: WorldState) -> WorldState:
+        start = time.perf_counter()
+        state = self.perception.update(state, self.robot.observe())
+        self._perception_seconds.observe(time.perf_counter() - start)
+        self._camera_frames = state.camera_frames
+        return state
+
+    def _start_recording(self, goal: Goal) -> bool:
+        if self.recorder is None or not hasattr(self.robot, "command_observer"):
+            return False
+        self.recorder.start_episode(_task(goal))
+        self.robot.command_observer = self._record_command
+        return True
+
+    def _record_command(self, joints: List[float], command) -> None:
+        # LeRobot SO-100 data is in degrees. Camera frames are the latest perception frames,
+        # repeated between perception updates.
+        self.recorder.record(np.degrees(joints), np.degrees(command), self._camera_frames)
+
+    def _lookahead_plan(
+        self,
+        goal: Goal,
+        failed_step: PlanStep,
+        replan: List[PlanStep],
+        remaining: List[PlanStep],
+    ) -> List[PlanStep]:
+        """Pick between replanning, retrying and re-searching via simulated rollouts."""
+        if not callable(getattr(self.robot, "snapshot", None)):
+            return replan
+        candidates: Dict[str, List[PlanStep]] = {"replan": replan, "retry": remaining}
+        if failed_step.target_id:
+            research = PlanStep(action="SEARCH", target_id=failed_step.target_id, note="lookahead_research")
+            candidates["search_first"] = [research] + [s for s in replan if s.action != "SEARCH"]
+        self.last_lookahead = self.lookahead.evaluate(self.robot, goal, candidates)
+        # Ties keep the plain replan (first candidate).
+        best = max(candidates, key=lambda name: self.last_lookahead[name])
+        return candidates[best]
+
     def _recent_success_rate(self) -> Optional[float]:
         if not self._recent_results:
             return None
@@ -121,23 +227,18 @@ class Track1Agent:
 
     def _update_robot_state(self, state: WorldState, step: PlanStep) -> None:
         """Update robot state based on the executed step."""
+        # Joint state comes from the trajectory the robot backend just streamed.
+        joints = getattr(self.robot, "joint_positions", None)
+        if joints is not None:
+            state.joint_positions = list(joints)
+            state.joint_velocities = list(getattr(self.robot, "joint_velocities", [0.0] * len(joints)))
         action = step.action
-        if action == "SEARCH":
-            # Simulate scanning movement
-            state.joint_positions = [self.robot._rng.uniform(-1.57, 1.57) for _ in range(6)]
-            state.joint_velocities = [self.robot._rng.uniform(-0.5, 0.5) for _ in range(6)]
-        elif action == "NAVIGATE":
-            # Simulate navigation to target
-            state.joint_positions = [self.robot._rng.uniform(-3.14, 3.14) for _ in range(6)]
-            state.joint_velocities = [self.robot._rng.uniform(0.1, 1.0) for _ in range(6)]
-        elif action == "GRASP":
+        if action == "GRASP":
             state.gripper_state = "closed"
-            state.joint_positions[5] = 0.0  # Assume joint 6 is gripper
-            state.joint_velocities[5] = 0.0
         elif action == "PLACE_IN_BIN":
             state.gripper_state = "open"
-            state.joint_positions[5] = 1.57  # Open gripper
-            state.joint_velocities[5] = 0.0
+        if not isinstance(self.robot, SimRobot):
+            return
         # Simulate battery drain and temperature
         state.battery_level = max(0.0, state.battery_level - self.robot._rng.uniform(0.1, 1.0))
         state.temperature = state.temperature + self.robot._rng.uniform(-0.5, 0.5)
@@ -145,12 +246,18 @@ class Track1Agent:
 
     def _emit(
         self,
-        timeline: List[TelemetryFrame],
+        timeline: BoundedTimeline,
         state: WorldState,
         metrics: EpisodeMetrics,
         plan,
         current_action: str,
     ) -> None:
+        frame_metrics = metrics_dict(metrics, self._recent_success_rate())
+        sink_stats = getattr(self.sink, "sink_stats", None)
+        if callable(sink_stats):
+            stats = sink_stats()
+            if stats:
+                frame_metrics["sinks"] = stats
         frame = TelemetryFrame(
             ts_ms=int(time.time() * 1000),
             phase=state.phase,
@@ -160,7 +267,17 @@ class Track1Agent:
             replans=metrics.replans,
             last_error=state.last_error,
             world=world_snapshot(state),
-            metrics=metrics_dict(metrics, self._recent_success_rate()),
+            metrics=frame_metrics,
         )
         timeline.append(frame)
         self.sink.emit(frame)
+
+
+def _task(goal: Goal) -> str:
+    """Natural-language task string stored with recorded episodes."""
+    return f"Pick up the {goal.target_obj_class.value} and place it in the {goal.target_location_obj_class.value}"
+
+
+def _reason(err: Optional[str]) -> str:
+    """Metric label for an error string, without the per-object suffix (``grasp_failed:cup_1``)."""
+    return (err or "unknown").split(":", 1)[0]
@@ -0,0 +1,392 @@
+from __future__ import annotations
+
+import json
+import logging
+import multiprocessing as mp
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CODEBASE_VERSION = "v2.1"
+DATA_PATH = "data/chunk-{episode_chunk:03d}/episode_{episode_index:06d}.parquet"
+VIDEO_PATH = "videos/chunk-{episode_chunk:03d}/{video_key}/episode_{episode_index:06d}.mp4"
+
+# Motor order of observation.state / action rows (degrees), matching SO100_DUALCAM_MODALITY.
+SO100_MOTORS = ("shoulder_pan", "shoulder_lift", "elbow_flex", "wrist_flex", "wrist_roll", "gripper")
+
+_CLOSE = object()
+
+
+class LeRobotRecorder:
+    """Records control-rate episodes as a LeRobot v2 dataset without blocking the control loop.
+
+    Rows stream to parquet on a writer thread and frames to mp4 in an
+    encoder process; a full queue drops the tick (or repeats the last video
+    frame) and counts it. Metadata is rewritten after every episode.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        fps: float = 50.0,
+        robot_type: str = "so100",
+        task: str = "Pick up the object and place it in the bin",
+        queue_size: int = 4096,
+        row_group_size: int = 1024,
+        video: bool = True,
+        video_queue_size: int = 256,
+        codec: str = "mp4v",
+        chunks_size: int = 1000,
+    ) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("pyarrow is required for dataset recording: pip install pyarrow")
+        self._pa = pa
+        self._pq = pq
+        self.root = Path(root)
+        self.fps = fps
+        self.robot_type = robot_type
+        self.default_task = task
+        self.row_group_size = max(1, row_group_size)
+        self.codec = codec
+        self.chunks_size = chunks_size
+        (self.root / "meta").mkdir(parents=True, exist_ok=True)
+
+        self.frames = 0
+        self.dropped_frames = 0
+        self.video_dropped = 0
+        self.write_errors = 0
+        self._episode: Optional[int] = None
+        self._frame_index = 0
+        self._episode_dropped = 0
+        self._episode_video_dropped = 0
+
+        info = self._load_meta()
+        self._next_episode = info.get("total_episodes", 0)
+        # Writer-thread state.
+        self._total_frames = info.get("total_frames", 0)
+        self._features: Dict[str, Any] = info.get("features", {})
+        self._writer: Any = None
+        self._rows: Dict[str, List[Any]] = _empty_rows()
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._run, name="dataset-writer", daemon=True)
+        self._thread.start()
+
+        self._video_queue: Any = None
+        self._video_results: Any = None
+        self._video_proc: Optional[mp.Process] = None
+        if video:
+            ctx = mp.get_context("spawn")
+            self._video_queue = ctx.Queue(maxsize=video_queue_size)
+            self._video_results = ctx.Queue()
+            self._video_proc = ctx.Process(
+                target=_video_worker,
+                args=(self._video_queue, self._video_results, str(self.root), fps, codec, chunks_size),
+                name="dataset-video",
+                daemon=True,
+            )
+            self._video_proc.start()
+
+    @property
+    def recording(self) -> bool:
+        return self._episode is not None
+
+    def start_episode(self, task: Optional[str] = None) -> int:
+        if self._episode is not None:
+            self.end_episode()
+        episode = self._next_episode
+        self._next_episode += 1
+        self._episode = episode
+        self._frame_index = 0
+        self._episode_dropped = 0
+        self._episode_video_dropped = 0
+        self._queue.put(("start", episode, task or self.default_task))
+        return episode
+
+    def record(
+        self,
+        state: Sequence[float],
+        action: Sequence[float],
+        images: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Queue one control tick; False if it was dropped."""
+        if self._episode is None:
+            return False
+        index = self._frame_index
+        try:
+            self._queue.put_nowait(("row", index, tuple(state), tuple(action)))
+        except queue.Full:
+            self.dropped_frames += 1
+            self._episode_dropped += 1
+            return False
+        self._frame_index += 1
+        self.frames += 1
+        if images and self._video_queue is not None:
+            for key, image in images.items():
+                if not isinstance(image, np.ndarray):
+                    continue
+                try:
+                    self._video_queue.put_nowait(("frame", key, self._episode, index, image))
+                except queue.Full:
+                    self.video_dropped += 1
+                    self._episode_video_dropped += 1
+        return True
+
+    def end_episode(self, success: Optional[bool] = None) -> None:
+        if self._episode is None:
+            return
+        episode, length = self._episode, self._frame_index
+        self._episode = None
+        if self._video_queue is not None:
+            # Control messages must arrive; this is outside the control loop.
+            self._video_queue.put(("end", episode, length))
+        self._queue.put(("end", episode, length, success, self._episode_dropped, self._episode_video_dropped))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "episodes": self._next_episode,
+            "frames": self.frames,
+            "dropped_frames": self.dropped_frames,
+            "video_dropped": self.video_dropped,
+            "write_errors": self.write_errors,
+            "queue_depth": self._queue.qsize(),
+        }
+
+    def close(self) -> None:
+        """Finish the current episode, drain both queues and write final metadata."""
+        if not self._thread.is_alive():
+            return
+        self.end_episode()
+        if self._video_queue is not None:
+            self._video_queue.put(("stop",))
+        # The writer thread drains the encoder's results before the process can exit.
+        self._queue.put(_CLOSE)
+        self._thread.join()
+        if self._video_proc is not None:
+            self._video_proc.join()
+            self._video_proc = None
+
+    # -- writer thread -----------------------------------------------------
+
+    def _run(self) -> None:
+        episode = 0
+        task_index = 0
+        while True:
+            item = self._queue.get()
+            if item is _CLOSE:
+                self._collect_video_results(final=True)
+                self._write_info()
+                return
+            kind = item[0]
+            try:
+                if kind == "row":
+                    _, index, state, action = item
+                    rows = self._rows
+                    rows["observation.state"].append(state)
+                    rows["action"].append(action)
+                    rows["frame_index"].append(index)
+                    if len(rows["frame_index"]) >= self.row_group_size:
+                        self._flush_rows(episode, task_index)
+                elif kind == "start":
+                    _, episode, task = item
+                    task_index = self._task_index(task)
+                    self._rows = _empty_rows()
+                elif kind == "end":
+                    _, episode, length, success, dropped, video_dropped = item
+                    self._flush_rows(episode, task_index)
+                    if self._writer is not None:
+                        self._writer.close()
+                        self._writer = None
+                    self._total_frames += length
+                    self._episodes.append(
+                        {
+                            "episode_index": episode,
+                            "tasks": [self._tasks[task_index]],
+                            "length": length,
+                            "success": success,
+                            "dropped_frames": dropped,
+                            "video_dropped_frames": video_dropped,
+                        }
+                    )
+                    self._collect_video_results(final=False)
+                    self._write_meta()
+            except Exception:
+                # Keep draining: a dead writer would leave the control loop's puts blocking on close().
+                self.write_errors += 1
+                logger.exception(f"Dataset writer failed on {kind!r}")
+
+    def _flush_rows(self, episode: int, task_index: int) -> None:
+        rows = self._rows
+        count = len(rows["frame_index"])
+        if not count:
+            return
+        pa = self._pa
+        frame_index = np.asarray(rows["frame_index"], dtype=np.int64)
+        # Global index continues from everything recorded before this episode.
+        table = pa.table(
+            {
+                "observation.state": pa.array(rows["observation.state"], type=pa.list_(pa.float32())),
+                "action": pa.array(rows["action"], type=pa.list_(pa.float32())),
+                "timestamp": pa.array((frame_index / self.fps).astype(np.float32)),
+                "frame_index": pa.array(frame_index),
+                "episode_index": pa.array(np.full(count, episode, dtype=np.int64)),
+                "index": pa.array(frame_index + self._total_frames),
+                "task_index": pa.array(np.full(count, task_index, dtype=np.int64)),
+            }
+        )
+        if self._writer is None:
+            path = self.root / DATA_PATH.format(episode_chunk=episode // self.chunks_size, episode_index=episode)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = self._pq.ParquetWriter(str(path), table.schema)
+            for name in ("observation.state", "action"):
+                dims = len(rows[name][0])
+                names = list(SO100_MOTORS) if dims == len(SO100_MOTORS) else None
+                self._features.setdefault(name, {"dtype": "float32", "shape": [dims], "names": names})
+        self._writer.write_table(table)
+        self._rows = _empty_rows()
+
+    def _collect_video_results(self, final: bool) -> None:
+        if self._video_results is None:
+            return
+        while True:
+            try:
+                # On close, wait for the encoder's "stopped" marker; otherwise take what is ready.
+                result = self._video_results.get(timeout=60.0) if final else self._video_results.get_nowait()
+            except (queue.Empty, EOFError, OSError):
+                return
+            if result[0] == "stopped":
+                return
+            _, key, episode, written, filled, shape = result
+            self._features.setdefault(
+                key,
+                {
+                    "dtype": "video",
+                    "shape": list(shape),
+                    "names": ["height", "width", "channel"],
+                    "info": {"video.fps": self.fps, "video.codec": self.codec},
+                },
+            )
+            if filled:
+                logger.info(f"Episode {episode} {key}: filled {filled} of {written} video frames")
+
+    # -- metadata ----------------------------------------------------------
+
+    def _load_meta(self) -> Dict[str, Any]:
+        meta = self.root / "meta"
+        info: Dict[str, Any] = {}
+        if (meta / "info.json").exists():
+            info = json.loads((meta / "info.json").read_text())
+        self._tasks: List[str] = [r["task"] for r in _read_jsonl(meta / "tasks.jsonl")]
+        self._episodes: List[Dict[str, Any]] = _read_jsonl(meta / "episodes.jsonl")
+        return info
+
+    def _task_index(self, task: str) -> int:
+        if task not in self._tasks:
+            self._tasks.append(task)
+        return self._tasks.index(task)
+
+    def _write_meta(self) -> None:
+        meta = self.root / "meta"
+        tasks = [{"task_index": i, "task": task} for i, task in enumerate(self._tasks)]
+        _write_atomic(meta / "tasks.jsonl", "".join(json.dumps(t) + "\n" for t in tasks))
+        _write_atomic(meta / "episodes.jsonl", "".join(json.dumps(e) + "\n" for e in self._episodes))
+        self._write_info()
+
+    def _write_info(self) -> None:
+        episodes = len(self._episodes)
+        video_keys = [k for k, f in self._features.items() if f.get("dtype") == "video"]
+        features = dict(self._features)
+        for name, dtype in (("timestamp", "float32"), ("frame_index", "int64"), ("episode_index", "int64"),
+                            ("index", "int64"), ("task_index", "int64")):
+            features[name] = {"dtype": dtype, "shape": [1], "names": None}
+        info = {
+            "codebase_version": CODEBASE_VERSION,
+            "robot_type": self.robot_type,
+            "total_episodes": episodes,
+            "total_frames": self._total_frames,
+            "total_tasks": len(self._tasks),
+            "total_videos": episodes * len(video_keys),
+            "total_chunks": -(-episodes // self.chunks_size),
+            "chunks_size": self.chunks_size,
+            "fps": self.fps,
+            "splits": {"train": f"0:{episodes}"},
+            "data_path": DATA_PATH,
+            "video_path": VIDEO_PATH if video_keys else None,
+            "features": features,
+        }
+        _write_atomic(self.root / "meta" / "info.json", json.dumps(info, indent=2))
+
+
+def _video_worker(frames: Any, results: Any, root: str, fps: float, codec: str, chunks_size: int) -> None:
+    """Encoder process: one cv2.VideoWriter per (camera, episode)."""
+    import cv2
+
+    writers: Dict[Tuple[str, int], List[Any]] = {}  # key -> [writer, next_index, last_frame, filled, shape]
+    fourcc = cv2.VideoWriter_fourcc(*codec)
+
+    def finish(key: str, episode: int, length: int) -> None:
+        writer, next_index, last, filled, shape = writers.pop((key, episode))
+        while next_index < length:
+            writer.write(last)
+            next_index += 1
+            filled += 1
+        writer.release()
+        results.put(("done", key, episode, next_index, filled, shape))
+
+    while True:
+        msg = frames.get()
+        if msg[0] == "frame":
+            _, camera, episode, index, image = msg
+            key = f"observation.images.{camera}"
+            entry = writers.get((key, episode))
+            if entry is None:
+                path = Path(root) / VIDEO_PATH.format(
+                    episode_chunk=episode // chunks_size, video_key=key, episode_index=episode
+                )
+                path.parent.mkdir(parents=True, exist_ok=True)
+                height, width = image.shape[:2]
+                writer = cv2.VideoWriter(str(path), fourcc, fps, (width, height))
+                # Starting at 0 pads a dropped first frame with the first one received.
+                entry = writers[(key, episode)] = [writer, 0, image, 0, image.shape]
+            writer, next_index, last = entry[0], entry[1], entry[2]
+            # Frames dropped by the producer: repeat the last one so frame N lines up with row N.
+            while next_index < index:
+                writer.write(last)
+                next_index += 1
+                entry[3] += 1
+            writer.write(image)
+            entry[1] = index + 1
+            entry[2] = image
+        elif msg[0] == "end":
+            _, episode, length = msg
+            for key, ep in [k for k in writers if k[1] == episode]:
+                finish(key, ep, length)
+        elif msg[0] == "stop":
+            for key, ep in list(writers):
+                finish(key, ep, writers[(key, ep)][1])
+            results.put(("stopped",))
+            return
+
+
+def _empty_rows() -> Dict[str, List[Any]]:
+    return {"observation.state": [], "action": [], "frame_index": []}
+
+
+def _read_jsonl(path: Path) -> List[Dict[str, Any]]:
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text)
+    tmp.replace(path)
@@ -1,18 +1,116 @@
 from __future__ import annotations
 
-from typing import Optional, Tuple, Union
+import logging
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
 
+from autonomy.metrics import REGISTRY, MetricsRegistry
 from autonomy.planner import Planner
 from autonomy.robot_interface import RobotInterface
 from autonomy.sim_robot import SimRobot
 from autonomy.types import Goal, ObjClass, PlanStep, WorldState
 
+logger = logging.getLogger(__name__)
+
+# Seconds per action on real hardware; generous enough for a slow, blended motion.
+DEFAULT_STEP_DEADLINES_S: Dict[str, float] = {
+    "SEARCH": 20.0,
+    "NAVIGATE": 10.0,
+    "GRASP": 8.0,
+    "PLACE_IN_BIN": 12.0,
+    "VERIFY": 5.0,
+}
+
+# Error prefix per action, matching the ``<prefix>_failed:<target>`` strings.
+_ERROR_PREFIX = {
+    "SEARCH": "search",
+    "NAVIGATE": "navigate",
+    "GRASP": "grasp",
+    "PLACE_IN_BIN": "place",
+    "VERIFY": "verify",
+}
+
+
+def parse_deadlines(specs: Iterable[str], base: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+    """``GRASP=5`` overrides on top of ``base``; ``GRASP=0`` removes that action's deadline."""
+    deadlines = dict(DEFAULT_STEP_DEADLINES_S if base is None else base)
+    for spec in specs:
+        action, sep, seconds = spec.partition("=")
+        action = action.strip().upper()
+        if not sep or action not in _ERROR_PREFIX:
+            raise ValueError(f"expected one of {', '.join(_ERROR_PREFIX)} as ACTION=SECONDS, got {spec!r}")
+        if float(seconds) > 0:
+            deadlines[action] = float(seconds)
+        else:
+            deadlines.pop(action, None)
+    return deadlines
+
+
+class _Job:
+    __slots__ = ("fn", "done", "result", "error")
+
+    def __init__(self, fn: Callable[[], Tuple[bool, Optional[str]]]) -> None:
+        self.fn = fn
+        self.done = threading.Event()
+        self.result: Tuple[bool, Optional[str]] = (False, None)
+        self.error: Optional[BaseException] = None
+
+
+class _StepWorker:
+    """Daemon thread that runs submitted steps one at a time."""
+
+    def __init__(self) -> None:
+        self._jobs: queue.Queue = queue.Queue()
+        self.thread = threading.Thread(target=self._run, name="step-worker", daemon=True)
+        self.thread.start()
+
+    def submit(self, job: _Job) -> None:
+        self._jobs.put(job)
+
+    def stop(self) -> None:
+        # Picked up after the current job, so a wedged worker exits once it unblocks.
+        self._jobs.put(None)
+
+    def _run(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            try:
+                job.result = job.fn()
+            except BaseException as exc:
+                job.error = exc
+            finally:
+                job.done.set()
+
 
 class StepExecutor:
-    """Dispatch layer from symbolic step to robot actions."""
+    """Dispatch layer from symbolic step to robot actions.
+
+    Steps with a deadline run on a worker thread and fail as ``<action>_timeout``
+    when they miss it; ``fault`` is set while a step that ignored cancellation still runs.
+    """
 
-    def __init__(self, planner: Planner) -> None:
+    def __init__(
+        self,
+        planner: Planner,
+        deadlines: Optional[Dict[str, float]] = None,
+        cancel_grace_s: float = 1.0,
+        registry: MetricsRegistry = REGISTRY,
+    ) -> None:
         self._planner = planner
+        self.deadlines = dict(deadlines) if deadlines else {}
+        self.cancel_grace_s = cancel_grace_s
+        self.timeouts = 0
+        self.abandoned_steps = 0
+        # Non-retryable: the robot may still be moving under an abandoned step.
+        self.fault: Optional[str] = None
+        self._abandoned: Optional[_Job] = None
+        self._worker: Optional[_StepWorker] = None
+        self._timeouts = registry.counter(
+            "autonomy_step_timeouts_total", "Steps that missed their deadline", ["action"]
+        )
 
     def run_step(
         self,
@@ -20,6 +118,79 @@ class StepExecutor:
         robot: Union[SimRobot, RobotInterface],
         goal: Goal,
         state: WorldState,
+    ) -> Tuple[bool, Optional[str]]:
+        if self._abandoned is not None:
+            if not self._abandoned.done.is_set():
+                return False, self.fault
+            self._abandoned = None
+            self.fault = None
+        deadline = self.deadlines.get(step.action)
+        if deadline is None:
+            return self._dispatch(step, robot, goal)
+        return self._run_supervised(step, robot, goal, deadline)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"timeouts": self.timeouts, "abandoned_steps": self.abandoned_steps}
+
+    def close(self) -> None:
+        if self._worker is not None:
+            self._worker.stop()
+            self._worker = None
+
+    def _run_supervised(
+        self,
+        step: PlanStep,
+        robot: Union[SimRobot, RobotInterface],
+        goal: Goal,
+        deadline: float,
+    ) -> Tuple[bool, Optional[str]]:
+        cancel = threading.Event()
+        cancellable = hasattr(robot, "should_stop")
+        if cancellable:
+            robot.should_stop = cancel.is_set
+
+        def run() -> Tuple[bool, Optional[str]]:
+            # Cleared by the worker, so the check stays bound for as long as the step actually runs.
+            try:
+                return self._dispatch(step, robot, goal)
+            finally:
+                if cancellable:
+                    robot.should_stop = None
+
+        if self._worker is None:
+            self._worker = _StepWorker()
+        job = _Job(run)
+        self._worker.submit(job)
+        if not job.done.wait(deadline):
+            cancel.set()
+            self.timeouts += 1
+            self._timeouts.labels(step.action).inc()
+            if not job.done.wait(self.cancel_grace_s):
+                logger.warning(
+                    f"{step.label()} ignored cancellation {self.cancel_grace_s:.1f}s after its "
+                    f"{deadline:.1f}s deadline; refusing further steps until it returns"
+                )
+                self._abandoned = job
+                self.abandoned_steps += 1
+                self.fault = f"robot_unresponsive:{step.label()}"
+            return False, self._timeout_error(step, goal)
+        if job.error is not None:
+            raise job.error
+        return job.result
+
+    def _timeout_error(self, step: PlanStep, goal: Goal) -> str:
+        prefix = _ERROR_PREFIX.get(step.action, step.action.lower())
+        if step.action == "SEARCH":
+            return f"{prefix}_timeout:{self._resolve_search_target(step, goal).value}"
+        if step.action == "VERIFY" or not step.target_id:
+            return f"{prefix}_timeout"
+        return f"{prefix}_timeout:{step.target_id}"
+
+    def _dispatch(
+        self,
+        step: PlanStep,
+        robot: Union[SimRobot, RobotInterface],
+        goal: Goal,
     ) -> Tuple[bool, Optional[str]]:
         action = step.action
         if action == "SEARCH":
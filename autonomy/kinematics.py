@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Joints that determine the gripper position: base yaw, shoulder, elbow, wrist pitch.
+IK_JOINTS = 4
+
+ArrayLike = Union[Sequence[float], Sequence[Sequence[float]], np.ndarray]
+
+
+@dataclass(frozen=True)
+class ArmKinematics:
+    """Approximate SO-ARM100 geometry (meters, radians) in the arm base frame.
+
+    Pitch joints are cumulative: the upper arm elevation is ``-q1``, the
+    forearm ``-q1 - q2`` and the gripper ``-q1 - q2 - q3``.
+    """
+
+    base_height: float = 0.12
+    upper_arm: float = 0.116
+    forearm: float = 0.135
+    wrist_to_tip: float = 0.15
+    lower_limits: Tuple[float, ...] = (-2.0, -1.8, -0.2, -1.8)
+    upper_limits: Tuple[float, ...] = (2.0, 1.8, 3.0, 1.8)
+
+    def forward(self, q: np.ndarray) -> np.ndarray:
+        """Gripper tip positions for joint batch ``q`` of shape (N, >=4)."""
+        yaw, _, r, z = self._planar(q)
+        return np.stack([r * np.cos(yaw), r * np.sin(yaw), z], axis=-1)
+
+    def jacobian(self, q: np.ndarray) -> np.ndarray:
+        """Position Jacobian of shape (N, 3, 4) for the IK joints."""
+        yaw, elev, r, z = self._planar(q)
+        lengths = (self.upper_arm, self.forearm, self.wrist_to_tip)
+        sin_terms = [length * np.sin(e) for length, e in zip(lengths, elev)]
+        cos_terms = [length * np.cos(e) for length, e in zip(lengths, elev)]
+
+        c, s = np.cos(yaw), np.sin(yaw)
+        jac = np.zeros((q.shape[0], 3, IK_JOINTS))
+        jac[:, 0, 0] = -r * s
+        jac[:, 1, 0] = r * c
+        for j in range(1, IK_JOINTS):
+            # Joint j rotates every link from j-1 outward.
+            dr = sum(sin_terms[j - 1 :])
+            dz = -sum(cos_terms[j - 1 :])
+            jac[:, 0, j] = dr * c
+            jac[:, 1, j] = dr * s
+            jac[:, 2, j] = dz
+        return jac
+
+    def _planar(self, q: np.ndarray):
+        e1 = -q[:, 1]
+        e2 = e1 - q[:, 2]
+        e3 = e2 - q[:, 3]
+        r = self.upper_arm * np.cos(e1) + self.forearm * np.cos(e2) + self.wrist_to_tip * np.cos(e3)
+        z = (
+            self.base_height
+            + self.upper_arm * np.sin(e1)
+            + self.forearm * np.sin(e2)
+            + self.wrist_to_tip * np.sin(e3)
+        )
+        return q[:, 0], (e1, e2, e3), r, z
+
+
+@dataclass
+class IKResult:
+    joints: np.ndarray  # (N, 4) yaw, shoulder, elbow, wrist pitch
+    converged: np.ndarray  # (N,) bool
+    error: np.ndarray  # (N,) residual distance in meters
+    iterations: np.ndarray  # (N,) iterations used per target
+
+
+@dataclass
+class IKStats:
+    calls: int = 0
+    targets: int = 0
+    converged: int = 0
+    iterations_total: int = 0
+    iterations_max: int = 0
+    warm_starts: int = 0
+    solve_ms_total: float = 0.0
+    last_solve_ms: float = 0.0
+
+    def to_dict(self) -> dict:
+        out = asdict(self)
+        out["mean_iterations"] = round(self.iterations_total / max(self.targets, 1), 2)
+        out["mean_solve_ms"] = round(self.solve_ms_total / max(self.calls, 1), 3)
+        return out
+
+
+class IKSolver:
+    """Batched damped-least-squares position IK for the SO-ARM100.
+
+    Every iteration solves all still-active targets at once with a single
+    batched 3x3 linear solve, so N targets cost about as much as one in
+    Python overhead.
+    """
+
+    HOME = (0.0, -1.2, 1.4, 0.3)
+
+    def __init__(
+        self,
+        kinematics: Optional[ArmKinematics] = None,
+        damping: float = 0.02,
+        tolerance: float = 1e-3,
+        max_iterations: int = 100,
+        max_step: float = 0.3,
+        cache: Optional[IKWorkspaceCache] = None,
+    ) -> None:
+        self.kinematics = kinematics or ArmKinematics()
+        self.damping = damping
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.max_step = max_step
+        self.cache = cache
+        self.stats = IKStats()
+        self._lower = np.asarray(self.kinematics.lower_limits)
+        self._upper = np.asarray(self.kinematics.upper_limits)
+
+    def solve(self, targets: ArrayLike, seed: Optional[ArrayLike] = None) -> IKResult:
+        """Solve for targets of shape (N, 3) (or a single (3,) target).
+
+        Seeds come from ``seed`` if given, else the workspace cache, else HOME.
+        """
+        start = time.perf_counter()
+        goal = np.atleast_2d(np.asarray(targets, dtype=float))
+        n = goal.shape[0]
+
+        if seed is not None:
+            q = np.broadcast_to(np.atleast_2d(np.asarray(seed, dtype=float))[:, :IK_JOINTS], (n, IK_JOINTS)).copy()
+        elif self.cache is not None:
+            q, hits = self.cache.warm_start(goal)
+            self.stats.warm_starts += int(hits.sum())
+        else:
+            q = np.tile(np.asarray(self.HOME), (n, 1))
+
+        iterations = np.zeros(n, dtype=np.int32)
+        error = np.linalg.norm(goal - self.kinematics.forward(q), axis=1)
+        active = error > self.tolerance
+        lam2 = self.damping**2
+        eye = np.eye(3)
+        for _ in range(self.max_iterations):
+            if not active.any():
+                break
+            idx = np.flatnonzero(active)
+            qa = q[idx]
+            residual = goal[idx] - self.kinematics.forward(qa)
+            jac = self.kinematics.jacobian(qa)
+            jjt = jac @ jac.transpose(0, 2, 1) + lam2 * eye
+            step = np.einsum("nji,nj->ni", jac, np.linalg.solve(jjt, residual[..., None])[..., 0])
+            # Cap the joint step so far-away targets do not overshoot.
+            norm = np.linalg.norm(step, axis=1, keepdims=True)
+            step *= np.minimum(1.0, self.max_step / np.maximum(norm, 1e-12))
+            q[idx] = np.clip(qa + step, self._lower, self._upper)
+            iterations[idx] += 1
+            error[idx] = np.linalg.norm(goal[idx] - self.kinematics.forward(q[idx]), axis=1)
+            # Stop targets that converged or stalled against a limit / the reach boundary.
+            progress = np.linalg.norm(step, axis=1) > 1e-7
+            active[idx] = (error[idx] > self.tolerance) & progress
+
+        converged = error <= self.tolerance
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        stats = self.stats
+        stats.calls += 1
+        stats.targets += n
+        stats.converged += int(converged.sum())
+        stats.iterations_total += int(iterations.sum())
+        stats.iterations_max = max(stats.iterations_max, int(iterations.max(initial=0)))
+        stats.solve_ms_total += elapsed_ms
+        stats.last_solve_ms = elapsed_ms
+        return IKResult(joints=q, converged=converged, error=error, iterations=iterations)
+
+
+@dataclass
+class IKWorkspaceCache:
+    """Uniform grid of precomputed IK solutions used as warm starts."""
+
+    lower: Tuple[float, float, float] = (-0.4, -0.4, -0.1)
+    upper: Tuple[float, float, float] = (0.4, 0.4, 0.35)
+    resolution: float = 0.02
+    geometry: Tuple[float, ...] = ()
+    joints: np.ndarray = field(default_factory=lambda: np.zeros((0, 0, 0, IK_JOINTS)), repr=False)
+    reachable: np.ndarray = field(default_factory=lambda: np.zeros((0, 0, 0), dtype=bool), repr=False)
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        span = np.asarray(self.upper) - np.asarray(self.lower)
+        return tuple(int(v) for v in np.round(span / self.resolution).astype(int) + 1)
+
+    def grid_points(self) -> np.ndarray:
+        axes = [
+            lo + self.resolution * np.arange(count)
+            for lo, count in zip(self.lower, self.shape)
+        ]
+        mesh = np.meshgrid(*axes, indexing="ij")
+        return np.stack(mesh, axis=-1).reshape(-1, 3)
+
+    def build(self, solver: IKSolver) -> None:
+        """Solve every grid cell, keeping the best of a few seed configurations."""
+        points = self.grid_points()
+        seeds = [IKSolver.HOME, (0.0, -0.4, 0.6, 0.9), (0.0, 0.4, 1.8, 0.2)]
+        best_q = np.zeros((points.shape[0], IK_JOINTS))
+        best_err = np.full(points.shape[0], np.inf)
+        for seed in seeds:
+            q0 = np.tile(np.asarray(seed, dtype=float), (points.shape[0], 1))
+            q0[:, 0] = np.arctan2(points[:, 1], points[:, 0])
+            result = solver.solve(points, seed=q0)
+            better = result.error < best_err
+            best_q[better] = result.joints[better]
+            best_err[better] = result.error[better]
+        self.geometry = _geometry_key(solver.kinematics)
+        self.joints = best_q.reshape(*self.shape, IK_JOINTS)
+        self.reachable = (best_err <= solver.tolerance).reshape(self.shape)
+
+    def warm_start(self, targets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Nearest-cell seeds for ``targets`` plus a mask of in-bounds reachable hits."""
+        cell = np.round((targets - np.asarray(self.lower)) / self.resolution).astype(int)
+        inside = np.all((cell >= 0) & (cell < np.asarray(self.shape)), axis=1)
+        cell = np.clip(cell, 0, np.asarray(self.shape) - 1)
+        seeds = self.joints[cell[:, 0], cell[:, 1], cell[:, 2]].copy()
+        hits = inside & self.reachable[cell[:, 0], cell[:, 1], cell[:, 2]]
+        seeds[~hits] = IKSolver.HOME
+        return seeds, hits
+
+    def same_grid(self, other: IKWorkspaceCache) -> bool:
+        return (
+            np.allclose(self.lower, other.lower)
+            and np.allclose(self.upper, other.upper)
+            and np.isclose(self.resolution, other.resolution)
+        )
+
+    def save(self, path: Union[str, Path]) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as fh:
+            np.savez_compressed(
+                fh,
+                lower=np.asarray(self.lower),
+                upper=np.asarray(self.upper),
+                resolution=np.asarray(self.resolution),
+                joints=self.joints,
+                reachable=self.reachable,
+                geometry=np.asarray(self.geometry),
+            )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> IKWorkspaceCache:
+        with np.load(Path(path)) as data:
+            return cls(
+                lower=tuple(float(v) for v in data["lower"]),
+                upper=tuple(float(v) for v in data["upper"]),
+                resolution=float(data["resolution"]),
+                geometry=tuple(float(v) for v in data["geometry"]),
+                joints=data["joints"],
+                reachable=data["reachable"],
+            )
+
+    @classmethod
+    def load_or_build(cls, path: Union[str, Path], solver: IKSolver, **grid) -> IKWorkspaceCache:
+        """Load a persisted cache, rebuilding it if missing or built for other geometry or grid."""
+        path = Path(path)
+        wanted = cls(**grid)
+        if path.exists():
+            cache = cls.load(path)
+            if cache.geometry == _geometry_key(solver.kinematics) and cache.same_grid(wanted):
+                logger.info(f"Loaded IK workspace cache from {path}")
+                return cache
+            logger.info(f"IK workspace cache at {path} is stale, rebuilding")
+
+        cache = wanted
+        start = time.perf_counter()
+        cache.build(solver)
+        cache.save(path)
+        logger.info(
+            f"Built IK workspace cache {cache.shape} in {time.perf_counter() - start:.1f}s "
+            f"({int(cache.reachable.sum())} reachable cells) -> {path}"
+        )
+        return cache
+
+
+def _geometry_key(kinematics: ArmKinematics) -> Tuple[float, ...]:
+    return (
+        kinematics.base_height,
+        kinematics.upper_arm,
+        kinematics.forearm,
+        kinematics.wrist_to_tip,
+        *kinematics.lower_limits,
+        *kinematics.upper_limits,
+    )
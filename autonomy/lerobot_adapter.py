@@ -1,12 +1,32 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
 
+import numpy as np
+
+from autonomy.kinematics import IKSolver
+from autonomy.trajectory import (
+    GRIPPER_CLOSED,
+    GRIPPER_INDEX,
+    GRIPPER_OPEN,
+    NUM_JOINTS,
+    JointLimits,
+    StreamStats,
+    TrajectoryPlanner,
+    TrajectoryStreamer,
+)
 from autonomy.types import DetectedObject, Goal, ObjClass
 
 logger = logging.getLogger(__name__)
 
+# Joint-space poses in radians (5 arm joints + gripper).
+HOME_POSE = (0.0, -1.2, 1.4, 0.3, 0.0, GRIPPER_OPEN)
+PRE_GRASP_POSE = (0.0, -0.4, 0.6, 0.9, 0.0, GRIPPER_OPEN)
+BIN_POSE = (1.2, -0.6, 0.8, 0.6, 0.0, GRIPPER_CLOSED)
+BIN_DROP_POSE = (1.2, -0.3, 0.8, 0.9, 0.0, GRIPPER_CLOSED)
+SEARCH_SWEEP_YAWS = (-0.9, 0.9, 0.0)
+
 
 class LeRobotAdapter:
     """Hardware adapter for SO-ARM100 via HuggingFace LeRobot SDK."""
@@ -16,63 +36,119 @@ class LeRobotAdapter:
         robot_type: str = "so100_follower",
         port: str = "/dev/ttyACM0",
         camera_config: Optional[Dict[str, int]] = None,
+        control_hz: float = 50.0,
+        profile: str = "trapezoidal",
+        limits: Optional[JointLimits] = None,
+        blend_s: float = 0.15,
+        ik_solver: Optional[IKSolver] = None,
+        pre_grasp_height: float = 0.05,
     ) -> None:
         self.robot_type = robot_type
         self.port = port
         self.camera_config = camera_config or {"wrist": 0, "front": 2}
         self.held_object_id: Optional[str] = None
+        self.joint_positions: List[float] = list(HOME_POSE)
+        self.joint_velocities: List[float] = [0.0] * NUM_JOINTS
+        # Per-target joint goals from IK; targets without an entry use PRE_GRASP_POSE.
+        self.target_poses: Dict[str, Sequence[float]] = {}
+        self.ik_solver = ik_solver or IKSolver()
+        self.pre_grasp_height = pre_grasp_height
+        self.last_stream: Optional[StreamStats] = None
+        self.command_observer: Optional[Callable[[List[float], np.ndarray], None]] = None
+        self.should_stop: Optional[Callable[[], bool]] = None
+        self.blend_s = blend_s
+        self._trajectory_planner = TrajectoryPlanner(limits, rate_hz=control_hz, profile=profile)
+        self._streamer = TrajectoryStreamer(self._send_joint_command)
         self._robot: Any = None  # Lazy-loaded LeRobot instance
+        self._torch: Any = None
         self._perception: Any = None
 
     def _ensure_robot(self) -> None:
         if self._robot is not None:
             return
         try:
+            import torch
             from lerobot.common.robot_devices.robots.factory import make_robot
+            self._torch = torch
             self._robot = make_robot(self.robot_type, robot_kwargs={"port": self.port})
             self._robot.connect()
             logger.info(f"Connected to {self.robot_type} on {self.port}")
+            self._read_joint_state()
         except ImportError:
             raise ImportError("lerobot is required: pip install lerobot")
 
     def reset(self, seed: Optional[int] = None) -> None:
         self._ensure_robot()
         self.held_object_id = None
-        # Move to home position
-        # self._robot.move_to_home()
+        self._move_through([HOME_POSE])
         logger.info("Robot reset to home position")
 
     def observe(self) -> List[DetectedObject]:
         # Observation comes from perception provider, not from robot directly
         return []
 
+    def update_world(self, objects: Iterable[DetectedObject]) -> None:
+        """Refresh IK pre-grasp poses for tracked objects (base frame, meters).
+
+        All targets are solved in one batched call, warm-started from the
+        workspace cache when the solver has one.
+        """
+        targets = [obj for obj in objects if obj.cls != ObjClass.BIN and not obj.in_bin]
+        if not targets:
+            return
+        points = np.array([obj.position for obj in targets], dtype=float)
+        points[:, 2] += self.pre_grasp_height
+        result = self.ik_solver.solve(points)
+        for obj, joints, ok in zip(targets, result.joints, result.converged):
+            if not ok:
+                self.target_poses.pop(obj.obj_id, None)
+                continue
+            pose = list(PRE_GRASP_POSE)
+            pose[: joints.shape[0]] = joints.tolist()
+            self.target_poses[obj.obj_id] = pose
+
     def search(self, target_class: ObjClass) -> bool:
         self._ensure_robot()
         logger.info(f"Executing search sweep for {target_class.value}")
-        # Execute a scanning trajectory
-        # TODO: Implement search trajectory via LeRobot motor commands
-        return True
+        waypoints = []
+        for yaw in SEARCH_SWEEP_YAWS:
+            pose = list(HOME_POSE)
+            pose[0] = yaw
+            pose[GRIPPER_INDEX] = self.joint_positions[GRIPPER_INDEX]
+            waypoints.append(pose)
+        return self._move_through(waypoints)
 
     def navigate(self, target_id: str) -> bool:
         self._ensure_robot()
         logger.info(f"Navigating to {target_id}")
-        # Move arm to pre-grasp position
-        # TODO: Implement via inverse kinematics or learned trajectory
-        return True
+        if target_id.startswith(ObjClass.BIN.value):
+            goal = list(BIN_POSE)
+        else:
+            goal = list(self.target_poses.get(target_id, PRE_GRASP_POSE))
+        goal[GRIPPER_INDEX] = self.joint_positions[GRIPPER_INDEX]
+        return self._move_through([goal])
 
     def grasp(self, target_id: str) -> bool:
         self._ensure_robot()
         logger.info(f"Grasping {target_id}")
-        # Close gripper
-        # TODO: Implement gripper close + verify via force/current sensing
+        closed = list(self.joint_positions)
+        closed[GRIPPER_INDEX] = GRIPPER_CLOSED
+        # TODO: Verify grasp via force/current sensing
+        if not self._move_through([closed]):
+            return False
         self.held_object_id = target_id
         return True
 
     def place_in_bin(self, target_id: str, bin_id: str) -> bool:
         self._ensure_robot()
         logger.info(f"Placing {target_id} in {bin_id}")
-        # Open gripper at bin position
-        # TODO: Navigate to bin, open gripper
+        released = list(BIN_DROP_POSE)
+        released[GRIPPER_INDEX] = GRIPPER_OPEN
+        retreat = list(BIN_POSE)
+        retreat[GRIPPER_INDEX] = GRIPPER_OPEN
+        # Unblended: the gripper must not open before the drop pose, nor retreat before it is open.
+        if not self._move_through([BIN_DROP_POSE, released, retreat], blend_s=0.0):
+            return False
         self.held_object_id = None
         return True
 
@@ -85,6 +161,44 @@ class LeRobotAdapter:
         # TODO: Use camera perception to verify
         return True
 
+    def _move_through(self, waypoints: Sequence[Sequence[float]], blend_s: Optional[float] = None) -> bool:
+        should_stop = self.should_stop
+        # Start from the measured pose, not the last command (the arm lags, or was moved by hand).
+        self._read_joint_state()
+        trajectory = self._trajectory_planner.plan_through(
+            [self.joint_positions, *waypoints], blend_s=self.blend_s if blend_s is None else blend_s
+        )
+        self.last_stream = self._streamer.stream(trajectory, should_stop=should_stop)
+        self.joint_velocities = trajectory.velocity_after(self.last_stream.points)
+        if self.last_stream.overruns:
+            logger.warning(
+                f"Trajectory streaming overran {self.last_stream.overruns} "
+                f"of {self.last_stream.points} control periods"
+            )
+        return not self.last_stream.cancelled
+
+    def _read_joint_state(self) -> None:
+        observation = self._robot.capture_observation()
+        state = np.radians(np.asarray(observation["observation.state"], dtype=float))
+        self.joint_positions = state[:NUM_JOINTS].tolist()
+
+    def _read_motor_positions(self) -> List[float]:
+        # Bus read only: capture_observation() also grabs camera frames, too slow for every control point.
+        arms = getattr(self._robot, "follower_arms", None)
+        if not arms:
+            return list(self.joint_positions)
+        degrees = np.concatenate([np.asarray(arm.read("Present_Position"), dtype=float) for arm in arms.values()])
+        return np.radians(degrees)[:NUM_JOINTS].tolist()
+
+    def _send_joint_command(self, positions: np.ndarray) -> None:
+        # LeRobot SO-100 motors take joint targets in degrees.
+        action = self._torch.as_tensor(np.degrees(positions), dtype=self._torch.float32)
+        if self.command_observer is not None:
+            # Observers get the measured state the command is issued from, not the previous command.
+            self.command_observer(self._read_motor_positions(), positions)
+        self._robot.send_action(action)
+        self.joint_positions = positions.tolist()
+
     def disconnect(self) -> None:
         if self._robot is not None:
             self._robot.disconnect()
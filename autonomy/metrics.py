@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+# Seconds; spans sub-millisecond control work up to multi-second motions.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+class _CounterChild:
+    __slots__ = ("_value", "_lock")
+
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+
+class _HistogramChild:
+    __slots__ = ("_bounds", "_counts", "_sum", "_lock")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        self._bounds = bounds
+        # One slot per finite bucket plus +Inf; cumulated only when exposed.
+        self._counts = [0] * (len(bounds) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        idx = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[idx] += 1
+            self._sum += value
+
+    def snapshot(self) -> Tuple[List[int], float]:
+        with self._lock:
+            return list(self._counts), self._sum
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[LabelValues, object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str, **kwargs: str):
+        if kwargs:
+            values = tuple(str(kwargs[name]) for name in self.labelnames)
+        key = tuple(str(v) for v in values)
+        if len(key) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {key}")
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._children[key] = self._new_child()
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _default(self):
+        if self.labelnames:
+            raise ValueError(f"{self.name} has labels {self.labelnames}; use .labels(...)")
+        return self.labels()
+
+    def _items(self) -> List[Tuple[LabelValues, object]]:
+        with self._lock:
+            return list(self._children.items())
+
+    def expose(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+
+    def value(self, *values: str) -> float:
+        child = self._children.get(tuple(values))
+        return child.value if child is not None else 0.0
+
+    def expose(self) -> List[str]:
+        return [f"{self.name}{_labels(self.labelnames, key)} {_num(child.value)}" for key, child in self._items()]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(b for b in buckets if not math.isinf(b)))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._default().observe(value)
+
+    def expose(self) -> List[str]:
+        lines: List[str] = []
+        for key, child in self._items():
+            counts, total = child.snapshot()
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                le = "+Inf" if math.isinf(bound) else _num(bound)
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames + ('le',), key + (le,))} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_num(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named collectors rendered in the Prometheus text exposition format.
+
+    ``counter``/``histogram`` return the existing collector when called
+    again with the same name, so several agents or sinks can share one.
+    Collectors are updated incrementally; a scrape only formats them.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, help_text, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram, name, help_text, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def with_labels(self, **labels: str) -> LabeledRegistry:
+        """A view that registers every collector here with ``labels`` prepended."""
+        return LabeledRegistry(self, labels)
+
+    def exposition(self) -> str:
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.expose())
+        return "\n".join(lines) + "\n"
+
+    def _register(self, cls, name: str, help_text: str, labelnames: Sequence[str], **extra):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help_text, labelnames, **extra)
+        if not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+            raise ValueError(f"Metric {name} already registered with a different type or labels")
+        return metric
+
+
+class _BoundMetric:
+    """A collector with its leading label values fixed."""
+
+    def __init__(self, metric: _Metric, values: LabelValues) -> None:
+        self.metric = metric
+        self.values = values
+
+    def labels(self, *values: str):
+        return self.metric.labels(*self.values, *values)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def value(self, *values: str) -> float:
+        return self.metric.value(*self.values, *values)
+
+
+class LabeledRegistry(MetricsRegistry):
+    """Registers into ``parent`` with constant labels, e.g. one ``robot`` per fleet cell.
+
+    Every view of a parent must use the same label names, since a collector's
+    label set is fixed by whoever registers it first.
+    """
+
+    def __init__(self, parent: MetricsRegistry, labels: Dict[str, str]) -> None:
+        super().__init__()
+        self.parent = parent
+        self.labelnames = tuple(labels)
+        self.labelvalues = tuple(str(v) for v in labels.values())
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> _BoundMetric:
+        metric = self.parent.counter(name, help_text, self.labelnames + tuple(labelnames))
+        return _BoundMetric(metric, self.labelvalues)
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> _BoundMetric:
+        metric = self.parent.histogram(name, help_text, self.labelnames + tuple(labelnames), buckets=buckets)
+        return _BoundMetric(metric, self.labelvalues)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self.parent.get(name)
+
+    def exposition(self) -> str:
+        return self.parent.exposition()
+
+
+# Process-wide default registry served by TelemetryHttpFeed at /metrics.
+REGISTRY = MetricsRegistry()
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _num(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
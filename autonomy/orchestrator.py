@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from autonomy.agent import Track1Agent
+from autonomy.types import Goal, TelemetryFrame
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Cell:
+    """One robot + agent pair and its progress."""
+
+    robot_id: str
+    agent: Track1Agent
+    goal: Goal
+    episodes: int = 1
+    max_ticks: int = 80
+    # Called before every episode, including the first, with the episode index (e.g. a seeded robot.reset).
+    reset: Optional[Callable[[int], None]] = None
+    completed: int = 0
+    successes: int = 0
+    frames: int = 0
+    last_frame: float = field(default_factory=time.monotonic)
+    running: bool = False
+    error: Optional[str] = None
+
+
+class _CellSink:
+    """Publishes a cell's frames under ``/robots/<id>/`` and records its heartbeat."""
+
+    def __init__(self, orchestrator: FleetOrchestrator, robot_id: str) -> None:
+        self.orchestrator = orchestrator
+        self.robot_id = robot_id
+
+    def emit(self, frame: TelemetryFrame) -> None:
+        self.orchestrator._heartbeat(self.robot_id)
+        feed = self.orchestrator.feed
+        if feed is not None:
+            feed.update_frame(frame, robot_id=self.robot_id)
+
+
+class FleetOrchestrator:
+    """Runs several ``Track1Agent`` cells concurrently in one process.
+
+    Every cell runs its episodes on its own thread, so a cell blocked in a
+    slow step or a hung robot call never holds up the others. Shared
+    resources are built to be fair: ``SharedDetector`` serves cells
+    round-robin with one queued request each, and the telemetry feed keeps a
+    separate channel (``/robots/<id>/``) per cell. A cell that has not
+    emitted a frame for ``stall_s`` is reported as stalled in ``status()``.
+
+    Build each agent with ``telemetry_sink(robot_id)`` (alone or inside a
+    ``MultiSink``) and ``REGISTRY.with_labels(robot=robot_id)`` so /metrics
+    splits per cell, then ``add_cell`` it.
+    """
+
+    def __init__(self, feed: Any = None, stall_s: float = 10.0) -> None:
+        self.feed = feed
+        self.stall_s = stall_s
+        self.cells: Dict[str, Cell] = {}
+        self._threads: List[threading.Thread] = []
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def telemetry_sink(self, robot_id: str) -> _CellSink:
+        return _CellSink(self, robot_id)
+
+    def add_cell(
+        self,
+        robot_id: str,
+        agent: Track1Agent,
+        goal: Goal,
+        episodes: int = 1,
+        max_ticks: int = 80,
+        reset: Optional[Callable[[int], None]] = None,
+    ) -> Cell:
+        if robot_id in self.cells:
+            raise ValueError(f"duplicate robot id {robot_id!r}")
+        cell = Cell(robot_id=robot_id, agent=agent, goal=goal, episodes=episodes, max_ticks=max_ticks, reset=reset)
+        self.cells[robot_id] = cell
+        return cell
+
+    def start(self) -> None:
+        self._stop.clear()
+        for cell in self.cells.values():
+            thread = threading.Thread(target=self._run_cell, args=(cell,), name=f"cell-{cell.robot_id}", daemon=True)
+            cell.running = True
+            self._threads.append(thread)
+            thread.start()
+
+    def stop(self) -> None:
+        """Ask every cell to stop after its current episode."""
+        self._stop.set()
+
+    def join(
+        self,
+        timeout: Optional[float] = None,
+        on_status: Optional[Callable[[Dict[str, Dict[str, Any]]], None]] = None,
+        status_every_s: float = 5.0,
+    ) -> bool:
+        """Wait for all cells; returns False if ``timeout`` elapsed first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        next_status = time.monotonic() + status_every_s
+        while any(t.is_alive() for t in self._threads):
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                return False
+            if on_status is not None and now >= next_status:
+                on_status(self.status())
+                next_status = now + status_every_s
+            for thread in self._threads:
+                if thread.is_alive():
+                    thread.join(timeout=0.1)
+                    break
+        return True
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                robot_id: {
+                    "episodes": f"{cell.completed}/{cell.episodes}",
+                    "successes": cell.successes,
+                    "frames": cell.frames,
+                    "running": cell.running,
+                    "stalled": cell.running and now - cell.last_frame > self.stall_s,
+                    "since_frame_s": round(now - cell.last_frame, 2),
+                    "error": cell.error,
+                }
+                for robot_id, cell in self.cells.items()
+            }
+
+    def _heartbeat(self, robot_id: str) -> None:
+        cell = self.cells.get(robot_id)
+        if cell is None:
+            return
+        with self._lock:
+            cell.frames += 1
+            cell.last_frame = time.monotonic()
+
+    def _run_cell(self, cell: Cell) -> None:
+        try:
+            for idx in range(cell.episodes):
+                if self._stop.is_set():
+                    break
+                if cell.reset is not None:
+                    cell.reset(idx)
+                with self._lock:
+                    cell.last_frame = time.monotonic()
+                with cell.agent.run_episode(goal=cell.goal, max_ticks=cell.max_ticks) as result:
+                    success = result.metrics.success
+                with self._lock:
+                    cell.completed += 1
+                    cell.successes += int(success)
+        except Exception as exc:
+            # One failing cell must not take the fleet down.
+            logger.exception(f"Cell {cell.robot_id} failed")
+            cell.error = f"{type(exc).__name__}: {exc}"
+        finally:
+            cell.running = False
@@ -31,7 +31,8 @@ class PerceptionModule:
         state: WorldState,
         detections: Optional[Iterable[DetectedObject]] = None,
     ) -> WorldState:
-        if detections is None and self._provider is not None:
+        # Hardware backends return no detections from observe(); the provider supplies them.
+        if not detections and self._provider is not None:
             captured, metadata = self._provider.capture()
             detections = captured
             if "camera_frames" in metadata:
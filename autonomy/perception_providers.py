@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeout
 from typing import Any, Dict, List, Optional, Protocol, Tuple
 
 from autonomy.types import DetectedObject, ObjClass, Vec3
 
+logger = logging.getLogger(__name__)
+
 
 class PerceptionProvider(Protocol):
     """Protocol for pluggable perception backends."""
@@ -48,32 +55,43 @@ class YOLOWorldDetector:
             raise ImportError("ultralytics is required: pip install ultralytics>=8.1.0")
 
     def detect(self, frames: Dict[str, Any]) -> List[DetectedObject]:
+        return self.detect_batch([frames])[0]
+
+    def detect_batch(self, batch: List[Dict[str, Any]]) -> List[List[DetectedObject]]:
+        """Detections per camera-frame dict, from one ``predict`` call over all frames."""
         if self._model is None:
             self._load_model()
-        # Detect objects in each frame, merge results
-        detections: List[DetectedObject] = []
-        obj_counter: Dict[str, int] = {}
-        for cam_name, frame in frames.items():
-            if frame is None:
-                continue
-            results = self._model.predict(frame, conf=self._conf_threshold, verbose=False)
-            for r in results:
-                for box in r.boxes:
-                    cls_name = r.names[int(box.cls[0])]
-                    obj_cls = self._map_class(cls_name)
-                    count = obj_counter.get(cls_name, 0) + 1
-                    obj_counter[cls_name] = count
-                    # Derive rough position from bbox center (normalized)
-                    x1, y1, x2, y2 = box.xyxy[0].tolist()
-                    cx = (x1 + x2) / 2.0 / frame.shape[1]
-                    cy = (y1 + y2) / 2.0 / frame.shape[0]
-                    detections.append(DetectedObject(
-                        obj_id=f"{cls_name}_{count}",
-                        cls=obj_cls,
-                        position=(cx, cy, 0.5),  # z=0.5 default without depth
-                        confidence=float(box.conf[0]),
-                        visible=True,
-                    ))
+        images: List[Any] = []
+        owners: List[int] = []
+        for i, frames in enumerate(batch):
+            for frame in frames.values():
+                if frame is not None:
+                    images.append(frame)
+                    owners.append(i)
+        detections: List[List[DetectedObject]] = [[] for _ in batch]
+        if not images:
+            return detections
+        results = self._model.predict(images, conf=self._conf_threshold, verbose=False)
+        # Object ids are numbered per request, merged across its cameras.
+        counters: List[Dict[str, int]] = [{} for _ in batch]
+        for owner, frame, r in zip(owners, images, results):
+            obj_counter = counters[owner]
+            for box in r.boxes:
+                cls_name = r.names[int(box.cls[0])]
+                obj_cls = self._map_class(cls_name)
+                count = obj_counter.get(cls_name, 0) + 1
+                obj_counter[cls_name] = count
+                # Derive rough position from bbox center (normalized)
+                x1, y1, x2, y2 = box.xyxy[0].tolist()
+                cx = (x1 + x2) / 2.0 / frame.shape[1]
+                cy = (y1 + y2) / 2.0 / frame.shape[0]
+                detections[owner].append(DetectedObject(
+                    obj_id=f"{cls_name}_{count}",
+                    cls=obj_cls,
+                    position=(cx, cy, 0.5),  # z=0.5 default without depth
+                    confidence=float(box.conf[0]),
+                    visible=True,
+                ))
         return detections
 
     def _map_class(self, name: str) -> ObjClass:
@@ -84,6 +102,150 @@ class YOLOWorldDetector:
         return ObjClass.UNKNOWN
 
 
+class SharedDetector:
+    """One detector instance serving several robot cells, with batched inference.
+
+    ``client(cell_id)`` returns a drop-in ``detector`` for
+    ``CameraPerceptionProvider``. A worker thread collects requests for up to
+    ``max_wait_ms`` (or until every cell is waiting) and serves at most
+    ``max_batch`` of them per call, picking cells round-robin from where the
+    previous batch stopped. Each cell has at most one request queued, so a
+    newer request replaces an older one instead of piling up; a request not
+    served within ``timeout_s`` returns no detections rather than stalling its
+    cell. Detectors with ``detect_batch`` get one call per batch, others one
+    ``detect`` call per request.
+    """
+
+    def __init__(
+        self,
+        detector: Any,
+        max_batch: int = 8,
+        max_wait_ms: float = 5.0,
+        timeout_s: float = 2.0,
+    ) -> None:
+        self.detector = detector
+        self.max_batch = max(1, max_batch)
+        self.max_wait_s = max_wait_ms / 1000.0
+        self.timeout_s = timeout_s
+        self.batches = 0
+        self.requests = 0
+        self.timeouts = 0
+        self.errors = 0
+        self._cells: List[str] = []
+        self._cursor = 0
+        self._pending: Dict[str, Tuple[Dict[str, Any], Future]] = {}
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="shared-detector", daemon=True)
+        self._thread.start()
+
+    def client(self, cell_id: str) -> "_DetectorClient":
+        with self._cond:
+            if cell_id not in self._cells:
+                self._cells.append(cell_id)
+        return _DetectorClient(self, cell_id)
+
+    def detect(self, cell_id: str, frames: Dict[str, Any]) -> List[DetectedObject]:
+        future: Future = Future()
+        with self._cond:
+            if self._closed:
+                return []
+            replaced = self._pending.get(cell_id)
+            if replaced is not None:
+                replaced[1].set_result([])
+            self._pending[cell_id] = (frames, future)
+            self._cond.notify()
+        try:
+            return future.result(timeout=self.timeout_s)
+        except FutureTimeout:
+            with self._cond:
+                self.timeouts += 1
+                # Not picked up yet: withdraw it so the worker doesn't spend a batch slot on it.
+                pending = self._pending.get(cell_id)
+                if pending is not None and pending[1] is future:
+                    del self._pending[cell_id]
+            return []
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "cells": len(self._cells),
+            "requests": self.requests,
+            "batches": self.batches,
+            "avg_batch": round(self.requests / self.batches, 2) if self.batches else 0.0,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+        }
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            for _, future in self._pending.values():
+                future.set_result([])
+            self._pending.clear()
+            self._cond.notify_all()
+        self._thread.join(timeout=5.0)
+
+    def _next_batch(self) -> List[Tuple[str, Dict[str, Any], Future]]:
+        with self._cond:
+            self._cond.wait_for(lambda: self._pending or self._closed)
+            # Give the other cells a moment to join the batch.
+            deadline = time.monotonic() + self.max_wait_s
+            while not self._closed and len(self._pending) < min(len(self._cells), self.max_batch):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            if self._closed:
+                return []
+            count = len(self._cells)
+            picked: List[str] = []
+            for offset in range(count):
+                cell_id = self._cells[(self._cursor + offset) % count]
+                if cell_id in self._pending:
+                    picked.append(cell_id)
+                    if len(picked) == self.max_batch:
+                        self._cursor = (self._cursor + offset + 1) % count
+                        break
+            else:
+                self._cursor = (self._cursor + 1) % count
+            return [(cell_id, *self._pending.pop(cell_id)) for cell_id in picked]
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if not batch:
+                if self._closed:
+                    return
+                continue
+            frames = [item[1] for item in batch]
+            try:
+                detect_batch = getattr(self.detector, "detect_batch", None)
+                if callable(detect_batch):
+                    results = detect_batch(frames)
+                else:
+                    results = [self.detector.detect(f) for f in frames]
+            except Exception:
+                self.errors += 1
+                logger.exception("Shared detector batch failed")
+                results = [[] for _ in frames]
+            self.batches += 1
+            self.requests += len(batch)
+            for (_, _, future), detections in zip(batch, results):
+                if not future.done():
+                    future.set_result(detections)
+
+
+class _DetectorClient:
+    """Per-cell view of a ``SharedDetector`` with the plain ``detect(frames)`` signature."""
+
+    def __init__(self, shared: SharedDetector, cell_id: str) -> None:
+        self.shared = shared
+        self.cell_id = cell_id
+
+    def detect(self, frames: Dict[str, Any]) -> List[DetectedObject]:
+        return self.shared.detect(self.cell_id, frames)
+
+
 class CameraPerceptionProvider:
     """Captures from real USB cameras and runs object detection."""
 
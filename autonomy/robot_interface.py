@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, Optional, Protocol
+from typing import Any, Callable, List, Optional, Protocol
 
 from autonomy.types import DetectedObject, Goal, ObjClass
 
@@ -9,6 +9,11 @@ class RobotInterface(Protocol):
     """Protocol defining the contract any robot backend must satisfy."""
 
     held_object_id: Optional[str]
+    # Called with (joint state, command), both in radians, for every streamed control point,
+    # e.g. by a dataset recorder. Hardware backends pass the measured state.
+    command_observer: Optional[Callable[[List[float], Any], None]]
+    # Cancel check bound by StepExecutor while a deadline-bound step runs; motion stops once it returns True.
+    should_stop: Optional[Callable[[], bool]]
 
     def reset(self, seed: Optional[int] = None) -> None: ...
     def observe(self) -> List[DetectedObject]: ...
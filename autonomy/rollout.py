@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from autonomy.executor import StepExecutor
+from autonomy.metrics import MetricsRegistry
+from autonomy.planner import Planner
+from autonomy.sim_robot import SimRobot, SimSnapshot
+from autonomy.types import Goal, PlanStep, WorldState
+
+# Rollouts are hypothetical; keep their executors' collectors off the process-wide REGISTRY.
+_ROLLOUT_REGISTRY = MetricsRegistry()
+
+
+@dataclass
+class RolloutResult:
+    success: bool
+    steps: int
+    failures: int
+    last_error: Optional[str] = None
+
+
+def run_rollout(
+    snapshot: SimSnapshot,
+    goal: Goal,
+    plan: Sequence[PlanStep],
+    seed: int,
+    horizon: int = 12,
+    max_retries_per_step: int = 2,
+) -> RolloutResult:
+    """Execute ``plan`` from ``snapshot`` on a scratch SimRobot with a branched RNG."""
+    robot = SimRobot.from_snapshot(snapshot, seed=seed)
+    executor = StepExecutor(Planner(), registry=_ROLLOUT_REGISTRY)
+    state = WorldState()
+    steps = failures = retries = cursor = 0
+    last_error: Optional[str] = None
+    while cursor < len(plan) and steps < horizon:
+        if robot.verify_goal(goal):
+            break
+        ok, err = executor.run_step(plan[cursor], robot, goal, state)
+        steps += 1
+        if ok:
+            cursor += 1
+            retries = 0
+            continue
+        failures += 1
+        last_error = err
+        retries += 1
+        if retries > max_retries_per_step:
+            break
+    return RolloutResult(success=robot.verify_goal(goal), steps=steps, failures=failures, last_error=last_error)
+
+
+def _run_batch(
+    snapshot: SimSnapshot,
+    goal: Goal,
+    plan: Sequence[PlanStep],
+    seeds: Sequence[int],
+    horizon: int,
+    max_retries_per_step: int,
+) -> List[RolloutResult]:
+    return [run_rollout(snapshot, goal, plan, seed, horizon, max_retries_per_step) for seed in seeds]
+
+
+class RolloutPool:
+    """Monte Carlo lookahead: K simulated continuations per candidate plan.
+
+    Every candidate is evaluated on the same K branch seeds (common random
+    numbers), so differences between candidates are not sampling noise in
+    the disturbance sequence. With ``workers > 1`` candidates run in a
+    process pool; the snapshot is shipped to each worker once per call.
+    """
+
+    def __init__(
+        self,
+        k: int = 16,
+        horizon: int = 12,
+        max_retries_per_step: int = 2,
+        workers: int = 0,
+    ) -> None:
+        self.k = k
+        self.horizon = horizon
+        self.max_retries_per_step = max_retries_per_step
+        self.workers = workers
+        self._pool: Optional[Executor] = None
+
+    def evaluate(
+        self,
+        robot: SimRobot,
+        goal: Goal,
+        candidates: Dict[str, Sequence[PlanStep]],
+    ) -> Dict[str, float]:
+        """Estimated success probability of each candidate plan."""
+        snapshot = robot.snapshot()
+        base = hash(snapshot.rng_state) & 0xFFFFFFFF
+        seeds = [base + i for i in range(self.k)]
+        jobs: List[Tuple[str, Sequence[PlanStep]]] = list(candidates.items())
+
+        if self.workers > 1:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            futures = [
+                self._pool.submit(
+                    _run_batch, snapshot, goal, list(plan), seeds, self.horizon, self.max_retries_per_step
+                )
+                for _, plan in jobs
+            ]
+            batches = [future.result() for future in futures]
+        else:
+            batches = [
+                _run_batch(snapshot, goal, plan, seeds, self.horizon, self.max_retries_per_step)
+                for _, plan in jobs
+            ]
+
+        return {
+            name: sum(r.success for r in results) / max(len(results), 1)
+            for (name, _), results in zip(jobs, batches)
+        }
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
@@ -1,21 +1,169 @@
 from __future__ import annotations
 
 import random
-from dataclasses import replace
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 
-from autonomy.types import DetectedObject, Goal, ObjClass
+from autonomy.kinematics import IKSolver
+from autonomy.spatial import UniformGrid
+from autonomy.trajectory import (
+    GRIPPER_CLOSED,
+    GRIPPER_INDEX,
+    GRIPPER_OPEN,
+    NUM_JOINTS,
+    StreamStats,
+    TrajectoryPlanner,
+    TrajectoryStreamer,
+)
+from autonomy.types import DetectedObject, Goal, ObjClass, Vec3
+
+HOME_POSE = (0.0, -1.2, 1.4, 0.3, 0.0, GRIPPER_OPEN)
+
+# Sim table coordinates are compressed into the SO-ARM100 reach around this base.
+SIM_ARM_BASE = (0.0, 0.0, 0.75)
+SIM_ARM_SCALE = 0.4
+PRE_GRASP_HEIGHT = 0.05
+
+
+@dataclass
+class SceneConfig:
+    """Cluttered-table scene for large-scene stress runs.
+
+    In this mode the robot only observes objects within ``fov_radius`` of
+    its current focus point (last searched/navigated target).
+    """
+
+    num_objects: int = 1000
+    class_mix: Dict[ObjClass, float] = field(
+        default_factory=lambda: {
+            ObjClass.CUP: 0.25,
+            ObjClass.BOTTLE: 0.35,
+            ObjClass.TOOL: 0.3,
+            ObjClass.UNKNOWN: 0.1,
+        }
+    )
+    x_range: Tuple[float, float] = (0.2, 0.9)
+    y_range: Tuple[float, float] = (-0.4, 0.4)
+    table_height: float = 0.75
+    occluded_fraction: float = 0.25
+    fov_radius: float = 0.12
+    # Grid cell edge; None sizes cells for roughly four objects each.
+    cell_size: Optional[float] = None
+
+    def resolved_cell_size(self) -> float:
+        if self.cell_size is not None:
+            return self.cell_size
+        area = (self.x_range[1] - self.x_range[0]) * (self.y_range[1] - self.y_range[0])
+        return max(1e-3, (4.0 * area / max(self.num_objects, 1)) ** 0.5)
+
+
+def generate_scene(config: SceneConfig, rng: random.Random) -> Dict[str, DetectedObject]:
+    classes = list(config.class_mix)
+    weights = [config.class_mix[cls] for cls in classes]
+    counts: Dict[ObjClass, int] = {}
+    objects: Dict[str, DetectedObject] = {}
+    for cls in rng.choices(classes, weights=weights, k=config.num_objects):
+        counts[cls] = counts.get(cls, 0) + 1
+        visible = rng.random() >= config.occluded_fraction
+        obj = DetectedObject(
+            obj_id=f"{cls.value}_{counts[cls]}",
+            cls=cls,
+            position=(rng.uniform(*config.x_range), rng.uniform(*config.y_range), config.table_height),
+            confidence=rng.uniform(0.55, 0.9) if visible else 0.2,
+            visible=visible,
+            in_bin=False,
+            properties={"graspable": "true"},
+        )
+        objects[obj.obj_id] = obj
+    target_bin = _make_bin()
+    objects[target_bin.obj_id] = target_bin
+    return objects
+
+
+def _make_bin() -> DetectedObject:
+    return DetectedObject(
+        obj_id="bin_1",
+        cls=ObjClass.BIN,
+        position=(1.4, 0.0, 0.0),
+        confidence=0.98,
+        visible=True,
+        in_bin=False,
+        properties={"container": "true"},
+    )
+
+
+# (obj_id, cls, position, confidence, visible, in_bin, properties) - immutable so
+# unchanged objects can be shared between consecutive snapshots.
+ObjectRow = Tuple[str, ObjClass, Vec3, float, bool, bool, Tuple[Tuple[str, str], ...]]
+
+
+@dataclass(frozen=True)
+class SimSnapshot:
+    """Immutable, picklable capture of SimRobot state."""
+
+    objects: Tuple[ObjectRow, ...]
+    held_object_id: Optional[str]
+    rng_state: Tuple[Any, ...]
+    episode: int
+    joint_positions: Tuple[float, ...]
+    fov_center: Vec3
+    scene: Optional[SceneConfig]
+
+
+def _object_row(obj: DetectedObject) -> ObjectRow:
+    return (
+        obj.obj_id,
+        obj.cls,
+        obj.position,
+        obj.confidence,
+        obj.visible,
+        obj.in_bin,
+        tuple(obj.properties.items()),
+    )
+
+
+def _object_from_row(row: ObjectRow) -> DetectedObject:
+    obj_id, cls, position, confidence, visible, in_bin, properties = row
+    return DetectedObject(
+        obj_id=obj_id,
+        cls=cls,
+        position=position,
+        confidence=confidence,
+        visible=visible,
+        in_bin=in_bin,
+        properties=dict(properties),
+    )
 
 
 class SimRobot:
-    """Simple stochastic world for Track-1 style autonomy testing."""
+    """Simple stochastic world for Track-1 style autonomy testing.
+
+    Pass ``scene`` to replace the fixed three-object table with a generated
+    cluttered scene backed by a spatial index.
+    """
 
-    def __init__(self, seed: int = 7) -> None:
+    def __init__(self, seed: int = 7, scene: Optional[SceneConfig] = None) -> None:
         self._base_seed = seed
         self._rng = random.Random(seed)
         self._episode = 0
+        self.scene = scene
         self.held_object_id: Optional[str] = None
         self.objects: Dict[str, DetectedObject] = {}
+        self.fov_center: Vec3 = (0.55, 0.0, 0.75)
+        self._index = UniformGrid(scene.resolved_cell_size() if scene else 0.05)
+        self._bin_ids: List[str] = []
+        self._in_bin_counts: Dict[ObjClass, int] = {}
+        # Snapshot rows reused until the object is mutated (see _touch).
+        self._rows: Dict[str, ObjectRow] = {}
+        self._dirty: Set[str] = set()
+        self.joint_positions: List[float] = list(HOME_POSE)
+        self.joint_velocities: List[float] = [0.0] * NUM_JOINTS
+        self.last_stream: Optional[StreamStats] = None
+        self.command_observer: Optional[Callable[[List[float], Any], None]] = None
+        self.should_stop: Optional[Callable[[], bool]] = None
+        self._trajectory_planner = TrajectoryPlanner()
+        self._ik = IKSolver()
+        self._streamer = TrajectoryStreamer(self._apply_joints, realtime=False)
         self.reset(seed)
 
     def reset(self, seed: Optional[int] = None) -> None:
@@ -24,6 +172,15 @@ class SimRobot:
         self._episode += 1
         self._rng = random.Random(seed)
         self.held_object_id = None
+        self.joint_positions = list(HOME_POSE)
+        self.joint_velocities = [0.0] * NUM_JOINTS
+        self.last_stream = None
+        self._rows = {}
+
+        if self.scene is not None:
+            self.objects = generate_scene(self.scene, self._rng)
+            self._reindex()
+            return
 
         cup_visible = self._rng.random() > 0.25
         cup = DetectedObject(
@@ -44,26 +201,88 @@ class SimRobot:
             in_bin=False,
             properties={"graspable": "true"},
         )
-        target_bin = DetectedObject(
-            obj_id="bin_1",
-            cls=ObjClass.BIN,
-            position=(1.4, 0.0, 0.0),
-            confidence=0.98,
-            visible=True,
-            in_bin=False,
-            properties={"container": "true"},
-        )
+        target_bin = _make_bin()
 
         self.objects = {
             cup.obj_id: cup,
             bottle.obj_id: bottle,
             target_bin.obj_id: target_bin,
         }
+        self._reindex()
+
+    def snapshot(self) -> SimSnapshot:
+        """Capture the full simulator state, including the RNG.
+
+        Only objects mutated since the previous snapshot get new rows; all
+        others are shared with it.
+        """
+        if len(self._rows) != len(self.objects):
+            # Fresh scene: rebuild in object order so restore iterates identically.
+            self._rows = {obj_id: _object_row(obj) for obj_id, obj in self.objects.items()}
+        else:
+            for obj_id in self._dirty:
+                self._rows[obj_id] = _object_row(self.objects[obj_id])
+        self._dirty.clear()
+        return SimSnapshot(
+            objects=tuple(self._rows.values()),
+            held_object_id=self.held_object_id,
+            rng_state=self._rng.getstate(),
+            episode=self._episode,
+            joint_positions=tuple(self.joint_positions),
+            fov_center=self.fov_center,
+            scene=self.scene,
+        )
+
+    def restore(self, snapshot: SimSnapshot) -> None:
+        if snapshot.scene is not self.scene:
+            self.scene = snapshot.scene
+            self._index = UniformGrid(self.scene.resolved_cell_size() if self.scene else 0.05)
+        self.objects = {row[0]: _object_from_row(row) for row in snapshot.objects}
+        self._rows = {row[0]: row for row in snapshot.objects}
+        self._dirty = set()
+        self.held_object_id = snapshot.held_object_id
+        self._rng.setstate(snapshot.rng_state)
+        self._episode = snapshot.episode
+        self.joint_positions = list(snapshot.joint_positions)
+        self.joint_velocities = [0.0] * NUM_JOINTS
+        self.last_stream = None
+        fov_center = snapshot.fov_center
+        self._reindex()
+        self.fov_center = fov_center
+
+    @classmethod
+    def from_snapshot(cls, snapshot: SimSnapshot, seed: Optional[int] = None) -> SimRobot:
+        """Build a robot in ``snapshot`` state; ``seed`` reseeds the RNG to branch it."""
+        robot = cls()
+        robot.restore(snapshot)
+        if seed is not None:
+            robot._rng.seed(seed)
+        return robot
+
+    def _touch(self, obj_id: str) -> None:
+        self._dirty.add(obj_id)
+
+    def _reindex(self) -> None:
+        self._index.clear()
+        self._bin_ids = []
+        self._in_bin_counts = {}
+        for obj in self.objects.values():
+            self._index.insert(obj.obj_id, obj.position)
+            if obj.cls == ObjClass.BIN:
+                self._bin_ids.append(obj.obj_id)
+            if obj.in_bin:
+                self._in_bin_counts[obj.cls] = self._in_bin_counts.get(obj.cls, 0) + 1
+        if self.scene is not None:
+            self.fov_center = (
+                sum(self.scene.x_range) / 2.0,
+                sum(self.scene.y_range) / 2.0,
+                self.scene.table_height,
+            )
 
     def observe(self) -> List[DetectedObject]:
         """Return noisy detections. Some objects may be missed."""
         detections: List[DetectedObject] = []
-        for obj in self.objects.values():
+        for obj in self._observable():
             if obj.cls == ObjClass.BIN:
                 detections.append(replace(obj, confidence=0.97))
                 continue
@@ -83,13 +302,25 @@ class SimRobot:
             )
         return detections
 
+    def _observable(self) -> List[DetectedObject]:
+        if self.scene is None:
+            return list(self.objects.values())
+        in_view = self._index.query_radius(self.fov_center, self.scene.fov_radius)
+        seen = set(in_view)
+        in_view.extend(bin_id for bin_id in self._bin_ids if bin_id not in seen)
+        return [self.objects[obj_id] for obj_id in in_view]
+
     def target_in_bin(self, goal: Goal) -> bool:
-        for obj in self.objects.values():
-            if obj.cls == goal.target_obj_class and obj.in_bin:
-                return True
-        return False
+        return self._in_bin_counts.get(goal.target_obj_class, 0) > 0
 
     def _find_any(self, cls: ObjClass) -> Optional[DetectedObject]:
+        if self.scene is not None:
+            def wanted(obj_id: str) -> bool:
+                obj = self.objects[obj_id]
+                return obj.cls == cls and not obj.in_bin
+
+            found = self._index.nearest(self.fov_center, predicate=wanted)
+            return None if found is None else self.objects[found]
         candidates = [o for o in self.objects.values() if o.cls == cls and not o.in_bin]
         if not candidates:
             return None
@@ -99,6 +330,7 @@ class SimRobot:
         target = self._find_any(target_class)
         if not target:
             return False
+        self.fov_center = target.position
         if target.visible:
             return True
         # Search can reveal occluded target.
@@ -106,6 +338,7 @@ class SimRobot:
         if discovered:
             target.visible = True
             target.confidence = max(target.confidence, 0.65)
+            self._touch(target.obj_id)
             return True
         return False
 
@@ -120,7 +353,13 @@ class SimRobot:
                 obj.position[1] + self._rng.uniform(-0.03, 0.03),
                 obj.position[2],
             )
-        return self._rng.random() > 0.06
+            self._index.move(target_id, obj.position)
+            self._touch(target_id)
+        success = self._rng.random() > 0.06
+        if success:
+            self.fov_center = self.objects[target_id].position
+            self._move_to(self._reach_pose(self.fov_center))
+        return success
 
     def grasp(self, target_id: str) -> bool:
         if self.held_object_id is not None:
@@ -133,6 +372,7 @@ class SimRobot:
         success = self._rng.random() < base
         if success:
             self.held_object_id = target_id
+            self._move_gripper(GRIPPER_CLOSED)
         return success
 
     def place_in_bin(self, target_id: str, bin_id: str) -> bool:
@@ -145,8 +385,38 @@ class SimRobot:
         if success:
             target.in_bin = True
             target.visible = False
+            self._touch(target_id)
+            self._in_bin_counts[target.cls] = self._in_bin_counts.get(target.cls, 0) + 1
             self.held_object_id = None
+            self._move_gripper(GRIPPER_OPEN)
         return success
 
     def verify_goal(self, goal: Goal) -> bool:
         return self.target_in_bin(goal)
+
+    def _reach_pose(self, position: Vec3) -> List[float]:
+        """Pre-grasp pose above ``position``; best-effort when out of reach."""
+        target = [
+            (position[0] - SIM_ARM_BASE[0]) * SIM_ARM_SCALE,
+            (position[1] - SIM_ARM_BASE[1]) * SIM_ARM_SCALE,
+            (position[2] - SIM_ARM_BASE[2]) * SIM_ARM_SCALE + PRE_GRASP_HEIGHT,
+        ]
+        result = self._ik.solve(target, seed=self.joint_positions)
+        pose = list(self.joint_positions)
+        pose[: result.joints.shape[1]] = result.joints[0].tolist()
+        return pose
+
+    def _move_gripper(self, opening: float) -> None:
+        goal = list(self.joint_positions)
+        goal[GRIPPER_INDEX] = opening
+        self._move_to(goal)
+
+    def _move_to(self, goal: Sequence[float]) -> None:
+        trajectory = self._trajectory_planner.plan(self.joint_positions, goal)
+        self.last_stream = self._streamer.stream(trajectory, should_stop=self.should_stop)
+        self.joint_velocities = trajectory.velocity_after(self.last_stream.points)
+
+    def _apply_joints(self, positions) -> None:
+        if self.command_observer is not None:
+            self.command_observer(self.joint_positions, positions)
+        self.joint_positions = positions.tolist()
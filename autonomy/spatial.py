@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import math
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from autonomy.types import Vec3
+
+Cell = Tuple[int, int]
+
+
+class UniformGrid:
+    """Uniform hash grid over the table plane (x, y) for point objects.
+
+    Insert/move/remove are O(1); radius queries and nearest-neighbour search
+    only touch the cells around the query point, so cost tracks local
+    density rather than scene size.
+    """
+
+    def __init__(self, cell_size: float = 0.05) -> None:
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = cell_size
+        self._cells: Dict[Cell, Dict[str, Tuple[float, float]]] = {}
+        self._where: Dict[str, Cell] = {}
+        self._lo: Optional[Cell] = None
+        self._hi: Optional[Cell] = None
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, obj_id: object) -> bool:
+        return obj_id in self._where
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._where.clear()
+        self._lo = self._hi = None
+
+    def insert(self, obj_id: str, position: Vec3) -> None:
+        if obj_id in self._where:
+            self.remove(obj_id)
+        cell = self._cell(position[0], position[1])
+        self._cells.setdefault(cell, {})[obj_id] = (position[0], position[1])
+        self._where[obj_id] = cell
+        if self._lo is None or self._hi is None:
+            self._lo = self._hi = cell
+        else:
+            self._lo = (min(self._lo[0], cell[0]), min(self._lo[1], cell[1]))
+            self._hi = (max(self._hi[0], cell[0]), max(self._hi[1], cell[1]))
+
+    def remove(self, obj_id: str) -> None:
+        cell = self._where.pop(obj_id, None)
+        if cell is None:
+            return
+        bucket = self._cells[cell]
+        del bucket[obj_id]
+        if not bucket:
+            del self._cells[cell]
+
+    def move(self, obj_id: str, position: Vec3) -> None:
+        self.insert(obj_id, position)
+
+    def query_radius(self, center: Vec3, radius: float) -> List[str]:
+        cx, cy = center[0], center[1]
+        r2 = radius * radius
+        x0, y0 = self._cell(cx - radius, cy - radius)
+        x1, y1 = self._cell(cx + radius, cy + radius)
+        found: List[str] = []
+        for ix in range(x0, x1 + 1):
+            for iy in range(y0, y1 + 1):
+                bucket = self._cells.get((ix, iy))
+                if not bucket:
+                    continue
+                for obj_id, (x, y) in bucket.items():
+                    if (x - cx) ** 2 + (y - cy) ** 2 <= r2:
+                        found.append(obj_id)
+        return found
+
+    def nearest(
+        self,
+        center: Vec3,
+        predicate: Optional[Callable[[str], bool]] = None,
+        max_radius: Optional[float] = None,
+    ) -> Optional[str]:
+        """Closest object to ``center`` (in x/y) accepted by ``predicate``.
+
+        Scans rings of cells outward and stops once no unscanned cell can
+        hold anything closer than the best match so far.
+        """
+        if not self._where or self._lo is None or self._hi is None:
+            return None
+        cx, cy = center[0], center[1]
+        origin = self._cell(cx, cy)
+        max_ring = max(
+            abs(origin[0] - self._lo[0]),
+            abs(origin[0] - self._hi[0]),
+            abs(origin[1] - self._lo[1]),
+            abs(origin[1] - self._hi[1]),
+        )
+        if max_radius is not None:
+            max_ring = min(max_ring, int(math.ceil(max_radius / self.cell_size)))
+
+        best_id: Optional[str] = None
+        best_d2 = math.inf
+        for ring in range(max_ring + 1):
+            for cell in _ring_cells(origin, ring):
+                bucket = self._cells.get(cell)
+                if not bucket:
+                    continue
+                for obj_id, (x, y) in bucket.items():
+                    d2 = (x - cx) ** 2 + (y - cy) ** 2
+                    if d2 < best_d2 and (predicate is None or predicate(obj_id)):
+                        best_id, best_d2 = obj_id, d2
+            # Anything in ring+1 or beyond is at least ring * cell_size away.
+            reach = ring * self.cell_size
+            if best_id is not None and best_d2 <= reach * reach:
+                break
+        if best_id is not None and max_radius is not None and best_d2 > max_radius * max_radius:
+            return None
+        return best_id
+
+    def _cell(self, x: float, y: float) -> Cell:
+        return (int(math.floor(x / self.cell_size)), int(math.floor(y / self.cell_size)))
+
+
+def _ring_cells(origin: Cell, ring: int) -> Iterator[Cell]:
+    ox, oy = origin
+    if ring == 0:
+        yield origin
+        return
+    for dx in range(-ring, ring + 1):
+        yield (ox + dx, oy - ring)
+        yield (ox + dx, oy + ring)
+    for dy in range(-ring + 1, ring):
+        yield (ox - ring, oy + dy)
+        yield (ox + ring, oy + dy)
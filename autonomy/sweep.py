@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import itertools
+import math
+import random
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from autonomy.types import EpisodeMetrics
+
+# Track1Agent / run_episode knobs a sweep may vary.
+SWEEP_PARAMS = ("max_retries_per_step", "max_replans", "max_ticks")
+
+Params = Dict[str, int]
+
+
+def parse_param(spec: str) -> Tuple[str, List[int]]:
+    """``name=0,1,3`` or an inclusive range ``name=0:3``."""
+    name, sep, values = spec.partition("=")
+    name = name.strip().replace("-", "_")
+    if not sep or name not in SWEEP_PARAMS:
+        raise ValueError(f"expected one of {', '.join(SWEEP_PARAMS)} as name=v1,v2 or name=lo:hi, got {spec!r}")
+    if ":" in values:
+        lo, hi = (int(v) for v in values.split(":", maxsplit=1))
+        if hi < lo:
+            raise ValueError(f"empty range {lo}:{hi} in {spec!r}; ranges are low:high")
+        return name, list(range(lo, hi + 1))
+    parsed = [int(v) for v in values.split(",") if v.strip()]
+    if not parsed:
+        raise ValueError(f"no values for {name} in {spec!r}")
+    return name, parsed
+
+
+def grid(space: Dict[str, Sequence[int]]) -> List[Params]:
+    names = list(space)
+    return [dict(zip(names, combo)) for combo in itertools.product(*(space[n] for n in names))]
+
+
+def random_configs(space: Dict[str, Sequence[int]], samples: int, seed: int) -> List[Params]:
+    """``samples`` distinct configs drawn uniformly from the grid."""
+    configs = grid(space)
+    return random.Random(seed).sample(configs, min(samples, len(configs)))
+
+
+def z_score(confidence: float) -> float:
+    return NormalDist().inv_cdf(1.0 - (1.0 - confidence) / 2.0)
+
+
+def wilson_interval(successes: int, trials: int, z: float = 1.96) -> Tuple[float, float]:
+    """Wilson score interval for a success rate; (0, 1) before any trial."""
+    if trials == 0:
+        return 0.0, 1.0
+    p = successes / trials
+    denom = 1.0 + z * z / trials
+    center = (p + z * z / (2 * trials)) / denom
+    half = z * math.sqrt(p * (1.0 - p) / trials + z * z / (4 * trials * trials)) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+@dataclass
+class ConfigResult:
+    params: Params
+    trials: int = 0
+    successes: int = 0
+    retries: int = 0
+    replans: int = 0
+    duration_s: float = 0.0
+    fail_reasons: Dict[str, int] = field(default_factory=dict)
+    stopped_at: Optional[int] = None
+
+    @property
+    def success_rate(self) -> float:
+        return self.successes / self.trials if self.trials else 0.0
+
+    def add(self, metrics: EpisodeMetrics) -> None:
+        self.trials += 1
+        self.successes += int(metrics.success)
+        self.retries += metrics.retries
+        self.replans += metrics.replans
+        self.duration_s += metrics.duration_s
+        if metrics.fail_reason:
+            self.fail_reasons[metrics.fail_reason] = self.fail_reasons.get(metrics.fail_reason, 0) + 1
+
+    def row(self, z: float) -> Dict[str, Any]:
+        lo, hi = wilson_interval(self.successes, self.trials, z)
+        n = max(self.trials, 1)
+        top_fail = max(self.fail_reasons, key=self.fail_reasons.get) if self.fail_reasons else ""
+        return {
+            **self.params,
+            "trials": self.trials,
+            "success_rate": round(self.success_rate, 3),
+            "ci_low": round(lo, 3),
+            "ci_high": round(hi, 3),
+            "avg_retries": round(self.retries / n, 2),
+            "avg_replans": round(self.replans / n, 2),
+            "avg_duration_s": round(self.duration_s / n, 3),
+            "top_fail_reason": top_fail,
+            "status": "survived" if self.stopped_at is None else f"stopped@{self.stopped_at}",
+        }
+
+
+class SequentialSweep:
+    """Race agent configs on common seeds, dropping the ones that are clearly worse.
+
+    Every round runs the next seed on each still-active config (common
+    random numbers: all configs see the same scenes). From ``min_trials`` on,
+    a config stops once the upper Wilson bound of its success rate falls
+    below the best active config's lower bound; the race ends when one config
+    is left or the seeds run out.
+    """
+
+    def __init__(
+        self,
+        configs: Sequence[Params],
+        run: Callable[[Params, int], EpisodeMetrics],
+        seeds: Sequence[int],
+        min_trials: int = 10,
+        confidence: float = 0.95,
+    ) -> None:
+        self.results = [ConfigResult(params=dict(c)) for c in configs]
+        self.run = run
+        self.seeds = list(seeds)
+        self.min_trials = min_trials
+        self.z = z_score(confidence)
+
+    @property
+    def episodes(self) -> int:
+        return sum(r.trials for r in self.results)
+
+    def execute(self, on_round: Optional[Callable[[int, List[ConfigResult]], None]] = None) -> List[ConfigResult]:
+        active = list(self.results)
+        for round_no, seed in enumerate(self.seeds, start=1):
+            for result in active:
+                result.add(self.run(result.params, seed))
+            if round_no >= self.min_trials and len(active) > 1:
+                best_low = max(wilson_interval(r.successes, r.trials, self.z)[0] for r in active)
+                for result in active:
+                    if wilson_interval(result.successes, result.trials, self.z)[1] < best_low:
+                        result.stopped_at = round_no
+                active = [r for r in active if r.stopped_at is None]
+            if on_round is not None:
+                on_round(round_no, active)
+            if len(active) <= 1 and len(self.results) > 1:
+                break
+        return self.ranked()
+
+    def ranked(self) -> List[ConfigResult]:
+        """Best first: survivors, then success rate, lower bound, fewer retries, shorter episodes."""
+        def key(r: ConfigResult) -> Tuple:
+            lo, _ = wilson_interval(r.successes, r.trials, self.z)
+            n = max(r.trials, 1)
+            return (r.stopped_at is None, r.success_rate, lo, -r.retries / n, -r.duration_s / n)
+
+        return sorted(self.results, key=key, reverse=True)
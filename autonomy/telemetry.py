@@ -1,13 +1,26 @@
 from __future__ import annotations
 
+import gzip
 import json
+import logging
+import os
+import queue
 import socket
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import Iterable, List, Optional, Protocol
+from typing import IO, Any, Dict, Iterable, List, Optional, Protocol, Tuple
 
+from autonomy.metrics import REGISTRY, MetricsRegistry
+from autonomy.telemetry_delta import DeltaEncoder
+from autonomy.telemetry_encode import dumps
+from autonomy.telemetry_udp import DEFAULT_MTU, UdpFramer
+from autonomy.timeline import BoundedTimeline
 from autonomy.types import EpisodeMetrics, TelemetryFrame, WorldState
 
+logger = logging.getLogger(__name__)
+
 
 class TelemetrySink(Protocol):
     def emit(self, frame: TelemetryFrame) -> None:
@@ -15,8 +28,10 @@ class TelemetrySink(Protocol):
 
 
 class InMemorySink:
-    def __init__(self) -> None:
-        self.frames: List[TelemetryFrame] = []
+    """Keeps emitted frames; ``max_frames`` bounds memory (see ``BoundedTimeline``)."""
+
+    def __init__(self, max_frames: Optional[int] = None, spill: bool = True) -> None:
+        self.frames = BoundedTimeline(max_frames, spill=spill)
 
     def emit(self, frame: TelemetryFrame) -> None:
         self.frames.append(frame)
@@ -26,16 +41,177 @@ class JsonlSink:
     def __init__(self, path: str) -> None:
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self._fh = self.path.open("w", encoding="utf-8")
+        self._fh = self.path.open("wb")
 
     def emit(self, frame: TelemetryFrame) -> None:
-        self._fh.write(json.dumps(frame.to_dict(), separators=(",", ":")) + "\n")
+        self._fh.write(frame.to_json() + b"\n")
         self._fh.flush()
 
     def close(self) -> None:
         self._fh.close()
 
 
+_CLOSE = object()
+
+
+class BufferedJsonlSink:
+    """JSONL sink that serializes and writes frames on a background thread.
+
+    ``emit`` only enqueues; when the bounded queue is full the frame is
+    dropped and counted instead of blocking the control loop. The writer
+    batches lines and flushes every ``flush_every`` frames or
+    ``flush_interval_s`` seconds. Paths ending in ``.gz`` (or
+    ``compress=True``) are gzip-compressed. Files rotate to
+    ``<stem>.0001.<ext>`` etc. after ``rotate_bytes`` uncompressed bytes
+    and/or at each episode end. ``close`` drains the queue and fsyncs.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        queue_size: int = 1024,
+        flush_every: int = 64,
+        flush_interval_s: float = 0.5,
+        compress: Optional[bool] = None,
+        rotate_bytes: int = 0,
+        rotate_per_episode: bool = False,
+        registry: MetricsRegistry = REGISTRY,
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.compress = self.path.suffix == ".gz" if compress is None else compress
+        self.flush_every = max(1, flush_every)
+        self.flush_interval_s = flush_interval_s
+        self.rotate_bytes = rotate_bytes
+        self.rotate_per_episode = rotate_per_episode
+        self.written = 0
+        self.dropped = 0
+        self.write_errors = 0
+        self.files: List[Path] = []
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        self._raw: Optional[IO[bytes]] = None
+        self._fh: Optional[IO[bytes]] = None
+        self._file_bytes = 0
+        self._closed = False
+        # Producer and writer threads both count drops.
+        self._drop_lock = threading.Lock()
+        self._frames_dropped = _frames_dropped(registry)
+        self._thread = threading.Thread(target=self._run, name="jsonl-writer", daemon=True)
+        self._thread.start()
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def emit(self, frame: TelemetryFrame) -> None:
+        if self._closed:
+            self._drop(1, "closed")
+            return
+        try:
+            self._queue.put_nowait(frame)
+        except queue.Full:
+            self._drop(1, "queue_full")
+
+    def _drop(self, count: int, reason: str) -> None:
+        with self._drop_lock:
+            self.dropped += count
+        self._frames_dropped.labels(type(self).__name__, reason).inc(count)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "written": self.written,
+            "dropped": self.dropped,
+            "write_errors": self.write_errors,
+            "queue_depth": self.queue_depth,
+            "files": len(self.files),
+        }
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_CLOSE)
+        self._thread.join()
+
+    def _run(self) -> None:
+        batch: List[TelemetryFrame] = []
+        last_flush = time.monotonic()
+        while True:
+            timeout = max(0.0, self.flush_interval_s - (time.monotonic() - last_flush))
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            closing = item is _CLOSE
+            if item is not None and not closing:
+                batch.append(item)
+                # Drain whatever else is already queued without blocking.
+                while len(batch) < self.flush_every:
+                    try:
+                        nxt = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if nxt is _CLOSE:
+                        closing = True
+                        break
+                    batch.append(nxt)
+
+            due = time.monotonic() - last_flush >= self.flush_interval_s
+            if batch and (closing or due or len(batch) >= self.flush_every):
+                self._write_batch(batch)
+                batch = []
+                last_flush = time.monotonic()
+            elif due:
+                last_flush = time.monotonic()
+            if closing:
+                self._close_file(sync=True)
+                return
+
+    def _write_batch(self, batch: List[TelemetryFrame]) -> None:
+        done = 0
+        try:
+            for frame in batch:
+                if self._fh is None or (self.rotate_bytes and self._file_bytes >= self.rotate_bytes):
+                    self._open_next()
+                line = frame.to_json() + b"\n"
+                self._fh.write(line)
+                self._file_bytes += len(line)
+                self.written += 1
+                done += 1
+                if self.rotate_per_episode and frame.current_action == "DONE":
+                    self._close_file(sync=False)
+            if self._fh is not None:
+                self._fh.flush()
+        except OSError:
+            self.write_errors += 1
+            self._drop(len(batch) - done, "error")
+
+    def _open_next(self) -> None:
+        self._close_file(sync=False)
+        index = len(self.files)
+        if index == 0:
+            path = self.path
+        else:
+            stem, _, ext = self.path.name.partition(".")
+            path = self.path.with_name(f"{stem}.{index:04d}.{ext}" if ext else f"{stem}.{index:04d}")
+        self._raw = path.open("wb")
+        self._fh = gzip.GzipFile(fileobj=self._raw, mode="wb") if self.compress else self._raw
+        self._file_bytes = 0
+        self.files.append(path)
+
+    def _close_file(self, sync: bool) -> None:
+        if self._raw is None:
+            return
+        if self._fh is not self._raw:
+            self._fh.close()  # writes the gzip trailer, leaves the raw file open
+        self._raw.flush()
+        if sync:
+            os.fsync(self._raw.fileno())
+        self._raw.close()
+        self._raw = None
+        self._fh = None
+
+
 class StdoutSink:
     def emit(self, frame: TelemetryFrame) -> None:
         msg = {
@@ -51,27 +227,261 @@ class StdoutSink:
 
 
 class UdpSink:
-    """Sends telemetry as JSON over UDP for lightweight bridge processes."""
+    """Sends telemetry as sequenced binary-framed JSON datagrams (see ``autonomy.telemetry_udp``).
+
+    With ``batch_window_ms > 0`` frames are coalesced by a flusher thread and
+    sent at most once per window (or as soon as a datagram is full); frames
+    larger than ``mtu`` are split into chunks. With
+    ``delta_keyframe_interval > 0`` frames are sent as keyframe/delta
+    messages (see ``autonomy.telemetry_delta``); receivers decode them with
+    ``DeltaDecoder`` and resync on the next keyframe after a lost datagram.
+    """
 
-    def __init__(self, host: str, port: int) -> None:
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        delta_keyframe_interval: int = 0,
+        batch_window_ms: float = 0.0,
+        mtu: int = DEFAULT_MTU,
+    ) -> None:
         self._addr = (host, port)
         self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._delta = DeltaEncoder(delta_keyframe_interval) if delta_keyframe_interval > 0 else None
+        self._framer = UdpFramer(mtu)
+        self.batch_window_s = batch_window_ms / 1000.0
+        self.frames = 0
+        self.datagrams = 0
+        self.send_errors = 0
+        self._seq = 0
+        self._pending: List[Tuple[int, bytes]] = []
+        self._pending_bytes = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        if self.batch_window_s > 0:
+            self._thread = threading.Thread(target=self._run, name="udp-flusher", daemon=True)
+            self._thread.start()
 
     def emit(self, frame: TelemetryFrame) -> None:
-        payload = json.dumps(frame.to_dict(), separators=(",", ":")).encode("utf-8")
-        self._sock.sendto(payload, self._addr)
+        if self._delta is not None:
+            body = dumps(self._delta.encode(frame.to_dict()))
+        else:
+            body = frame.to_json()
+        with self._lock:
+            entry = (self._seq, body)
+            self._seq = (self._seq + 1) & 0xFFFFFFFF
+            self.frames += 1
+            if self._thread is None:
+                batch = [entry]
+            else:
+                self._pending.append(entry)
+                self._pending_bytes += len(body) + 4
+                if self._pending_bytes >= self._framer.payload_limit:
+                    self._wake.set()
+                return
+        self._send(batch)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"frames": self.frames, "datagrams": self.datagrams, "send_errors": self.send_errors}
 
     def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None:
+            self._wake.set()
+            self._thread.join()
+        self._flush()
         self._sock.close()
 
+    def _flush(self) -> None:
+        with self._lock:
+            batch, self._pending, self._pending_bytes = self._pending, [], 0
+        if batch:
+            self._send(batch)
+
+    def _send(self, batch: List[Tuple[int, bytes]]) -> None:
+        for datagram in self._framer.pack(batch):
+            try:
+                self._sock.sendto(datagram, self._addr)
+                self.datagrams += 1
+            except OSError:
+                # Full socket buffer or unreachable receiver; telemetry is best-effort.
+                self.send_errors += 1
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait(self.batch_window_s)
+            self._wake.clear()
+            self._flush()
+
+
+SINK_POLICIES = ("block", "drop_oldest", "sample")
+
+
+class SinkWorker:
+    """Runs one sink on its own thread behind a bounded queue.
+
+    Policies when the sink falls behind:
+    - ``block``: the producer waits for queue space (lossless);
+    - ``drop_oldest``: the oldest queued frame is discarded;
+    - ``sample``: only every ``sample_every``-th frame is queued (episode
+      ``DONE`` frames always are), then ``drop_oldest`` applies.
+    """
+
+    def __init__(
+        self,
+        sink: TelemetrySink,
+        policy: str = "drop_oldest",
+        queue_size: int = 256,
+        sample_every: int = 1,
+        name: Optional[str] = None,
+        registry: MetricsRegistry = REGISTRY,
+    ) -> None:
+        if policy not in SINK_POLICIES:
+            raise ValueError(f"Unknown sink policy {policy!r}; expected one of {SINK_POLICIES}")
+        self.sink = sink
+        self.policy = policy
+        self.sample_every = max(1, sample_every)
+        self.name = name or type(sink).__name__
+        self.emitted = 0
+        self.dropped = 0
+        self.sampled_out = 0
+        self.errors = 0
+        self.last_emit_ms = 0.0
+        self.max_emit_ms = 0.0
+        self._emit_ms_total = 0.0
+        self._offered = 0
+        self._frames_emitted = _frames_emitted(registry)
+        self._frames_dropped = _frames_dropped(registry)
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=f"sink-{self.name}", daemon=True)
+        self._thread.start()
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def emit(self, frame: TelemetryFrame) -> None:
+        if self._closed:
+            self.dropped += 1
+            self._frames_dropped.labels(self.name, "closed").inc()
+            return
+        self._offered += 1
+        if self.policy == "block":
+            self._queue.put(frame)
+            return
+        if self.policy == "sample" and (self._offered - 1) % self.sample_every and frame.current_action != "DONE":
+            self.sampled_out += 1
+            self._frames_dropped.labels(self.name, "sampled").inc()
+            return
+        while True:
+            try:
+                self._queue.put_nowait(frame)
+                return
+            except queue.Full:
+                pass
+            try:
+                self._queue.get_nowait()
+                self.dropped += 1
+                self._frames_dropped.labels(self.name, "queue_full").inc()
+            except queue.Empty:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "policy": self.policy,
+            "queue_depth": self.queue_depth,
+            "emitted": self.emitted,
+            "dropped": self.dropped,
+            "sampled_out": self.sampled_out,
+            "errors": self.errors,
+            "last_emit_ms": round(self.last_emit_ms, 3),
+            "avg_emit_ms": round(self._emit_ms_total / max(self.emitted, 1), 3),
+            "max_emit_ms": round(self.max_emit_ms, 3),
+        }
+
+    def close(self) -> None:
+        """Deliver everything still queued, then close the wrapped sink."""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(_CLOSE)
+            self._thread.join()
+        close = getattr(self.sink, "close", None)
+        if callable(close):
+            close()
+
+    def _run(self) -> None:
+        while True:
+            frame = self._queue.get()
+            if frame is _CLOSE:
+                return
+            start = time.perf_counter()
+            try:
+                self.sink.emit(frame)
+            except Exception:
+                logger.exception(f"Telemetry sink {self.name} failed")
+                self.errors += 1
+                self._frames_dropped.labels(self.name, "error").inc()
+                continue
+            elapsed_ms = (time.perf_counter() - start) * 1000.0
+            self.emitted += 1
+            self._frames_emitted.labels(self.name).inc()
+            self.last_emit_ms = elapsed_ms
+            self.max_emit_ms = max(self.max_emit_ms, elapsed_ms)
+            self._emit_ms_total += elapsed_ms
+
 
 class MultiSink:
-    def __init__(self, sinks: Iterable[TelemetrySink]) -> None:
-        self._sinks = list(sinks)
+    """Fans frames out to several sinks.
+
+    By default sinks are called in order on the caller's thread. With
+    ``async_mode=True`` every sink is wrapped in a ``SinkWorker`` (sinks
+    passed in as ``SinkWorker`` keep their own policy), so ``emit`` costs
+    one enqueue per sink and a slow sink only delays itself.
+    """
+
+    def __init__(
+        self,
+        sinks: Iterable[TelemetrySink],
+        async_mode: bool = False,
+        policy: str = "drop_oldest",
+        queue_size: int = 256,
+        sample_every: int = 1,
+        registry: MetricsRegistry = REGISTRY,
+    ) -> None:
+        self._sinks: List[Any] = []
+        # Synchronous sinks count their deliveries here; workers count their own.
+        self._counted: List[Tuple[Any, Any]] = []
+        emitted = _frames_emitted(registry)
+        names: Dict[str, int] = {}
+        for sink in sinks:
+            if async_mode and not isinstance(sink, SinkWorker):
+                sink = SinkWorker(
+                    sink, policy=policy, queue_size=queue_size, sample_every=sample_every, registry=registry
+                )
+            base = sink.name if isinstance(sink, SinkWorker) else type(sink).__name__
+            names[base] = names.get(base, 0) + 1
+            name = base if names[base] == 1 else f"{base}_{names[base]}"
+            if isinstance(sink, SinkWorker):
+                sink.name = name
+                self._counted.append((sink, None))
+            else:
+                self._counted.append((sink, emitted.labels(name)))
+            self._sinks.append(sink)
 
     def emit(self, frame: TelemetryFrame) -> None:
-        for sink in self._sinks:
+        for sink, counter in self._counted:
             sink.emit(frame)
+            if counter is not None:
+                counter.inc()
+
+    def sink_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-worker delivery stats keyed by sink name (empty in sync mode)."""
+        return {sink.name: sink.stats() for sink in self._sinks if isinstance(sink, SinkWorker)}
 
     def close(self) -> None:
         for sink in self._sinks:
@@ -80,6 +490,16 @@ class MultiSink:
                 close()
 
 
+def _frames_emitted(registry: MetricsRegistry):
+    return registry.counter("autonomy_telemetry_frames_emitted_total", "Frames delivered to each sink", ["sink"])
+
+
+def _frames_dropped(registry: MetricsRegistry):
+    return registry.counter(
+        "autonomy_telemetry_frames_dropped_total", "Frames not delivered to a sink, by reason", ["sink", "reason"]
+    )
+
+
 def world_snapshot(state: WorldState) -> dict:
     return {
         "tick": state.tick,
@@ -111,8 +531,11 @@ def metrics_dict(metrics: EpisodeMetrics, recent_success_rate: Optional[float])
         "success": metrics.success,
         "retries": metrics.retries,
         "replans": metrics.replans,
+        "timeouts": metrics.timeouts,
         "steps_executed": metrics.steps_executed,
         "duration_s": round(metrics.duration_s, 3),
         "fail_reason": metrics.fail_reason,
+        "last_step_ms": round(metrics.last_step_ms, 3),
+        "avg_step_ms": round(metrics.total_step_ms / max(metrics.steps_executed, 1), 3),
         "success_rate_last10": None if recent_success_rate is None else round(recent_success_rate, 3),
     }
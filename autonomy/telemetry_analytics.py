@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import re
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+# Group-by keys answered from per-episode fields vs. per-frame counters.
+EPISODE_KEYS = ("fail_reason", "success", "day", "file")
+FRAME_KEYS = ("phase", "action", "error", "error_kind")
+GROUP_KEYS = EPISODE_KEYS + FRAME_KEYS
+
+# Leading fields of a compact TelemetryFrame.to_dict() line, in key order.
+# The plan list and nested world/metrics are skipped without decoding.
+_STR = rb'"((?:[^"\\]|\\.)*)"'
+_HEAD = re.compile(
+    rb'\{"ts_ms":(\d+),"phase":' + _STR + rb',"plan":\[[^\]]*\],"current_action":' + _STR
+    + rb',"retries":\d+,"replans":\d+,"last_error":(null|' + _STR + rb'),"world":'
+)
+_METRICS = b',"metrics":'
+
+
+def scan_file(path: Union[str, Path]) -> Dict[str, Any]:
+    """Per-episode summary of one (optionally gzipped) JSONL telemetry file.
+
+    Only ``ts_ms``, ``phase``, ``current_action`` and ``last_error`` are
+    pulled out of each line with a byte-level pattern; ``metrics`` is decoded
+    only for the episode-closing ``DONE`` frame. Lines that do not match the
+    compact layout fall back to ``json.loads``.
+    """
+    episodes: List[Dict[str, Any]] = []
+    frames = fallbacks = bad = 0
+    phases: Counter = Counter()
+    actions: Counter = Counter()
+    errors: Counter = Counter()
+    first_ts: Optional[int] = None
+
+    with _open_binary(Path(path)) as fh:
+        for raw in fh:
+            line = raw.rstrip(b"\r\n")
+            if not line:
+                continue
+            match = _HEAD.match(line)
+            if match is not None:
+                ts_ms = int(match.group(1))
+                phase = _unescape(match.group(2))
+                action = _unescape(match.group(3))
+                error = None if match.group(4) == b"null" else _unescape(match.group(5))
+            else:
+                try:
+                    record = json.loads(line)
+                    ts_ms = int(record.get("ts_ms", 0))
+                    phase = record.get("phase") or ""
+                    action = record.get("current_action") or ""
+                    error = record.get("last_error")
+                except (ValueError, TypeError, AttributeError):
+                    bad += 1
+                    continue
+                fallbacks += 1
+            frames += 1
+            if first_ts is None:
+                first_ts = ts_ms
+            phases[phase] += 1
+            actions[action.split("(", 1)[0]] += 1
+            if error:
+                errors[error] += 1
+            if action != "DONE":
+                continue
+
+            metrics = _done_metrics(line)
+            episodes.append(
+                {
+                    "start_ts_ms": first_ts,
+                    "end_ts_ms": ts_ms,
+                    "success": bool(metrics.get("success")),
+                    "fail_reason": metrics.get("fail_reason"),
+                    "retries": metrics.get("retries", 0),
+                    "replans": metrics.get("replans", 0),
+                    "steps": metrics.get("steps_executed", 0),
+                    "duration_s": metrics.get("duration_s", 0.0),
+                    "frames": sum(phases.values()),
+                    "phases": dict(phases),
+                    "actions": dict(actions),
+                    "errors": dict(errors),
+                }
+            )
+            phases, actions, errors = Counter(), Counter(), Counter()
+            first_ts = None
+
+    return {
+        "frames": frames,
+        "episodes": episodes,
+        "incomplete_frames": sum(phases.values()),
+        "json_fallbacks": fallbacks,
+        "bad_lines": bad,
+    }
+
+
+class TelemetryIndex:
+    """Persistent per-file scan summaries, reused while a file's size and mtime are unchanged."""
+
+    def __init__(self, path: Optional[Union[str, Path]] = None) -> None:
+        self.path = Path(path) if path else None
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        if self.path is not None and self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                if data.get("version") == INDEX_VERSION:
+                    self._entries = data.get("files", {})
+            except (OSError, ValueError):
+                logger.warning(f"Ignoring unreadable telemetry index {self.path}")
+
+    def lookup(self, path: Path) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(str(path.resolve()))
+        if entry is None:
+            return None
+        stat = path.stat()
+        if entry["size"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns:
+            return None
+        return entry["summary"]
+
+    def store(self, path: Path, stat: os.stat_result, summary: Dict[str, Any]) -> None:
+        self._entries[str(path.resolve())] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "summary": summary,
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        if self.path is None or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps({"version": INDEX_VERSION, "files": self._entries}), encoding="utf-8")
+        tmp.replace(self.path)
+        self._dirty = False
+
+
+def load_summaries(
+    paths: Sequence[Union[str, Path]],
+    index: Optional[TelemetryIndex] = None,
+    workers: int = 0,
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, int]]:
+    """Summaries for ``paths`` (from the index when fresh) plus scan stats."""
+    summaries: Dict[str, Dict[str, Any]] = {}
+    stale: List[Tuple[Path, os.stat_result]] = []
+    for raw in paths:
+        path = Path(raw)
+        cached = index.lookup(path) if index is not None else None
+        if cached is not None:
+            summaries[str(path)] = cached
+        else:
+            # Stat before scanning so a file that grows mid-scan is rescanned next time.
+            stale.append((path, path.stat()))
+
+    workers = workers if workers > 0 else (os.cpu_count() or 1)
+    if len(stale) > 1 and workers > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(stale))) as pool:
+            results = list(pool.map(scan_file, [p for p, _ in stale], chunksize=1))
+    else:
+        results = [scan_file(p) for p, _ in stale]
+
+    for (path, stat), summary in zip(stale, results):
+        summaries[str(path)] = summary
+        if index is not None:
+            index.store(path, stat, summary)
+    return summaries, {"files": len(summaries), "scanned": len(stale), "cached": len(summaries) - len(stale)}
+
+
+def aggregate(
+    summaries: Dict[str, Dict[str, Any]],
+    group_by: str = "fail_reason",
+    since_ms: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Group episodes (or their frames) by ``group_by``; rows sorted by size."""
+    if group_by not in GROUP_KEYS:
+        raise ValueError(f"group_by must be one of {GROUP_KEYS}")
+    groups: Dict[Any, Dict[str, Any]] = defaultdict(
+        lambda: {"episodes": 0, "successes": 0, "frames": 0, "retries": 0, "replans": 0, "duration_s": 0.0}
+    )
+    for file, summary in summaries.items():
+        for ep in summary["episodes"]:
+            if since_ms is not None and ep["end_ts_ms"] < since_ms:
+                continue
+            for key, frames in _episode_keys(file, ep, group_by):
+                row = groups[key]
+                row["episodes"] += 1
+                row["successes"] += 1 if ep["success"] else 0
+                row["frames"] += frames
+                row["retries"] += ep["retries"]
+                row["replans"] += ep["replans"]
+                row["duration_s"] += ep["duration_s"]
+
+    rows = []
+    for key, row in groups.items():
+        n = max(row["episodes"], 1)
+        rows.append(
+            {
+                group_by: key,
+                "episodes": row["episodes"],
+                "frames": row["frames"],
+                "success_rate": round(row["successes"] / n, 3),
+                "mean_retries": round(row["retries"] / n, 2),
+                "mean_replans": round(row["replans"] / n, 2),
+                "mean_duration_s": round(row["duration_s"] / n, 3),
+            }
+        )
+    rows.sort(key=lambda r: (-r["episodes"], -r["frames"], str(r[group_by])))
+    return rows
+
+
+def _episode_keys(file: str, ep: Dict[str, Any], group_by: str) -> Iterable[Tuple[Any, int]]:
+    """(group key, frames contributed) pairs; frame-level keys yield one pair per distinct value."""
+    if group_by == "fail_reason":
+        return [(ep["fail_reason"], ep["frames"])]
+    if group_by == "success":
+        return [(ep["success"], ep["frames"])]
+    if group_by == "day":
+        return [(time.strftime("%Y-%m-%d", time.localtime(ep["end_ts_ms"] / 1000)), ep["frames"])]
+    if group_by == "file":
+        return [(file, ep["frames"])]
+    if group_by == "phase":
+        return ep["phases"].items()
+    if group_by == "action":
+        return ep["actions"].items()
+    if group_by == "error":
+        return ep["errors"].items()
+    kinds: Counter = Counter()
+    for error, count in ep["errors"].items():
+        kinds[error.split(":", 1)[0]] += count
+    return kinds.items()
+
+
+def _done_metrics(line: bytes) -> Dict[str, Any]:
+    idx = line.rfind(_METRICS)
+    if idx >= 0:
+        try:
+            return json.loads(line[idx + len(_METRICS) : -1])
+        except ValueError:
+            pass
+    try:
+        return json.loads(line).get("metrics") or {}
+    except ValueError:
+        return {}
+
+
+def _unescape(raw: bytes) -> str:
+    if b"\\" not in raw:
+        return raw.decode("utf-8")
+    return json.loads(b'"' + raw + b'"')
+
+
+def _open_binary(path: Path) -> IO[bytes]:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rb")
+    return path.open("rb")
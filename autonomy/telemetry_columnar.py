@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import mmap
+import shutil
+import struct
+import tempfile
+from array import array
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from autonomy.types import TelemetryFrame
+
+logger = logging.getLogger(__name__)
+
+# File layout: MAGIC | column blocks (8-byte aligned) | JSON footer | footer length (u64) | MAGIC
+MAGIC = b"T1TCOL01"
+_TRAILER = struct.Struct("<Q8s")
+
+NO_STRING = -1
+JOINTS = 6
+
+# name -> (array typecode, numpy dtype, values per row)
+COLUMNS: Dict[str, Tuple[str, str, int]] = {
+    "tick": ("i", "<i4", 1),
+    "ts_ms": ("q", "<i8", 1),
+    "episode": ("I", "<u4", 1),
+    "phase": ("i", "<i4", 1),
+    "action": ("i", "<i4", 1),
+    "error": ("i", "<i4", 1),
+    "retries": ("H", "<u2", 1),
+    "replans": ("H", "<u2", 1),
+    "success": ("B", "u1", 1),
+    "fail_reason": ("i", "<i4", 1),
+    "gripper": ("i", "<i4", 1),
+    "battery": ("f", "<f4", 1),
+    "temperature": ("f", "<f4", 1),
+    "joint_positions": ("f", "<f4", JOINTS),
+    "joint_velocities": ("f", "<f4", JOINTS),
+}
+
+
+class ColumnarTelemetryWriter:
+    """Accumulates frames column-wise and writes a columnar file on close.
+
+    Strings (phases, actions, errors, fail reasons, gripper states) are
+    interned into one table and stored as int32 ids; episodes are indexed
+    by row range, split after each ``DONE`` frame. After every episode the
+    buffered rows are appended to one temp file per column, so memory stays
+    bounded by the longest episode; ``close`` concatenates them.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self._columns: Dict[str, array] = {name: array(code) for name, (code, _, _) in COLUMNS.items()}
+        self._spill: Dict[str, IO[bytes]] = {}
+        self._strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+        self._episodes: List[List[int]] = []
+        self._episode_start = 0
+        self._rows = 0
+        self._closed = False
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def emit(self, frame: TelemetryFrame) -> None:
+        self.append(
+            {
+                "ts_ms": frame.ts_ms,
+                "phase": frame.phase,
+                "current_action": frame.current_action,
+                "retries": frame.retries,
+                "replans": frame.replans,
+                "last_error": frame.last_error,
+                "world": frame.world,
+                "metrics": frame.metrics,
+            }
+        )
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append one frame in ``TelemetryFrame.to_dict()`` shape."""
+        world = record.get("world") or {}
+        robot = world.get("robot_state") or {}
+        metrics = record.get("metrics") or {}
+        cols = self._columns
+        cols["tick"].append(int(world.get("tick", 0)))
+        cols["ts_ms"].append(int(record.get("ts_ms", 0)))
+        cols["episode"].append(len(self._episodes))
+        cols["phase"].append(self._intern(record.get("phase")))
+        cols["action"].append(self._intern(record.get("current_action")))
+        cols["error"].append(self._intern(record.get("last_error")))
+        cols["retries"].append(min(int(record.get("retries", 0)), 0xFFFF))
+        cols["replans"].append(min(int(record.get("replans", 0)), 0xFFFF))
+        cols["success"].append(1 if metrics.get("success") else 0)
+        cols["fail_reason"].append(self._intern(metrics.get("fail_reason")))
+        cols["gripper"].append(self._intern(robot.get("gripper_state")))
+        cols["battery"].append(float(robot.get("battery_level", 0.0)))
+        cols["temperature"].append(float(robot.get("temperature", 0.0)))
+        cols["joint_positions"].extend(_fixed(robot.get("joint_positions")))
+        cols["joint_velocities"].extend(_fixed(robot.get("joint_velocities")))
+        self._rows += 1
+        if record.get("current_action") == "DONE":
+            self._episodes.append([self._episode_start, self._rows])
+            self._episode_start = self._rows
+            self._flush_columns()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        episodes = list(self._episodes)
+        if self._episode_start < self._rows:
+            episodes.append([self._episode_start, self._rows])
+        self._flush_columns()
+
+        layout: Dict[str, Dict[str, Any]] = {}
+        with self.path.open("wb") as fh:
+            fh.write(MAGIC)
+            offset = len(MAGIC)
+            for name, (_, dtype, width) in COLUMNS.items():
+                pad = (-offset) % 8
+                fh.write(b"\0" * pad)
+                offset += pad
+                spill = self._spill[name]
+                size = spill.tell()
+                spill.seek(0)
+                shutil.copyfileobj(spill, fh)
+                spill.close()
+                layout[name] = {"dtype": dtype, "width": width, "offset": offset}
+                offset += size
+            footer = json.dumps(
+                {"rows": self._rows, "columns": layout, "strings": self._strings, "episodes": episodes},
+                separators=(",", ":"),
+            ).encode("utf-8")
+            fh.write(footer)
+            fh.write(_TRAILER.pack(len(footer), MAGIC))
+
+    def _flush_columns(self) -> None:
+        if not self._spill:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._spill = {name: tempfile.TemporaryFile(dir=self.path.parent) for name in COLUMNS}
+        for name, (code, dtype, _) in COLUMNS.items():
+            self._spill[name].write(np.asarray(self._columns[name]).astype(dtype).tobytes())
+            self._columns[name] = array(code)
+
+    def _intern(self, value: Optional[str]) -> int:
+        if value is None:
+            return NO_STRING
+        sid = self._string_ids.get(value)
+        if sid is None:
+            sid = len(self._strings)
+            self._strings.append(value)
+            self._string_ids[value] = sid
+        return sid
+
+
+class ColumnarTelemetryReader:
+    """Memory-mapped reader returning zero-copy NumPy views per column."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self._fh = self.path.open("rb")
+        self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        footer_len, magic = _TRAILER.unpack_from(self._mm, len(self._mm) - _TRAILER.size)
+        if magic != MAGIC or self._mm[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"{self.path} is not a columnar telemetry file")
+        footer_start = len(self._mm) - _TRAILER.size - footer_len
+        footer = json.loads(self._mm[footer_start : footer_start + footer_len])
+        self.rows: int = footer["rows"]
+        self.strings: List[str] = footer["strings"]
+        self.episodes: List[Tuple[int, int]] = [tuple(e) for e in footer["episodes"]]
+        self._layout: Dict[str, Dict[str, Any]] = footer["columns"]
+        self._views: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __enter__(self) -> ColumnarTelemetryReader:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.column(name)
+
+    @property
+    def column_names(self) -> List[str]:
+        return list(self._layout)
+
+    def column(self, name: str) -> np.ndarray:
+        view = self._views.get(name)
+        if view is None:
+            spec = self._layout[name]
+            width = spec["width"]
+            view = np.frombuffer(self._mm, dtype=spec["dtype"], count=self.rows * width, offset=spec["offset"])
+            if width > 1:
+                view = view.reshape(self.rows, width)
+            self._views[name] = view
+        return view
+
+    def string(self, sid: int) -> Optional[str]:
+        return None if sid == NO_STRING else self.strings[sid]
+
+    def string_ids(self, prefix: str) -> np.ndarray:
+        """Ids of all interned strings starting with ``prefix``."""
+        return np.array([i for i, s in enumerate(self.strings) if s.startswith(prefix)], dtype=np.int32)
+
+    def mask(self, name: str, prefix: str) -> np.ndarray:
+        """Boolean row mask where string column ``name`` starts with ``prefix``."""
+        return np.isin(self.column(name), self.string_ids(prefix))
+
+    def counts(self, name: str, rows: Optional[np.ndarray] = None) -> Dict[Optional[str], int]:
+        """Occurrences of each string in column ``name`` (optionally for a row mask)."""
+        ids = self.column(name) if rows is None else self.column(name)[rows]
+        shifted = np.bincount(ids.astype(np.int64) - NO_STRING, minlength=1)
+        return {self.string(int(i) + NO_STRING): int(n) for i, n in enumerate(shifted) if n}
+
+    def episode(self, index: int) -> Dict[str, np.ndarray]:
+        start, end = self.episodes[index]
+        return {name: self.column(name)[start:end] for name in self._layout}
+
+    def iter_episodes(self) -> Iterator[Dict[str, np.ndarray]]:
+        for index in range(len(self.episodes)):
+            yield self.episode(index)
+
+    def close(self) -> None:
+        self._views.clear()
+        try:
+            self._mm.close()
+        except BufferError:
+            logger.warning(f"{self.path}: column views still referenced; the mapping stays open until they are freed")
+        self._fh.close()
+
+
+def jsonl_to_columnar(src: Union[str, Path], dst: Union[str, Path]) -> int:
+    """Convert a (optionally gzipped) JSONL telemetry file; returns rows written."""
+    writer = ColumnarTelemetryWriter(dst)
+    with _open_text(Path(src)) as fh:
+        for line in fh:
+            line = line.strip()
+            if line:
+                writer.append(json.loads(line))
+    writer.close()
+    return len(writer)
+
+
+def _open_text(path: Path) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    return path.open("r", encoding="utf-8")
+
+
+def _fixed(values: Optional[List[float]]) -> List[float]:
+    values = list(values or [])[:JOINTS]
+    return values + [0.0] * (JOINTS - len(values))
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+# Wire format (JSON objects):
+#   keyframe: {"t": "k", "s": seq, "f": <full frame dict>}
+#   delta:    {"t": "d", "s": seq, "b": base_seq, "p": <patch>}
+#
+# A patch mirrors the frame's shape and only contains what changed:
+#   - a non-dict value replaces the node (scalars, whole lists);
+#   - {"=": value} replaces the node with a dict (new or restructured subtrees);
+#   - any other dict patches children by key; "-": [keys] removes dict keys.
+# When the patched node is a list, child keys are indices, "@<id>" for the
+# element whose "id" is <id>, or "#order" giving the new id sequence of a
+# keyed list (new ids are then filled by their "@<id>" entries). Dict keys
+# that collide with "=", "-" or start with "\" are prefixed with "\".
+# Mirrored in livekit/telemetry_delta.js and web/app/lib/telemetryDelta.ts.
+KEYFRAME = "k"
+DELTA = "d"
+REPLACE = "="
+REMOVE = "-"
+ORDER = "#order"
+
+_UNCHANGED = object()
+
+
+class DeltaEncoder:
+    """Encodes successive frame dicts as periodic keyframes plus field deltas.
+
+    Payloads must not be mutated after they are passed to ``encode`` since
+    the previous one is kept by reference as the diff base.
+    """
+
+    def __init__(self, keyframe_interval: int = 30) -> None:
+        self.keyframe_interval = max(1, keyframe_interval)
+        self._seq = 0
+        self._since_key = 0
+        self._prev: Optional[Dict[str, Any]] = None
+
+    def reset(self) -> None:
+        """Force the next message to be a keyframe (e.g. a new subscriber)."""
+        self._prev = None
+
+    def encode(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        seq = self._seq
+        self._seq += 1
+        prev = self._prev
+        self._prev = payload
+        if prev is None or self._since_key + 1 >= self.keyframe_interval:
+            self._since_key = 0
+            return {"t": KEYFRAME, "s": seq, "f": payload}
+
+        self._since_key += 1
+        patch = _diff(prev, payload)
+        return {"t": DELTA, "s": seq, "b": seq - 1, "p": {} if patch is _UNCHANGED else patch}
+
+
+class DeltaDecoder:
+    """Rebuilds full frames from keyframe/delta messages.
+
+    Returns ``None`` for deltas that do not follow the last decoded frame
+    (lost or reordered packets), or that reference list elements the frame
+    does not have, until the next keyframe arrives. Returned
+    frames share unchanged sub-objects with the previous frame.
+    """
+
+    def __init__(self) -> None:
+        self._state: Optional[Dict[str, Any]] = None
+        self._seq: Optional[int] = None
+        self.keyframes = 0
+        self.deltas = 0
+        self.gaps = 0
+
+    def decode(self, msg: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        kind = msg.get("t")
+        if kind == KEYFRAME:
+            self._state = msg["f"]
+            self._seq = msg["s"]
+            self.keyframes += 1
+            return self._state
+        if kind != DELTA:
+            # Plain, unencoded frame.
+            return msg
+        if self._state is None or msg.get("b") != self._seq:
+            self.gaps += 1
+            self._state = None
+            return None
+        try:
+            self._state = apply_patch(self._state, msg.get("p", {}))
+        except ValueError:
+            # Decoder state diverged from the encoder's.
+            self.gaps += 1
+            self._state = None
+            return None
+        self._seq = msg["s"]
+        self.deltas += 1
+        return self._state
+
+
+def apply_patch(node: Any, patch: Any) -> Any:
+    """Return ``node`` with ``patch`` applied; untouched children are shared.
+
+    Raises ``ValueError`` for an ``@<id>`` key naming an element the list does not have.
+    """
+    if not isinstance(patch, dict):
+        return patch
+    if REPLACE in patch:
+        return patch[REPLACE]
+    if isinstance(node, list):
+        out_list = list(node)
+        if ORDER in patch:
+            by_id = {el.get("id"): el for el in node if isinstance(el, dict)}
+            out_list = [by_id.get(obj_id, {"id": obj_id}) for obj_id in patch[ORDER]]
+        positions = None
+        for key, sub in patch.items():
+            if key == ORDER:
+                continue
+            if key.startswith("@"):
+                if positions is None:
+                    positions = {el.get("id"): i for i, el in enumerate(out_list) if isinstance(el, dict)}
+                idx = positions.get(key[1:])
+                if idx is None:
+                    raise ValueError(f"patch references unknown list element id {key[1:]!r}")
+            else:
+                idx = int(key)
+            out_list[idx] = apply_patch(out_list[idx], sub)
+        return out_list
+
+    out = dict(node) if isinstance(node, dict) else {}
+    for key in patch.get(REMOVE, ()):
+        out.pop(key, None)
+    for key, sub in patch.items():
+        if key == REMOVE:
+            continue
+        real = _unescape(key)
+        out[real] = apply_patch(out.get(real), sub)
+    return out
+
+
+def _diff(old: Any, new: Any) -> Any:
+    if isinstance(old, dict) and isinstance(new, dict):
+        patch: Dict[str, Any] = {}
+        for key, value in new.items():
+            if key not in old:
+                patch[_escape(key)] = _wrap(value)
+                continue
+            sub = _diff(old[key], value)
+            if sub is not _UNCHANGED:
+                patch[_escape(key)] = sub
+        gone = [key for key in old if key not in new]
+        if gone:
+            patch[REMOVE] = gone
+        return patch or _UNCHANGED
+
+    if isinstance(old, list) and isinstance(new, list):
+        old_ids = _ids(old)
+        new_ids = _ids(new) if old_ids is not None else None
+        if old_ids is not None and new_ids is not None:
+            return _diff_keyed(old, new, old_ids, new_ids)
+        if len(old) != len(new):
+            return new
+        patch = {}
+        for idx, (a, b) in enumerate(zip(old, new)):
+            sub = _diff(a, b)
+            if sub is not _UNCHANGED:
+                patch[str(idx)] = sub
+        if not patch:
+            return _UNCHANGED
+        # Scalar lists (joints) are cheaper to resend whole once most entries moved.
+        if len(patch) <= len(new) // 2 or not _scalars(new):
+            return patch
+        return new
+
+    if _same(old, new):
+        return _UNCHANGED
+    return _wrap(new)
+
+
+def _diff_keyed(
+    old: List[Dict[str, Any]],
+    new: List[Dict[str, Any]],
+    old_ids: List[str],
+    new_ids: List[str],
+) -> Any:
+    """Diff lists of ``{"id": ...}`` dicts by id so insertions do not shift every element."""
+    patch: Dict[str, Any] = {}
+    if old_ids != new_ids:
+        patch[ORDER] = new_ids
+    previous = dict(zip(old_ids, old))
+    for obj_id, element in zip(new_ids, new):
+        before = previous.get(obj_id)
+        sub = {REPLACE: element} if before is None else _diff(before, element)
+        if sub is not _UNCHANGED:
+            patch["@" + obj_id] = sub
+    return patch or _UNCHANGED
+
+
+def _ids(values: List[Any]) -> Optional[List[str]]:
+    """Element ids if ``values`` is a non-empty list of dicts with unique string ids."""
+    if not values:
+        return None
+    ids = []
+    for value in values:
+        if not isinstance(value, dict) or not isinstance(value.get("id"), str):
+            return None
+        ids.append(value["id"])
+    return ids if len(set(ids)) == len(ids) else None
+
+
+def _same(a: Any, b: Any) -> bool:
+    # Compare types too so True -> 1 or 1 -> 1.0 still count as changes.
+    return type(a) is type(b) and a == b
+
+
+def _scalars(values: List[Any]) -> bool:
+    return not any(isinstance(v, (dict, list)) for v in values)
+
+
+def _wrap(value: Any) -> Any:
+    return {REPLACE: value} if isinstance(value, dict) else value
+
+
+def _escape(key: str) -> str:
+    if key in (REPLACE, REMOVE) or key.startswith("\\"):
+        return "\\" + key
+    return key
+
+
+def _unescape(key: str) -> str:
+    return key[1:] if key.startswith("\\") else key
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+from json.encoder import encode_basestring_ascii as _str
+from typing import Any, Optional
+
+try:  # Optional fast path; output is equivalent compact JSON.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+HAVE_ORJSON = orjson is not None
+# numpy scalars show up whenever perception feeds numpy positions through ``round``.
+_ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if orjson is not None else 0
+
+_compact = json.JSONEncoder(separators=(",", ":")).encode
+_CONST = {True: "true", False: "false", None: "null"}
+
+# Key layout produced by ``telemetry.world_snapshot``; anything else takes the generic path.
+_WORLD_KEYS = {"tick", "held_object_id", "last_error", "objects", "robot_state"}
+_OBJECT_KEYS = {"id", "cls", "confidence", "visible", "in_bin", "position"}
+_OBJECT = '{"id":%s,"cls":%s,"confidence":%r,"visible":%s,"in_bin":%s,"position":[%r,%r,%r]}'
+_FRAME = (
+    '{"ts_ms":%d,"phase":%s,"plan":%s,"current_action":%s,"retries":%d,"replans":%d,'
+    '"last_error":%s,"world":%s,"metrics":%s}'
+)
+
+
+def dumps(payload: Any) -> bytes:
+    """Compact JSON bytes for any JSON-compatible payload."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=_ORJSON_OPTIONS)
+    return _compact(payload).encode("utf-8")
+
+
+def encode_frame(frame: Any, use_orjson: Optional[bool] = None) -> bytes:
+    """Compact JSON bytes for a ``TelemetryFrame``, fields in declaration order.
+
+    Uses orjson when installed (``use_orjson=None``); otherwise the frame
+    is written out field by field, with a dedicated path for the object
+    list of ``world_snapshot`` worlds, which dominates large scenes.
+    """
+    if use_orjson is None:
+        use_orjson = orjson is not None
+    if use_orjson:
+        # orjson walks dataclass fields itself, without to_dict()'s deep copy.
+        return orjson.dumps(frame, option=_ORJSON_OPTIONS)
+    text = _FRAME % (
+        frame.ts_ms,
+        _str(frame.phase),
+        _compact(frame.plan),
+        _str(frame.current_action),
+        frame.retries,
+        frame.replans,
+        _opt_str(frame.last_error),
+        _world(frame.world),
+        _compact(frame.metrics),
+    )
+    return text.encode("utf-8")
+
+
+def _world(world: Any) -> str:
+    if type(world) is not dict or world.keys() != _WORLD_KEYS:
+        return _compact(world)
+    try:
+        objects = ",".join([_object(obj) for obj in world["objects"]])
+    except (KeyError, TypeError, ValueError):
+        return _compact(world)
+    return '{"tick":%s,"held_object_id":%s,"last_error":%s,"objects":[%s],"robot_state":%s}' % (
+        _compact(world["tick"]),
+        _opt_str(world["held_object_id"]),
+        _opt_str(world["last_error"]),
+        objects,
+        _compact(world["robot_state"]),
+    )
+
+
+def _object(obj: dict) -> str:
+    if obj.keys() != _OBJECT_KEYS:
+        raise KeyError("unexpected object layout")
+    # float() keeps numpy scalars from repr-ing as ``np.float64(...)``.
+    confidence = float(obj["confidence"])
+    x, y, z = (float(v) for v in obj["position"])
+    total = confidence + x + y + z
+    if total - total != 0.0:
+        # NaN/inf repr as bare ``nan``/``inf``, which is not JSON; json.dumps writes NaN/Infinity.
+        raise ValueError("non-finite object value")
+    return _OBJECT % (
+        _str(obj["id"]),
+        _str(obj["cls"]),
+        confidence,
+        _CONST[obj["visible"]],
+        _CONST[obj["in_bin"]],
+        x,
+        y,
+        z,
+    )
+
+
+def _opt_str(value: Optional[str]) -> str:
+    return "null" if value is None else _str(value)
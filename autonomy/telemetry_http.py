@@ -1,35 +1,226 @@
 from __future__ import annotations
 
+import gzip
 import json
+import os
+import re
 import threading
+import time
 from collections import deque
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
-from typing import Any, Deque, Dict, Optional
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
 from urllib.parse import parse_qs, urlparse
 
+from autonomy.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from autonomy.metrics import REGISTRY, MetricsRegistry
+from autonomy.telemetry_encode import dumps
+from autonomy.types import TelemetryFrame
+
+# (seq, JSON-encoded frame)
+Entry = Tuple[int, bytes]
+
+_ROUTES = ("/health", "/latest", "/history", "/stream", "/metrics", "/robots")
+_ROBOT_ROUTES = ("/latest", "/history", "/stream")
+_ROBOT_ID = re.compile(r"^[A-Za-z0-9_.-]{1,64}$")
+
+
+class _StreamClient:
+    """Bounded per-connection queue; the oldest frames go first when full."""
+
+    def __init__(self, queue_size: int) -> None:
+        self.queue: Deque[Entry] = deque(maxlen=queue_size)
+        self.dropped = 0
+
+    def push(self, seq: int, body: bytes) -> None:
+        if len(self.queue) == self.queue.maxlen:
+            self.dropped += 1
+        self.queue.append((seq, body))
+
+
+class _Channel:
+    """Frames published under one robot id (``""`` is the root feed)."""
+
+    def __init__(self, history_limit: int) -> None:
+        self.history: Deque[Entry] = deque(maxlen=history_limit)
+        self.latest: bytes = b"{}"
+        self.latest_gz: Optional[bytes] = None
+        self.seq = 0
+        self.updated = 0.0
+        self.clients: Set[_StreamClient] = set()
+
+
+class _FeedServer(ThreadingHTTPServer):
+    # Stream handlers block for the life of the connection; never join them on exit.
+    daemon_threads = True
+    # The stdlib default backlog of 5 makes bursts of dashboard clients wait
+    # out SYN retransmits (~1 s) before they are accepted.
+    request_queue_size = 128
+
 
 class TelemetryHttpFeed:
     """Very small HTTP feed for dashboards and robot publisher pages.
 
+    Frames are JSON-encoded once in ``update``; every endpoint serves those
+    cached bytes.
+
     Endpoints:
     - GET /health
-    - GET /latest
-    - GET /history?limit=100
+    - GET /latest  ``ETag`` per frame; ``If-None-Match`` gets a 304.
+    - GET /history?limit=100[&since=<seq>]  Without ``since``: the newest
+      ``limit`` frames. With ``since``: up to ``limit`` frames after that
+      sequence number, oldest first. ``X-Next-Since`` carries the cursor
+      for the next page.
+    - GET /metrics  Prometheus text exposition of ``registry``.
+    - GET /stream  Server-Sent Events, one ``id: <seq>`` event per frame.
+      Reconnecting clients resume from ``Last-Event-ID`` (header or
+      ``?last_event_id=``) using the history buffer; each client has a
+      bounded queue that drops its oldest frames if it falls behind.
+    - GET /robots  Robot ids published with ``robot_id`` (see below).
+    - GET /robots/<id>/latest, /history, /stream  The endpoints above for
+      one robot's frames. Each robot has its own sequence numbers and
+      history buffer; frames published without ``robot_id`` go to the
+      root endpoints.
+
+    JSON responses of at least ``gzip_min_bytes`` are gzipped for clients
+    sending ``Accept-Encoding: gzip`` (``gzip_min_bytes=0`` disables this).
     """
 
-    def __init__(self, host: str = "127.0.0.1", port: int = 8765, history_limit: int = 1000) -> None:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        history_limit: int = 1000,
+        stream_queue_size: int = 256,
+        heartbeat_s: float = 15.0,
+        gzip_min_bytes: int = 1024,
+        registry: MetricsRegistry = REGISTRY,
+    ) -> None:
         self.host = host
         self.port = port
-        self._history: Deque[Dict[str, Any]] = deque(maxlen=history_limit)
-        self._latest: Dict[str, Any] = {}
+        self.stream_queue_size = stream_queue_size
+        self.heartbeat_s = heartbeat_s
+        self.gzip_min_bytes = gzip_min_bytes
+        self.registry = registry
+        self._request_seconds = registry.histogram(
+            "autonomy_http_request_seconds", "Telemetry feed request latency (excluding /stream)", ["path"]
+        )
+        self.history_limit = history_limit
+        self._channels: Dict[str, _Channel] = {"": _Channel(history_limit)}
+        # ETags must not repeat across feed restarts that reset the sequence numbers.
+        self._etag_prefix = os.urandom(4).hex()
         self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._stream_dropped = 0
+        self._stopping = False
         self._server: Optional[ThreadingHTTPServer] = None
         self._thread: Optional[threading.Thread] = None
 
-    def update(self, payload: Dict[str, Any]) -> None:
+    def update(self, payload: Dict[str, Any], robot_id: str = "") -> None:
+        self.update_bytes(dumps(payload), robot_id)
+
+    def update_frame(self, frame: TelemetryFrame, robot_id: str = "") -> None:
+        """Publish a frame, reusing its cached JSON encoding."""
+        self.update_bytes(frame.to_json(), robot_id)
+
+    def update_bytes(self, body: bytes, robot_id: str = "") -> None:
+        """Publish an already JSON-encoded frame (under ``/robots/<robot_id>/`` if given)."""
+        with self._lock:
+            channel = self._channels.get(robot_id)
+            if channel is None:
+                if not _ROBOT_ID.match(robot_id):
+                    raise ValueError(f"invalid robot id {robot_id!r}")
+                channel = self._channels[robot_id] = _Channel(self.history_limit)
+            channel.seq += 1
+            channel.latest = body
+            channel.latest_gz = None
+            channel.updated = time.time()
+            channel.history.append((channel.seq, body))
+            for client in channel.clients:
+                client.push(channel.seq, body)
+            if channel.clients:
+                self._changed.notify_all()
+
+    def stream_stats(self) -> Dict[str, int]:
+        with self._lock:
+            clients = [c for channel in self._channels.values() for c in channel.clients]
+            dropped = self._stream_dropped + sum(c.dropped for c in clients)
+            return {"clients": len(clients), "dropped": dropped, "seq": self._channels[""].seq}
+
+    def robots(self) -> Dict[str, Dict[str, Any]]:
+        """Per-robot sequence number and seconds since the last frame."""
+        now = time.time()
+        with self._lock:
+            return {
+                robot_id: {"seq": channel.seq, "age_s": round(now - channel.updated, 3)}
+                for robot_id, channel in sorted(self._channels.items())
+                if robot_id
+            }
+
+    def _channel(self, robot_id: str) -> Optional[_Channel]:
+        with self._lock:
+            return self._channels.get(robot_id)
+
+    def _etag(self, channel_id: str, seq: int) -> str:
+        if channel_id:
+            return f'"{self._etag_prefix}-{channel_id}-{seq}"'
+        return f'"{self._etag_prefix}-{seq}"'
+
+    def _history_page(self, channel: _Channel, limit: int, since: Optional[int]) -> Tuple[List[bytes], int]:
+        """Frames for a /history request plus the next ``since`` cursor.
+
+        Sequence numbers in the buffer are contiguous, so the start index is
+        computed directly and only the requested slice is walked, from
+        whichever end of the deque is closer.
+        """
         with self._lock:
-            self._latest = payload
-            self._history.append(payload)
+            history = channel.history
+            size = len(history)
+            if size == 0:
+                return [], since if since is not None else channel.seq
+            first = history[0][0]
+            if since is None:
+                start = max(0, size - limit)
+            else:
+                start = min(size, max(0, since + 1 - first))
+            stop = min(size, start + limit)
+            if stop <= start:
+                # Caught up (or a cursor from before a feed restart): resume from the newest frame.
+                return [], channel.seq
+            if start <= size - stop:
+                page = list(islice(history, start, stop))
+            else:
+                page = list(islice(reversed(history), size - stop, size - start))
+                page.reverse()
+        return [body for _, body in page], page[-1][0]
+
+    def _subscribe(self, channel: _Channel, last_event_id: Optional[int]) -> _StreamClient:
+        client = _StreamClient(self.stream_queue_size)
+        with self._lock:
+            if last_event_id is not None:
+                for seq, body in channel.history:
+                    if seq > last_event_id:
+                        client.push(seq, body)
+            elif channel.seq:
+                client.push(channel.seq, channel.latest)
+            channel.clients.add(client)
+        return client
+
+    def _unsubscribe(self, channel: _Channel, client: _StreamClient) -> None:
+        with self._lock:
+            channel.clients.discard(client)
+            self._stream_dropped += client.dropped
+
+    def _next_batch(self, client: _StreamClient) -> Optional[List[Entry]]:
+        """Wait up to ``heartbeat_s`` for frames; ``None`` once the feed stops."""
+        with self._changed:
+            # Updates to other robots' channels wake every stream; keep waiting for our own.
+            self._changed.wait_for(lambda: client.queue or self._stopping, self.heartbeat_s)
+            if self._stopping:
+                return None
+            batch = list(client.queue)
+            client.queue.clear()
+        return batch
 
     def start(self) -> None:
         if self._server is not None:
@@ -44,63 +235,183 @@ class TelemetryHttpFeed:
                 self.end_headers()
 
             def do_GET(self) -> None:  # noqa: N802
+                start = time.perf_counter()
                 parsed = urlparse(self.path)
                 path = parsed.path
+                robot_id = ""
+                if path.startswith("/robots/"):
+                    robot_id, _, rest = path[len("/robots/"):].partition("/")
+                    path = "/" + rest
+                    label = f"/robots/*{path}" if path in _ROBOT_ROUTES else "other"
+                    self._route_robot(robot_id, path, parsed.query)
+                else:
+                    label = path if path in _ROUTES else "other"
+                    self._route(path, parsed.query)
+                if path != "/stream":
+                    feed._request_seconds.labels(label).observe(time.perf_counter() - start)
+
+            def _route_robot(self, robot_id: str, path: str, raw_query: str) -> None:
+                channel = feed._channel(robot_id) if robot_id else None
+                if channel is None or path not in _ROBOT_ROUTES:
+                    self._respond_json(
+                        {"message": "Unknown robot or endpoint", "robots": list(feed.robots())}, status=404
+                    )
+                    return
+                self._channel_route(robot_id, channel, path, raw_query)
+
+            def _route(self, path: str, raw_query: str) -> None:
+                if path in _ROBOT_ROUTES:
+                    self._channel_route("", feed._channels[""], path, raw_query)
+                    return
+
+                if path == "/robots":
+                    self._respond_json({"robots": feed.robots()})
+                    return
 
                 if path == "/health":
                     self._respond_json({"ok": True})
                     return
 
+                if path == "/metrics":
+                    body = feed.registry.exposition().encode("utf-8")
+                    self._respond_body(body, content_type=METRICS_CONTENT_TYPE)
+                    return
+
+                self._respond_json(
+                    {
+                        "message": "Telemetry feed",
+                        "endpoints": list(_ROUTES),
+                    },
+                    status=404,
+                )
+
+            def _channel_route(self, channel_id: str, channel: _Channel, path: str, raw_query: str) -> None:
                 if path == "/latest":
-                    with feed._lock:
-                        payload = dict(feed._latest)
-                    self._respond_json(payload)
+                    self._latest(channel_id, channel)
+                    return
+
+                if path == "/stream":
+                    self._stream(channel, parse_qs(raw_query))
                     return
 
                 if path == "/history":
-                    query = parse_qs(parsed.query)
+                    query = parse_qs(raw_query)
                     try:
                         limit = int(query.get("limit", [100])[0])
                     except ValueError:
                         limit = 100
                     limit = max(1, min(5000, limit))
-                    with feed._lock:
-                        payload = list(feed._history)[-limit:]
-                    self._respond_json(payload)
+                    try:
+                        since = int(query["since"][0]) if "since" in query else None
+                    except ValueError:
+                        since = None
+                    bodies, next_since = feed._history_page(channel, limit, since)
+                    self._respond_body(
+                        b"[" + b",".join(bodies) + b"]",
+                        headers={"X-Next-Since": str(next_since)},
+                    )
+
+            def _latest(self, channel_id: str, channel: _Channel) -> None:
+                with feed._lock:
+                    seq, body, body_gz = channel.seq, channel.latest, channel.latest_gz
+                etag = feed._etag(channel_id, seq)
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self._cors_headers()
+                    self.send_header("ETag", etag)
+                    self.end_headers()
                     return
+                if body_gz is None and self._wants_gzip(body):
+                    body_gz = gzip.compress(body, compresslevel=5)
+                    with feed._lock:
+                        if channel.seq == seq:
+                            channel.latest_gz = body_gz
+                self._respond_body(body, headers={"ETag": etag}, body_gz=body_gz)
 
-                self._respond_json(
-                    {
-                        "message": "Telemetry feed",
-                        "endpoints": ["/health", "/latest", "/history?limit=100"],
-                    },
-                    status=404,
-                )
+            def _stream(self, channel: _Channel, query: Dict[str, List[str]]) -> None:
+                raw_id = self.headers.get("Last-Event-ID") or query.get("last_event_id", [None])[0]
+                try:
+                    last_event_id = int(raw_id) if raw_id is not None else None
+                except ValueError:
+                    last_event_id = None
+
+                self.send_response(200)
+                self._cors_headers()
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("X-Accel-Buffering", "no")
+                self.end_headers()
+
+                client = feed._subscribe(channel, last_event_id)
+                try:
+                    self.wfile.write(b"retry: 1000\n\n")
+                    self.wfile.flush()
+                    while True:
+                        batch = feed._next_batch(client)
+                        if batch is None:
+                            break
+                        if not batch:
+                            self.wfile.write(b": keepalive\n\n")
+                        for seq, body in batch:
+                            self.wfile.write(b"id: %d\ndata: %s\n\n" % (seq, body))
+                        self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                finally:
+                    feed._unsubscribe(channel, client)
 
             def _respond_json(self, payload: Any, status: int = 200) -> None:
-                body = json.dumps(payload).encode("utf-8")
+                self._respond_body(json.dumps(payload).encode("utf-8"), status=status)
+
+            def _respond_body(
+                self,
+                body: bytes,
+                status: int = 200,
+                headers: Optional[Dict[str, str]] = None,
+                body_gz: Optional[bytes] = None,
+                content_type: str = "application/json",
+            ) -> None:
+                if body_gz is None and self._wants_gzip(body):
+                    body_gz = gzip.compress(body, compresslevel=5)
+                if body_gz is not None and self._accepts_gzip():
+                    body = body_gz
+                    headers = {**(headers or {}), "Content-Encoding": "gzip"}
                 self.send_response(status)
                 self._cors_headers()
-                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Type", content_type)
                 self.send_header("Content-Length", str(len(body)))
+                self.send_header("Vary", "Accept-Encoding")
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
                 self.end_headers()
                 self.wfile.write(body)
 
+            def _accepts_gzip(self) -> bool:
+                return "gzip" in self.headers.get("Accept-Encoding", "")
+
+            def _wants_gzip(self, body: bytes) -> bool:
+                return 0 < feed.gzip_min_bytes <= len(body) and self._accepts_gzip()
+
             def _cors_headers(self) -> None:
                 self.send_header("Access-Control-Allow-Origin", "*")
                 self.send_header("Access-Control-Allow-Methods", "GET, OPTIONS")
-                self.send_header("Access-Control-Allow-Headers", "Content-Type")
+                self.send_header("Access-Control-Allow-Headers", "Content-Type, If-None-Match, Last-Event-ID")
+                self.send_header("Access-Control-Expose-Headers", "ETag, X-Next-Since")
 
             def log_message(self, format: str, *args: Any) -> None:  # noqa: A003
                 return
 
-        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._stopping = False
+        self._server = _FeedServer((self.host, self.port), Handler)
         self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
         if self._server is None:
             return
+        with self._changed:
+            self._stopping = True
+            self._changed.notify_all()
         self._server.shutdown()
         self._server.server_close()
         self._server = None
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import gzip
+import json
+import re
+import time
+from pathlib import Path
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# (recorded ts_ms, JSON-encoded frame)
+Recorded = Tuple[int, bytes]
+
+_TS_PREFIX = re.compile(rb'^\{"ts_ms":(\d+)')
+
+
+def read_recorded(paths: Union[str, Path, Iterable[Union[str, Path]]]) -> Iterator[Recorded]:
+    """Frames from one or more JSONL(.gz) telemetry files, in file order.
+
+    Compact lines (as written by ``JsonlSink``) are passed through as-is;
+    only their ``ts_ms`` prefix is parsed. Other layouts are re-encoded.
+    """
+    if isinstance(paths, (str, Path)):
+        paths = [paths]
+    for path in paths:
+        with _open_binary(Path(path)) as fh:
+            for raw in fh:
+                line = raw.strip()
+                if not line:
+                    continue
+                match = _TS_PREFIX.match(line)
+                if match is not None:
+                    yield int(match.group(1)), line
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                body = json.dumps(record, separators=(",", ":")).encode("utf-8")
+                yield int(record.get("ts_ms", 0)), body
+
+
+def replay(
+    frames: Iterable[Recorded],
+    publish: Callable[[bytes], None],
+    speed: float = 1.0,
+    max_gap_s: float = 2.0,
+    restamp: bool = True,
+    should_stop: Optional[Callable[[], bool]] = None,
+) -> Dict[str, float]:
+    """Publish recorded frames with their original pacing scaled by ``speed``.
+
+    ``speed=0`` publishes as fast as possible. Gaps longer than ``max_gap_s``
+    (e.g. between recording sessions) are shortened to it. Frames are
+    scheduled against the replay start, so slow publishes do not accumulate
+    drift. With ``restamp`` each frame's ``ts_ms`` is rewritten to the wall
+    clock at publish time, so dashboards and load generators see live data.
+    """
+    start = time.monotonic()
+    offset_s = 0.0
+    prev_ts: Optional[int] = None
+    published = 0
+    max_lag_s = 0.0
+    for ts_ms, body in frames:
+        if should_stop is not None and should_stop():
+            break
+        if speed > 0:
+            if prev_ts is not None:
+                offset_s += min(max(ts_ms - prev_ts, 0) / 1000.0, max_gap_s) / speed
+            delay = start + offset_s - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                max_lag_s = max(max_lag_s, -delay)
+        prev_ts = ts_ms
+        if restamp:
+            body = restamp_frame(body)
+        publish(body)
+        published += 1
+
+    elapsed = time.monotonic() - start
+    return {
+        "frames": published,
+        "elapsed_s": round(elapsed, 3),
+        "fps": round(published / elapsed, 1) if elapsed > 0 else 0.0,
+        "max_lag_ms": round(max_lag_s * 1000.0, 1),
+    }
+
+
+def restamp_frame(body: bytes, ts_ms: Optional[int] = None) -> bytes:
+    """``body`` with its leading ``ts_ms`` replaced (compact frames only)."""
+    ts_ms = int(time.time() * 1000) if ts_ms is None else ts_ms
+    return _TS_PREFIX.sub(b'{"ts_ms":%d' % ts_ms, body, count=1)
+
+
+def load_all(paths: Union[str, Path, Iterable[Union[str, Path]]]) -> List[Recorded]:
+    """Materialize a recording so it can be looped without re-reading files."""
+    return list(read_recorded(paths))
+
+
+def _open_binary(path: Path) -> IO[bytes]:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rb")
+    return path.open("rb")
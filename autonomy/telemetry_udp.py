@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import logging
+import socket
+import struct
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Datagram header (network order):
+#   magic "TU" | version u8 | kind u8 | dgram_seq u32 | frame_seq u32 | ts_ms u64 | part u16 | parts u16
+# FRAMES bodies hold one or more length-prefixed (u32) frames numbered
+# frame_seq, frame_seq + 1, ...; CHUNK bodies hold part ``part`` of ``parts``
+# of the single frame frame_seq.
+HEADER = struct.Struct("!2sBBIIQHH")
+MAGIC = b"TU"
+VERSION = 1
+KIND_FRAMES = 0
+KIND_CHUNK = 1
+_LENGTH = struct.Struct("!I")
+_SEQ_MASK = 0xFFFFFFFF
+# Reorder / duplicate detection window, in datagrams.
+_WINDOW = 4096
+
+# Conservative default: fits typical Ethernet/VPN paths without IP fragmentation.
+DEFAULT_MTU = 1200
+
+
+def _seq_after(a: int, b: int) -> bool:
+    """True if u32 sequence ``a`` comes after ``b`` (wrap-aware)."""
+    return a != b and ((a - b) & _SEQ_MASK) < 0x80000000
+
+
+class UdpFramer:
+    """Packs encoded frames into sequenced datagrams no larger than ``mtu``."""
+
+    def __init__(self, mtu: int = DEFAULT_MTU) -> None:
+        if mtu <= HEADER.size + _LENGTH.size:
+            raise ValueError(f"mtu must exceed {HEADER.size + _LENGTH.size} bytes")
+        self.mtu = mtu
+        self._dgram_seq = 0
+
+    @property
+    def payload_limit(self) -> int:
+        return self.mtu - HEADER.size
+
+    def pack(self, frames: Iterable[Tuple[int, bytes]], ts_ms: Optional[int] = None) -> List[bytes]:
+        """Datagrams for consecutively numbered ``(frame_seq, body)`` pairs.
+
+        Small frames are coalesced into FRAMES datagrams; a frame that does
+        not fit one datagram on its own is split into CHUNK datagrams.
+        """
+        ts_ms = int(time.time() * 1000) if ts_ms is None else ts_ms
+        limit = self.payload_limit
+        out: List[bytes] = []
+        batch: List[bytes] = []
+        batch_seq = 0
+        batch_size = 0
+
+        def flush_batch() -> None:
+            nonlocal batch, batch_size
+            if batch:
+                out.append(self._datagram(KIND_FRAMES, batch_seq, ts_ms, 0, 1, b"".join(batch)))
+                batch, batch_size = [], 0
+
+        for frame_seq, body in frames:
+            entry_size = _LENGTH.size + len(body)
+            if entry_size > limit:
+                flush_batch()
+                parts = -(-len(body) // limit)
+                if parts > 0xFFFF:
+                    logger.warning(f"Dropping {len(body)} byte telemetry frame: too large for UDP chunking")
+                    continue
+                for part in range(parts):
+                    chunk = body[part * limit : (part + 1) * limit]
+                    out.append(self._datagram(KIND_CHUNK, frame_seq, ts_ms, part, parts, chunk))
+                continue
+            if batch and batch_size + entry_size > limit:
+                flush_batch()
+            if not batch:
+                batch_seq = frame_seq
+            batch.append(_LENGTH.pack(len(body)) + body)
+            batch_size += entry_size
+        flush_batch()
+        return out
+
+    def _datagram(self, kind: int, frame_seq: int, ts_ms: int, part: int, parts: int, body: bytes) -> bytes:
+        header = HEADER.pack(MAGIC, VERSION, kind, self._dgram_seq, frame_seq & _SEQ_MASK, ts_ms, part, parts)
+        self._dgram_seq = (self._dgram_seq + 1) & _SEQ_MASK
+        return header + body
+
+
+class _Source:
+    """Sequence and reassembly state for one sender address."""
+
+    def __init__(self) -> None:
+        self.highest: Optional[int] = None
+        self.seen: Set[int] = set()
+        self.missing: Set[int] = set()
+        self.partial: Dict[int, Tuple[float, List[Optional[bytes]]]] = {}
+
+    def prune(self) -> None:
+        """Forget sequence numbers more than ``_WINDOW`` behind the highest seen."""
+        highest = self.highest or 0
+        self.seen = {s for s in self.seen if (highest - s) & _SEQ_MASK <= _WINDOW}
+        self.missing = {s for s in self.missing if (highest - s) & _SEQ_MASK <= _WINDOW}
+
+
+class UdpTelemetryReceiver:
+    """Receives framed telemetry datagrams and hands complete frames to ``on_frame``.
+
+    Chunked frames are reassembled (parts may arrive in any order) and
+    abandoned after ``reassembly_timeout_s``. Datagram sequence numbers
+    drive loss / reorder / duplicate statistics. State is kept per sender
+    address, so a restarted sender (new source port) starts a fresh sequence.
+    """
+
+    def __init__(
+        self,
+        on_frame: Callable[[int, bytes], None],
+        host: str = "0.0.0.0",
+        port: int = 9870,
+        reassembly_timeout_s: float = 1.0,
+        recv_buffer_bytes: int = 4 * 1024 * 1024,
+    ) -> None:
+        self.on_frame = on_frame
+        self.host = host
+        self.port = port
+        self.reassembly_timeout_s = reassembly_timeout_s
+        self.datagrams = 0
+        self.bytes = 0
+        self.frames = 0
+        self.lost = 0
+        self.reordered = 0
+        self.duplicates = 0
+        self.malformed = 0
+        self.incomplete = 0
+        self.last_latency_ms = 0.0
+        self._sources: Dict[Any, _Source] = {}
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, recv_buffer_bytes)
+        except OSError:
+            pass
+        self._sock.bind((host, port))
+        self.port = self._sock.getsockname()[1]
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._sock.settimeout(0.2)
+        self._thread = threading.Thread(target=self._run, name="udp-telemetry", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopping = True
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._sock.close()
+
+    def stats(self) -> Dict[str, float]:
+        expected = self.datagrams - self.duplicates + self.lost
+        return {
+            "datagrams": self.datagrams,
+            "bytes": self.bytes,
+            "frames": self.frames,
+            "lost": self.lost,
+            "loss_rate": round(self.lost / max(expected, 1), 4),
+            "reordered": self.reordered,
+            "duplicates": self.duplicates,
+            "malformed": self.malformed,
+            "incomplete": self.incomplete,
+            "senders": len(self._sources),
+            "pending_chunks": sum(len(src.partial) for src in self._sources.values()),
+            "last_latency_ms": round(self.last_latency_ms, 1),
+        }
+
+    def handle(self, datagram: bytes, addr: Any = None) -> None:
+        """Process one datagram (exposed for callers that own the socket loop)."""
+        if len(datagram) < HEADER.size:
+            self.malformed += 1
+            return
+        magic, version, kind, dgram_seq, frame_seq, ts_ms, part, parts = HEADER.unpack_from(datagram)
+        if magic != MAGIC or version != VERSION:
+            self.malformed += 1
+            return
+        self.datagrams += 1
+        self.bytes += len(datagram)
+        source = self._sources.get(addr)
+        if source is None:
+            source = self._sources[addr] = _Source()
+        if not self._track(source, dgram_seq):
+            return
+        self.last_latency_ms = time.time() * 1000 - ts_ms
+        body = memoryview(datagram)[HEADER.size :]
+
+        if kind == KIND_FRAMES:
+            offset = 0
+            seq = frame_seq
+            while offset + _LENGTH.size <= len(body):
+                (length,) = _LENGTH.unpack_from(body, offset)
+                offset += _LENGTH.size
+                if offset + length > len(body):
+                    self.malformed += 1
+                    return
+                self._deliver(seq, bytes(body[offset : offset + length]))
+                offset += length
+                seq = (seq + 1) & _SEQ_MASK
+        elif kind == KIND_CHUNK and parts and part < parts:
+            self._add_chunk(source, frame_seq, part, parts, bytes(body))
+        else:
+            self.malformed += 1
+        self._expire()
+
+    def _track(self, source: _Source, seq: int) -> bool:
+        """Update loss/reorder counters; False for duplicates."""
+        if source.highest is not None and seq in source.seen:
+            self.duplicates += 1
+            return False
+        source.seen.add(seq)
+        if source.highest is None:
+            source.highest = seq
+        elif _seq_after(seq, source.highest):
+            gap = (seq - source.highest - 1) & _SEQ_MASK
+            self.lost += gap
+            if gap <= _WINDOW:
+                source.missing.update((source.highest + i + 1) & _SEQ_MASK for i in range(gap))
+            source.highest = seq
+        else:
+            if seq in source.missing:
+                source.missing.discard(seq)
+                self.lost -= 1
+            self.reordered += 1
+        if len(source.seen) > 2 * _WINDOW:
+            source.prune()
+        return True
+
+    def _add_chunk(self, source: _Source, frame_seq: int, part: int, parts: int, chunk: bytes) -> None:
+        entry = source.partial.get(frame_seq)
+        if entry is None or len(entry[1]) != parts:
+            entry = (time.monotonic(), [None] * parts)
+            source.partial[frame_seq] = entry
+        entry[1][part] = chunk
+        if all(c is not None for c in entry[1]):
+            del source.partial[frame_seq]
+            self._deliver(frame_seq, b"".join(entry[1]))  # type: ignore[arg-type]
+
+    def _expire(self) -> None:
+        cutoff = time.monotonic() - self.reassembly_timeout_s
+        for source in self._sources.values():
+            for frame_seq in [s for s, (first, _) in source.partial.items() if first < cutoff]:
+                del source.partial[frame_seq]
+                self.incomplete += 1
+
+    def _deliver(self, frame_seq: int, body: bytes) -> None:
+        self.frames += 1
+        try:
+            self.on_frame(frame_seq, body)
+        except Exception:
+            logger.exception("UDP telemetry frame handler failed")
+
+    def _run(self) -> None:
+        while not self._stopping:
+            try:
+                datagram, addr = self._sock.recvfrom(65535)
+            except socket.timeout:
+                self._expire()
+                continue
+            except OSError:
+                break
+            self.handle(datagram, addr)
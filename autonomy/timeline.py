@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import threading
+from array import array
+from collections import deque
+from collections.abc import Sequence
+from typing import IO, Deque, Iterable, Iterator, List, Optional, Union, overload
+
+from autonomy.types import TelemetryFrame
+
+_READ_HINT = 1 << 16
+
+
+class BoundedTimeline(Sequence):
+    """Frame sequence that keeps at most ``max_frames`` frames in memory.
+
+    Older frames are appended as JSON lines to an anonymous temporary file
+    (``spill=True``) or discarded (``spill=False``). Iteration and indexing
+    cover spilled frames transparently: spilled frames are read back lazily
+    in blocks and rebuilt as ``TelemetryFrame`` objects. ``max_frames=None``
+    keeps everything in memory, like a plain list.
+    """
+
+    def __init__(self, max_frames: Optional[int] = None, spill: bool = True) -> None:
+        if max_frames is not None and max_frames < 1:
+            raise ValueError("max_frames must be >= 1 (or None for unbounded)")
+        self.max_frames = max_frames
+        self.spill = spill
+        self.dropped = 0
+        self._memory: Deque[TelemetryFrame] = deque()
+        self._offsets = array("Q")
+        self._file: Optional[IO[bytes]] = None
+        self._file_size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def spilled(self) -> int:
+        return len(self._offsets)
+
+    @property
+    def in_memory(self) -> int:
+        return len(self._memory)
+
+    def __len__(self) -> int:
+        return len(self._offsets) + len(self._memory)
+
+    def append(self, frame: TelemetryFrame) -> None:
+        with self._lock:
+            self._memory.append(frame)
+            if self.max_frames is not None and len(self._memory) > self.max_frames:
+                oldest = self._memory.popleft()
+                if self.spill:
+                    self._spill(oldest)
+                else:
+                    self.dropped += 1
+
+    def extend(self, frames: Iterable[TelemetryFrame]) -> None:
+        for frame in frames:
+            self.append(frame)
+
+    @overload
+    def __getitem__(self, index: int) -> TelemetryFrame: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[TelemetryFrame]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[TelemetryFrame, List[TelemetryFrame]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        with self._lock:
+            size = len(self._offsets) + len(self._memory)
+            if index < 0:
+                index += size
+            if not 0 <= index < size:
+                raise IndexError("timeline index out of range")
+            spilled = len(self._offsets)
+            if index >= spilled:
+                return self._memory[index - spilled]
+            return self._read_at(index)
+
+    def __iter__(self) -> Iterator[TelemetryFrame]:
+        idx = 0
+        pos = 0
+        # Spilled prefix: sequential block reads instead of one seek per frame.
+        while True:
+            with self._lock:
+                if idx >= len(self._offsets) or self._file is None:
+                    break
+                self._file.flush()
+                self._file.seek(pos)
+                lines = self._file.readlines(_READ_HINT)
+                self._file.seek(0, 2)
+            for line in lines:
+                if idx >= len(self._offsets):
+                    break
+                pos += len(line)
+                idx += 1
+                yield _decode(line)
+        # In-memory tail; frames that spill meanwhile are still found by index.
+        while idx < len(self):
+            yield self[idx]
+            idx += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._offsets = array("Q")
+            self.dropped = 0
+            self._close_file()
+
+    def close(self) -> None:
+        """Delete the spill file; spilled frames are no longer reachable."""
+        with self._lock:
+            self._close_file()
+
+    def _spill(self, frame: TelemetryFrame) -> None:
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(prefix="timeline-", suffix=".jsonl")
+            self._file_size = 0
+        line = frame.to_json() + b"\n"
+        self._file.write(line)
+        self._offsets.append(self._file_size)
+        self._file_size += len(line)
+
+    def _read_at(self, index: int) -> TelemetryFrame:
+        assert self._file is not None
+        self._file.flush()
+        self._file.seek(self._offsets[index])
+        line = self._file.readline()
+        self._file.seek(0, 2)
+        return _decode(line)
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._file_size = 0
+        self._offsets = array("Q")
+
+
+def _decode(line: bytes) -> TelemetryFrame:
+    return TelemetryFrame(**json.loads(line))
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# SO-ARM100 joint order: 5 arm joints followed by the gripper (radians).
+NUM_JOINTS = 6
+GRIPPER_INDEX = 5
+GRIPPER_OPEN = 1.57
+GRIPPER_CLOSED = 0.0
+
+PROFILES = ("trapezoidal", "jerk_limited")
+
+ScalingFn = Callable[[np.ndarray], Tuple[np.ndarray, np.ndarray]]
+
+
+@dataclass(frozen=True)
+class JointLimits:
+    """Per-joint kinematic limits used for time parameterization."""
+
+    max_velocity: Tuple[float, ...] = (1.5, 1.5, 1.5, 2.0, 2.0, 3.0)
+    max_acceleration: Tuple[float, ...] = (3.0, 3.0, 3.0, 4.0, 4.0, 6.0)
+    max_jerk: Tuple[float, ...] = (30.0, 30.0, 30.0, 40.0, 40.0, 60.0)
+
+
+@dataclass
+class Trajectory:
+    """Time-parameterized joint trajectory sampled at a fixed rate."""
+
+    rate_hz: float
+    times: np.ndarray
+    positions: np.ndarray
+    velocities: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.times.shape[0])
+
+    @property
+    def dt(self) -> float:
+        return 1.0 / self.rate_hz
+
+    @property
+    def duration(self) -> float:
+        return float(self.times[-1]) if len(self) else 0.0
+
+    @property
+    def final(self) -> np.ndarray:
+        return self.positions[-1]
+
+    def velocity_after(self, points: int) -> List[float]:
+        """Commanded joint velocity once ``points`` samples were sent (zero at rest)."""
+        if points <= 0:
+            return [0.0] * self.positions.shape[1]
+        return self.velocities[points - 1].tolist()
+
+
+class TrajectoryPlanner:
+    """Plans synchronized joint-space motions with bounded velocity/acceleration.
+
+    All joints share one time scaling so they start and stop together; the
+    slowest joint (relative to its limits) sets the duration.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[JointLimits] = None,
+        rate_hz: float = 50.0,
+        profile: str = "trapezoidal",
+    ) -> None:
+        if profile not in PROFILES:
+            raise ValueError(f"unknown profile {profile!r}, expected one of {PROFILES}")
+        self.limits = limits or JointLimits()
+        self.rate_hz = rate_hz
+        self.profile = profile
+        self._vmax = np.asarray(self.limits.max_velocity, dtype=float)
+        self._amax = np.asarray(self.limits.max_acceleration, dtype=float)
+        self._jmax = np.asarray(self.limits.max_jerk, dtype=float)
+
+    def plan(
+        self,
+        start: Sequence[float],
+        goal: Sequence[float],
+        profile: Optional[str] = None,
+    ) -> Trajectory:
+        return self.plan_through([start, goal], blend_s=0.0, profile=profile)
+
+    def plan_through(
+        self,
+        waypoints: Sequence[Sequence[float]],
+        blend_s: float = 0.15,
+        profile: Optional[str] = None,
+    ) -> Trajectory:
+        """Plan a motion through ``waypoints`` without stopping at each one.
+
+        Consecutive segments overlap by up to ``blend_s`` seconds and their
+        displacements are superposed, so the arm rounds intermediate waypoints
+        instead of coming to rest on them. Start and final waypoints are hit
+        exactly.
+        """
+        profile = profile or self.profile
+        points = np.asarray(waypoints, dtype=float)
+        if points.ndim != 2 or points.shape[0] < 2:
+            raise ValueError("plan_through needs at least two waypoints")
+
+        segments: List[Tuple[float, float, np.ndarray, ScalingFn]] = []
+        t0 = 0.0
+        prev_duration = 0.0
+        for k in range(points.shape[0] - 1):
+            delta = points[k + 1] - points[k]
+            duration, scaling = self._scaling(np.abs(delta), profile)
+            if segments:
+                t0 -= min(blend_s, prev_duration / 2.0, duration / 2.0)
+            segments.append((t0, duration, delta, scaling))
+            t0 += duration
+            prev_duration = duration
+
+        total = max(t0, 0.0)
+        n = max(2, int(math.ceil(total * self.rate_hz)) + 1)
+        times = np.arange(n, dtype=float) / self.rate_hz
+
+        positions = np.tile(points[0], (n, 1))
+        velocities = np.zeros_like(positions)
+        for seg_start, duration, delta, scaling in segments:
+            if duration <= 0.0:
+                positions += delta
+                continue
+            tau = np.clip((times - seg_start) / duration, 0.0, 1.0)
+            s, sdot = scaling(tau)
+            positions += s[:, None] * delta
+            velocities += sdot[:, None] * delta
+        positions[-1] = points[-1]
+        velocities[-1] = 0.0
+        return Trajectory(rate_hz=self.rate_hz, times=times, positions=positions, velocities=velocities)
+
+    def _scaling(self, distance: np.ndarray, profile: str) -> Tuple[float, ScalingFn]:
+        if not np.any(distance > 1e-9):
+            return 0.0, _hold
+        if profile == "jerk_limited":
+            return self._min_jerk(distance)
+        return self._trapezoid(distance)
+
+    def _trapezoid(self, distance: np.ndarray) -> Tuple[float, ScalingFn]:
+        vmax, amax = self._vmax[: distance.size], self._amax[: distance.size]
+        # Per-joint minimum time: triangular if the cruise speed is never reached.
+        tri = distance <= vmax**2 / amax
+        per_joint = np.where(tri, 2.0 * np.sqrt(distance / amax), distance / vmax + vmax / amax)
+        duration = float(per_joint.max())
+        moving = distance > 1e-9
+        while True:
+            # Longest accel phase that keeps every joint under its velocity limit.
+            ta = float(np.min(duration - distance[moving] / vmax[moving]))
+            ta = min(max(ta, 1e-6), duration / 2.0)
+            if np.all(distance[moving] / (ta * (duration - ta)) <= amax[moving] * (1.0 + 1e-9)):
+                break
+            duration *= 1.05
+
+        cruise = 1.0 / (duration - ta)
+        accel = cruise / ta
+
+        def scaling(tau: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+            t = tau * duration
+            rest = duration - t
+            s = np.where(
+                t < ta,
+                0.5 * accel * t**2,
+                np.where(rest < ta, 1.0 - 0.5 * accel * rest**2, cruise * (t - 0.5 * ta)),
+            )
+            sdot = np.where(t < ta, accel * t, np.where(rest < ta, accel * rest, cruise))
+            return s, sdot
+
+        return duration, scaling
+
+    def _min_jerk(self, distance: np.ndarray) -> Tuple[float, ScalingFn]:
+        vmax = self._vmax[: distance.size]
+        amax = self._amax[: distance.size]
+        jmax = self._jmax[: distance.size]
+        # Peak |v|, |a|, |j| of the quintic 10t^3 - 15t^4 + 6t^5 over duration T.
+        duration = float(
+            np.max(
+                np.maximum.reduce(
+                    [
+                        1.875 * distance / vmax,
+                        np.sqrt(5.7735 * distance / amax),
+                        np.cbrt(60.0 * distance / jmax),
+                    ]
+                )
+            )
+        )
+
+        def scaling(tau: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+            tau2 = tau * tau
+            s = tau2 * tau * (10.0 - 15.0 * tau + 6.0 * tau2)
+            sdot = 30.0 * tau2 * (1.0 - tau) ** 2 / duration
+            return s, sdot
+
+        return duration, scaling
+
+
+def _hold(tau: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    return np.ones_like(tau), np.zeros_like(tau)
+
+
+@dataclass
+class StreamStats:
+    points: int = 0
+    planned_s: float = 0.0
+    elapsed_s: float = 0.0
+    max_lag_ms: float = 0.0
+    overruns: int = 0
+    cancelled: bool = False
+    send_ms: List[float] = field(default_factory=list, repr=False)
+
+
+class TrajectoryStreamer:
+    """Streams precomputed trajectories to a joint command callback at fixed rate."""
+
+    def __init__(self, send: Callable[[np.ndarray], None], realtime: bool = True) -> None:
+        self._send = send
+        self.realtime = realtime
+
+    def stream(
+        self,
+        trajectory: Trajectory,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> StreamStats:
+        stats = StreamStats(planned_s=trajectory.duration)
+        period = trajectory.dt
+        start = time.monotonic()
+        for idx in range(len(trajectory)):
+            if should_stop is not None and should_stop():
+                stats.cancelled = True
+                break
+            if self.realtime:
+                deadline = start + float(trajectory.times[idx])
+                now = time.monotonic()
+                if now < deadline:
+                    time.sleep(deadline - now)
+                else:
+                    lag = now - deadline
+                    stats.max_lag_ms = max(stats.max_lag_ms, lag * 1000.0)
+                    if lag > period:
+                        stats.overruns += 1
+            sent = time.perf_counter()
+            self._send(trajectory.positions[idx])
+            stats.send_ms.append((time.perf_counter() - sent) * 1000.0)
+            stats.points += 1
+        stats.elapsed_s = time.monotonic() - start
+        return stats
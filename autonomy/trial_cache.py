@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import time
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from autonomy.types import EpisodeMetrics, Goal
+
+_PACKAGE_DIR = Path(__file__).resolve().parent
+_SOURCE_HASHES: Dict[Path, str] = {}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS episodes (
+    key TEXT PRIMARY KEY,
+    seed INTEGER NOT NULL,
+    goal TEXT NOT NULL,
+    params TEXT NOT NULL,
+    source TEXT NOT NULL,
+    metrics TEXT NOT NULL,
+    created REAL NOT NULL
+)
+"""
+
+
+def source_hash(package_dir: Path = _PACKAGE_DIR) -> str:
+    """SHA-256 over the package's ``.py`` files (paths and contents), computed once per process."""
+    cached = _SOURCE_HASHES.get(package_dir)
+    if cached is None:
+        digest = hashlib.sha256()
+        for path in sorted(package_dir.rglob("*.py")):
+            digest.update(path.relative_to(package_dir).as_posix().encode("utf-8") + b"\0")
+            digest.update(path.read_bytes() + b"\0")
+        cached = _SOURCE_HASHES[package_dir] = digest.hexdigest()
+    return cached
+
+
+def goal_key(goal: Goal) -> str:
+    return f"{goal.goal_type}:{goal.target_obj_class.value}:{goal.target_location_obj_class.value}"
+
+
+class TrialCache:
+    """Persistent episode results keyed by (seed, goal, agent params, autonomy source hash).
+
+    Each result is committed as soon as it is stored, so an interrupted
+    campaign resumes by re-running the same command. Editing any module
+    under ``autonomy/`` changes the source hash and therefore every key;
+    the old rows stay until ``invalidate()`` removes them.
+    """
+
+    def __init__(self, path: Union[str, Path], source: Optional[str] = None) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.source = source or source_hash()
+        self.hits = 0
+        self.misses = 0
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def key(self, seed: int, goal: Goal, params: Dict[str, Any]) -> str:
+        payload = {"seed": seed, "goal": goal_key(goal), "params": params, "source": self.source}
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def get(self, seed: int, goal: Goal, params: Dict[str, Any]) -> Optional[EpisodeMetrics]:
+        row = self._conn.execute(
+            "SELECT metrics FROM episodes WHERE key = ?", (self.key(seed, goal, params),)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        data = json.loads(row[0])
+        known = {f.name for f in fields(EpisodeMetrics)}
+        return EpisodeMetrics(**{k: v for k, v in data.items() if k in known})
+
+    def put(self, seed: int, goal: Goal, params: Dict[str, Any], metrics: EpisodeMetrics) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO episodes VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                self.key(seed, goal, params),
+                seed,
+                goal_key(goal),
+                json.dumps(params, sort_keys=True),
+                self.source,
+                json.dumps(asdict(metrics)),
+                time.time(),
+            ),
+        )
+        self._conn.commit()
+
+    def invalidate(self, everything: bool = False) -> int:
+        """Delete rows from other source versions (or all rows); returns the count removed."""
+        if everything:
+            cursor = self._conn.execute("DELETE FROM episodes")
+        else:
+            cursor = self._conn.execute("DELETE FROM episodes WHERE source != ?", (self.source,))
+        self._conn.commit()
+        self._conn.execute("VACUUM")
+        return cursor.rowcount
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM episodes").fetchone()[0]
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self)}
+
+    def close(self) -> None:
+        self._conn.close()
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import asdict, dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from autonomy.telemetry_encode import encode_frame
 
 Vec3 = Tuple[float, float, float]
 
@@ -16,7 +19,57 @@ class ObjClass(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+class PropertyMap(Mapping[str, str]):
+    """Immutable string map; equal maps are one shared instance (see ``shared_properties``)."""
+
+    __slots__ = ("_data", "_hash")
+
+    def __init__(self, data: Dict[str, str]) -> None:
+        self._data = data
+        self._hash = hash(frozenset(data.items()))
+
+    def __getitem__(self, key: str) -> str:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"PropertyMap({self._data!r})"
+
+    def __reduce__(self):
+        # Unpickling re-interns, so maps stay shared across process boundaries.
+        return shared_properties, (dict(self._data),)
+
+
+_PROPERTY_MAPS: Dict[Tuple[Tuple[str, str], ...], PropertyMap] = {}
+
+
+def shared_properties(properties: Optional[Mapping[str, str]] = None) -> PropertyMap:
+    """Interned ``PropertyMap`` for ``properties``.
+
+    Objects carry a handful of distinct property sets (``graspable``,
+    ``container``), so every object with the same set shares one map.
+    """
+    if type(properties) is PropertyMap:
+        return properties
+    key = tuple(sorted(properties.items())) if properties else ()
+    shared = _PROPERTY_MAPS.get(key)
+    if shared is None:
+        shared = _PROPERTY_MAPS.setdefault(key, PropertyMap({sys.intern(k): sys.intern(v) for k, v in key}))
+    return shared
+
+
+EMPTY_PROPERTIES = shared_properties()
+
+
+@dataclass(slots=True)
 class DetectedObject:
     obj_id: str
     cls: ObjClass
@@ -24,10 +77,17 @@ class DetectedObject:
     confidence: float = 1.0
     visible: bool = True
     in_bin: bool = False
-    properties: Dict[str, str] = field(default_factory=dict)
+    properties: Mapping[str, str] = EMPTY_PROPERTIES
 
+    def __post_init__(self) -> None:
+        # Not frozen: the simulator moves, reveals and bins objects in place.
+        if type(self.position) is not tuple:
+            self.position = tuple(float(v) for v in self.position)
+        if type(self.properties) is not PropertyMap:
+            self.properties = shared_properties(self.properties)
 
-@dataclass
+
+@dataclass(slots=True)
 class WorldState:
     tick: int = 0
     objects: Dict[str, DetectedObject] = field(default_factory=dict)
@@ -43,14 +103,14 @@ class WorldState:
     camera_frames: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Goal:
     goal_type: str
     target_obj_class: ObjClass
     target_location_obj_class: ObjClass = ObjClass.BIN
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlanStep:
     action: str
     target_id: Optional[str] = None
@@ -62,7 +122,7 @@ class PlanStep:
         return self.action
 
 
-@dataclass
+@dataclass(slots=True)
 class EpisodeMetrics:
     success: bool = False
     retries: int = 0
@@ -70,10 +130,18 @@ class EpisodeMetrics:
     steps_executed: int = 0
     fail_reason: Optional[str] = None
     duration_s: float = 0.0
+    last_step_ms: float = 0.0
+    total_step_ms: float = 0.0
+    timeouts: int = 0
 
 
 @dataclass
 class TelemetryFrame:
+    # Hand-written rather than ``slots=True`` so the encoded-JSON cache is a slot, not a dataclass field.
+    __slots__ = (
+        "ts_ms", "phase", "plan", "current_action", "retries", "replans", "last_error", "world", "metrics", "_json"
+    )
+
     ts_ms: int
     phase: str
     plan: List[str]
@@ -84,12 +152,37 @@ class TelemetryFrame:
     world: Dict[str, Any]
     metrics: Dict[str, Any]
 
+    def __post_init__(self) -> None:
+        self._json = None
+
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
+    def to_json(self) -> bytes:
+        """Compact JSON encoding, computed once and shared by every sink.
 
-@dataclass
+        Frames are treated as immutable once emitted; the cached bytes are
+        not invalidated by later field changes.
+        """
+        if self._json is None:
+            self._json = encode_frame(self)
+        return self._json
+
+
+@dataclass(slots=True)
 class EpisodeResult:
     goal: Goal
     metrics: EpisodeMetrics
-    timeline: List[TelemetryFrame]
+    timeline: Sequence[TelemetryFrame]
+
+    def close(self) -> None:
+        """Release the timeline's spill file, if it has one; spilled frames become unreachable."""
+        close = getattr(self.timeline, "close", None)
+        if callable(close):
+            close()
+
+    def __enter__(self) -> EpisodeResult:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
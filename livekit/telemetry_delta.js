@@ -0,0 +1,184 @@
+// Keyframe + delta telemetry encoding. Mirrors autonomy/telemetry_delta.py;
+// see that module for the wire format.
+
+const KEYFRAME = "k";
+const DELTA = "d";
+const REPLACE = "=";
+const REMOVE = "-";
+const ORDER = "#order";
+const UNCHANGED = Symbol("unchanged");
+
+const isObject = (v) => v !== null && typeof v === "object" && !Array.isArray(v);
+
+export class DeltaEncoder {
+  constructor(keyframeInterval = 30) {
+    this.keyframeInterval = Math.max(1, keyframeInterval);
+    this.seq = 0;
+    this.sinceKey = 0;
+    this.prev = null;
+  }
+
+  reset() {
+    this.prev = null;
+  }
+
+  encode(payload) {
+    const seq = this.seq++;
+    const prev = this.prev;
+    this.prev = payload;
+    if (prev === null || this.sinceKey + 1 >= this.keyframeInterval) {
+      this.sinceKey = 0;
+      return { t: KEYFRAME, s: seq, f: payload };
+    }
+    this.sinceKey += 1;
+    const patch = diff(prev, payload);
+    return { t: DELTA, s: seq, b: seq - 1, p: patch === UNCHANGED ? {} : patch };
+  }
+}
+
+export class DeltaDecoder {
+  constructor() {
+    this.state = null;
+    this.seq = null;
+    this.keyframes = 0;
+    this.deltas = 0;
+    this.gaps = 0;
+  }
+
+  // Returns the full frame, or null while waiting for a keyframe after a gap
+  // (a lost delta, or one referencing list elements the frame does not have).
+  decode(msg) {
+    if (msg.t === KEYFRAME) {
+      this.state = msg.f;
+      this.seq = msg.s;
+      this.keyframes += 1;
+      return this.state;
+    }
+    if (msg.t !== DELTA) return msg;
+    if (this.state === null || msg.b !== this.seq) {
+      this.gaps += 1;
+      this.state = null;
+      return null;
+    }
+    try {
+      this.state = applyPatch(this.state, msg.p || {});
+    } catch (err) {
+      if (!(err instanceof PatchError)) throw err;
+      this.gaps += 1;
+      this.state = null;
+      return null;
+    }
+    this.seq = msg.s;
+    this.deltas += 1;
+    return this.state;
+  }
+}
+
+export class PatchError extends Error {}
+
+// Throws PatchError for an "@<id>" key naming an element the list does not have.
+export function applyPatch(node, patch) {
+  if (!isObject(patch)) return patch;
+  if (REPLACE in patch) return patch[REPLACE];
+  if (Array.isArray(node)) {
+    let out = node.slice();
+    if (ORDER in patch) {
+      const byId = new Map(node.filter(isObject).map((el) => [el.id, el]));
+      out = patch[ORDER].map((id) => byId.get(id) ?? { id });
+    }
+    let positions = null;
+    for (const [key, sub] of Object.entries(patch)) {
+      if (key === ORDER) continue;
+      let idx;
+      if (key.startsWith("@")) {
+        positions ??= new Map(out.map((el, i) => [isObject(el) ? el.id : undefined, i]));
+        idx = positions.get(key.slice(1));
+        if (idx === undefined) throw new PatchError(`patch references unknown list element id ${key.slice(1)}`);
+      } else {
+        idx = Number(key);
+      }
+      out[idx] = applyPatch(out[idx], sub);
+    }
+    return out;
+  }
+
+  const out = isObject(node) ? { ...node } : {};
+  for (const key of patch[REMOVE] || []) delete out[key];
+  for (const [key, sub] of Object.entries(patch)) {
+    if (key === REMOVE) continue;
+    const real = key.startsWith("\\") ? key.slice(1) : key;
+    out[real] = applyPatch(out[real], sub);
+  }
+  return out;
+}
+
+function diff(prev, next) {
+  if (isObject(prev) && isObject(next)) {
+    const patch = {};
+    for (const [key, value] of Object.entries(next)) {
+      if (!Object.hasOwn(prev, key)) {
+        patch[escape(key)] = wrap(value);
+        continue;
+      }
+      const sub = diff(prev[key], value);
+      if (sub !== UNCHANGED) patch[escape(key)] = sub;
+    }
+    const gone = Object.keys(prev).filter((key) => !Object.hasOwn(next, key));
+    if (gone.length) patch[REMOVE] = gone;
+    return Object.keys(patch).length ? patch : UNCHANGED;
+  }
+
+  if (Array.isArray(prev) && Array.isArray(next)) {
+    const prevIds = ids(prev);
+    const nextIds = prevIds && ids(next);
+    if (prevIds && nextIds) return diffKeyed(prev, next, prevIds, nextIds);
+    if (prev.length !== next.length) return next;
+    const patch = {};
+    let changed = 0;
+    next.forEach((value, idx) => {
+      const sub = diff(prev[idx], value);
+      if (sub !== UNCHANGED) {
+        patch[String(idx)] = sub;
+        changed += 1;
+      }
+    });
+    if (!changed) return UNCHANGED;
+    const scalars = !next.some((v) => v !== null && typeof v === "object");
+    return changed <= Math.floor(next.length / 2) || !scalars ? patch : next;
+  }
+
+  if (typeof prev === typeof next && prev === next) return UNCHANGED;
+  return wrap(next);
+}
+
+function diffKeyed(prev, next, prevIds, nextIds) {
+  const patch = {};
+  if (prevIds.length !== nextIds.length || prevIds.some((id, i) => id !== nextIds[i])) {
+    patch[ORDER] = nextIds;
+  }
+  const before = new Map(prevIds.map((id, i) => [id, prev[i]]));
+  nextIds.forEach((id, i) => {
+    const old = before.get(id);
+    const sub = old === undefined ? { [REPLACE]: next[i] } : diff(old, next[i]);
+    if (sub !== UNCHANGED) patch["@" + id] = sub;
+  });
+  return Object.keys(patch).length ? patch : UNCHANGED;
+}
+
+function ids(values) {
+  if (!values.length) return null;
+  const out = [];
+  for (const value of values) {
+    if (!isObject(value) || typeof value.id !== "string") return null;
+    out.push(value.id);
+  }
+  return new Set(out).size === out.length ? out : null;
+}
+
+function wrap(value) {
+  return isObject(value) ? { [REPLACE]: value } : value;
+}
+
+function escape(key) {
+  return key === REPLACE || key === REMOVE || key.startsWith("\\") ? "\\" + key : key;
+}
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Micro-benchmark per-frame telemetry serialization.
+
+Compares the old path (``dataclasses.asdict`` + ``json.dumps`` in each of
+the JSONL, UDP and HTTP-feed sinks) with one memoized ``to_json`` shared by
+all of them, for the hand-written encoder and (if installed) orjson.
+
+Usage:
+  python scripts/bench_telemetry_encode.py
+  python scripts/bench_telemetry_encode.py --objects 3 500 2000 --sinks 3
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import timeit
+from dataclasses import asdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from autonomy.telemetry import metrics_dict, world_snapshot
+from autonomy.telemetry_encode import HAVE_ORJSON, encode_frame
+from autonomy.types import DetectedObject, EpisodeMetrics, ObjClass, TelemetryFrame, WorldState
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Telemetry frame encoding benchmark")
+    parser.add_argument("--objects", type=int, nargs="+", default=[3, 500], help="Scene sizes to benchmark")
+    parser.add_argument("--sinks", type=int, default=3, help="Sinks serializing each frame on the old path")
+    parser.add_argument("--seconds", type=float, default=0.5, help="Approximate time budget per measurement")
+    return parser.parse_args()
+
+
+def make_frame(num_objects: int, seed: int = 7) -> TelemetryFrame:
+    rng = random.Random(seed)
+    state = WorldState(phase="EXECUTE_GRASP", held_object_id="cup_1")
+    classes = list(ObjClass)
+    for i in range(num_objects):
+        obj_id = f"obj_{i}"
+        state.objects[obj_id] = DetectedObject(
+            obj_id=obj_id,
+            cls=rng.choice(classes),
+            position=(rng.uniform(-0.5, 0.5), rng.uniform(-0.5, 0.5), rng.uniform(0.0, 0.3)),
+            confidence=rng.uniform(0.5, 1.0),
+            visible=rng.random() > 0.1,
+        )
+    return TelemetryFrame(
+        ts_ms=1_700_000_000_000,
+        phase=state.phase,
+        plan=["NAVIGATE(cup_1)", "GRASP(cup_1)", "NAVIGATE(bin_1)", "PLACE_IN_BIN(cup_1)"],
+        current_action="GRASP(cup_1)",
+        retries=1,
+        replans=0,
+        last_error=None,
+        world=world_snapshot(state),
+        metrics=metrics_dict(EpisodeMetrics(steps_executed=3), 0.8),
+    )
+
+
+def per_call_us(fn, budget_s: float) -> float:
+    timer = timeit.Timer(fn)
+    number, elapsed = timer.autorange()
+    repeat = max(1, int(budget_s / max(elapsed, 1e-9)))
+    best = min(timer.repeat(repeat=min(repeat, 5), number=number))
+    return best / number * 1e6
+
+
+def main() -> int:
+    args = parse_args()
+    print(f"orjson={'yes' if HAVE_ORJSON else 'no'} sinks={args.sinks}")
+    for num_objects in args.objects:
+        frame = make_frame(num_objects)
+
+        def legacy() -> None:
+            for _ in range(args.sinks):
+                json.dumps(asdict(frame), separators=(",", ":")).encode("utf-8")
+
+        def shared(use_orjson: bool):
+            def run() -> None:
+                frame._json = None
+                for _ in range(args.sinks):
+                    if frame._json is None:
+                        frame._json = encode_frame(frame, use_orjson=use_orjson)
+            return run
+
+        size = len(encode_frame(frame, use_orjson=False))
+        legacy_us = per_call_us(legacy, args.seconds)
+        rows = [("asdict+json x%d" % args.sinks, legacy_us), ("hand-written once", per_call_us(shared(False), args.seconds))]
+        if HAVE_ORJSON:
+            rows.append(("orjson once", per_call_us(shared(True), args.seconds)))
+        print(f"objects={num_objects} frame_bytes={size}")
+        for name, us in rows:
+            print(f"  {name:<18} {us:10.1f} us/frame  {legacy_us / us:6.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
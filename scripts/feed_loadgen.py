@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Concurrent HTTP load generator for the telemetry feed (or anything serving its endpoints).
+
+Each client is a thread with its own connection. Polling clients hit
+/latest (optionally with If-None-Match) or /history (optionally following the
+X-Next-Since cursor); streaming clients hold /stream open and measure
+delivery latency as receive time minus the frame's ts_ms, which is only
+meaningful against live or restamped (telemetry_replay.py) frames.
+
+Usage:
+  python scripts/telemetry_replay.py runs/demo_telemetry.jsonl --speed 5 --loops 0 &
+  python scripts/feed_loadgen.py --clients 16 --duration 10
+  python scripts/feed_loadgen.py --endpoints latest,stream --clients 64 --stream-clients 200 --etag
+  python scripts/feed_loadgen.py --url http://localhost:3000 --endpoints latest --latest-path /api/telemetry
+"""
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import re
+import socket
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+_TS = re.compile(rb'"ts_ms":(\d+)')
+ENDPOINTS = ("latest", "history", "stream")
+
+
+@dataclass
+class ClientStats:
+    requests: int = 0
+    errors: int = 0
+    not_modified: int = 0
+    bytes: int = 0
+    events: int = 0
+    latencies_ms: List[float] = field(default_factory=list)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Telemetry feed load generator")
+    parser.add_argument("--url", default="http://127.0.0.1:8765", help="Feed base URL")
+    parser.add_argument("--endpoints", default="latest,history,stream", help=f"Comma list of {', '.join(ENDPOINTS)}")
+    parser.add_argument("--clients", type=int, default=8, help="Polling clients per /latest and /history")
+    parser.add_argument("--stream-clients", type=int, default=0, help="/stream clients (default: --clients)")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run")
+    parser.add_argument("--interval-ms", type=float, default=0.0,
+                        help="Pause between a polling client's requests (0 = closed loop, max rate)")
+    parser.add_argument("--history-limit", type=int, default=100)
+    parser.add_argument("--history-cursor", action="store_true", help="Page /history with the X-Next-Since cursor")
+    parser.add_argument("--etag", action="store_true", help="Send If-None-Match on /latest")
+    parser.add_argument("--gzip", action="store_true", help="Send Accept-Encoding: gzip")
+    parser.add_argument("--latest-path", default="/latest")
+    parser.add_argument("--history-path", default="/history")
+    parser.add_argument("--stream-path", default="/stream")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    return parser.parse_args()
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, int(round(q / 100.0 * (len(sorted_values) - 1)))))
+    return sorted_values[idx]
+
+
+def _connection(url, timeout: float) -> http.client.HTTPConnection:
+    cls = http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+    return cls(url.hostname, url.port, timeout=timeout)
+
+
+def poll_client(args: argparse.Namespace, url, endpoint: str, deadline: float, stats: ClientStats) -> None:
+    conn = _connection(url, timeout=5.0)
+    etag: Optional[str] = None
+    since: Optional[str] = None
+    headers = {"Accept-Encoding": "gzip"} if args.gzip else {}
+    while time.monotonic() < deadline:
+        if endpoint == "latest":
+            path = args.latest_path
+            if args.etag and etag:
+                headers["If-None-Match"] = etag
+        else:
+            path = f"{args.history_path}?limit={args.history_limit}"
+            if since is not None:
+                path += f"&since={since}"
+        start = time.perf_counter()
+        try:
+            conn.request("GET", path, headers=headers)
+            resp = conn.getresponse()
+            body = resp.read()
+        except (OSError, http.client.HTTPException):
+            stats.errors += 1
+            conn.close()
+            time.sleep(0.05)
+            continue
+        stats.latencies_ms.append((time.perf_counter() - start) * 1000.0)
+        stats.requests += 1
+        stats.bytes += len(body)
+        if resp.status == 304:
+            stats.not_modified += 1
+        elif resp.status >= 400:
+            stats.errors += 1
+        etag = resp.getheader("ETag") or etag
+        if args.history_cursor:
+            since = resp.getheader("X-Next-Since") or since
+        if resp.getheader("Connection", "").lower() == "close" or resp.version == 10:
+            conn.close()
+        if args.interval_ms:
+            time.sleep(args.interval_ms / 1000.0)
+    conn.close()
+
+
+def stream_client(args: argparse.Namespace, url, deadline: float, stats: ClientStats, sockets: List) -> None:
+    # Blocking reads; main() shuts the socket down at the deadline, which ends readline().
+    conn = _connection(url, timeout=5.0)
+    resp: Optional[http.client.HTTPResponse] = None
+    try:
+        conn.request("GET", args.stream_path, headers={"Accept": "text/event-stream"})
+        # Grab the socket now: http.client detaches it from ``conn`` for close-delimited responses.
+        sock = conn.sock
+        resp = conn.getresponse()
+        stats.requests += 1
+        if resp.status != 200:
+            stats.errors += 1
+            return
+        sock.settimeout(None)
+        sockets.append(sock)
+        while time.monotonic() < deadline:
+            line = resp.fp.readline()
+            if not line:
+                break
+            stats.bytes += len(line)
+            if not line.startswith(b"data:"):
+                continue
+            stats.events += 1
+            match = _TS.search(line, 0, 64)
+            if match is not None:
+                stats.latencies_ms.append(time.time() * 1000.0 - int(match.group(1)))
+    except (OSError, http.client.HTTPException):
+        if time.monotonic() < deadline:
+            stats.errors += 1
+    finally:
+        if resp is not None:
+            resp.close()
+        conn.close()
+
+
+def summarize(name: str, clients: List[ClientStats], elapsed: float) -> Dict[str, float]:
+    latencies = sorted(l for c in clients for l in c.latencies_ms)
+    requests = sum(c.requests for c in clients)
+    row: Dict[str, float] = {
+        "endpoint": name,
+        "clients": len(clients),
+        "requests": requests,
+        "errors": sum(c.errors for c in clients),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "max_ms": round(latencies[-1], 2) if latencies else 0.0,
+        "mb_s": round(sum(c.bytes for c in clients) / elapsed / 1e6, 2),
+    }
+    if name == "stream":
+        row["events"] = sum(c.events for c in clients)
+        row["events_s"] = round(row["events"] / elapsed, 1)
+    else:
+        row["req_s"] = round(requests / elapsed, 1)
+        row["not_modified"] = sum(c.not_modified for c in clients)
+    return row
+
+
+def main() -> int:
+    args = parse_args()
+    url = urlparse(args.url)
+    endpoints = [e.strip() for e in args.endpoints.split(",") if e.strip()]
+    unknown = set(endpoints) - set(ENDPOINTS)
+    if unknown:
+        print(f"unknown endpoints: {sorted(unknown)}", file=sys.stderr)
+        return 2
+
+    stream_clients = args.stream_clients or args.clients
+    deadline = time.monotonic() + args.duration
+    threads: List[threading.Thread] = []
+    stream_sockets: List[socket.socket] = []
+    results: Dict[str, List[ClientStats]] = {}
+    for endpoint in endpoints:
+        results[endpoint] = []
+        for i in range(stream_clients if endpoint == "stream" else args.clients):
+            stats = ClientStats()
+            results[endpoint].append(stats)
+            if endpoint == "stream":
+                target, target_args = stream_client, (args, url, deadline, stats, stream_sockets)
+            else:
+                target, target_args = poll_client, (args, url, endpoint, deadline, stats)
+            threads.append(threading.Thread(target=target, args=target_args, name=f"{endpoint}-{i}", daemon=True))
+
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    time.sleep(max(0.0, deadline - time.monotonic()))
+    for sock in stream_sockets:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+    for thread in threads:
+        thread.join(timeout=10.0)
+    elapsed = max(time.monotonic() - start, 1e-9)
+
+    rows = [summarize(name, clients, elapsed) for name, clients in results.items()]
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+    print(f"url={args.url} duration_s={elapsed:.1f} threads={len(threads)}")
+    for row in rows:
+        print("  ".join(f"{key}={value}" for key, value in row.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,38 +1,53 @@
 #!/usr/bin/env python3
 """Prepare a LeRobot dataset for GR00T N1.6 fine-tuning.
 
-Adds modality.json and validates the dataset format.
+Adds modality.json and validates the dataset format. With ``--deep`` every
+parquet and mp4 is inspected in a process pool (parquet footers / row-group
+statistics and video container metadata only, no payload decoding) and
+cross-checked against meta/episodes.jsonl; per-file results are cached by
+size and mtime so re-validation only touches new or changed files.
+
+``--stats`` writes meta/stats.json (per-dimension mean/std/min/max/q01/q99
+of the state and action columns) from one streaming pass over parquet row
+groups; per-file partial statistics share the same cache.
 """
 from __future__ import annotations
 
 import argparse
 import json
+import os
+import re
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
 
-# SO-ARM100 dual-camera modality configuration for GR00T N1.6.
+# SO-ARM100 dual-camera modality configuration for GR00T N1.6 (5 arm joints + gripper).
 SO100_DUALCAM_MODALITY = {
     "state": {
         "joint_positions": {
             "start": 0,
-            "end": 6,
+            "end": 5,
             "semantic": "joint_position",
         },
         "gripper_position": {
-            "start": 6,
-            "end": 7,
+            "start": 5,
+            "end": 6,
             "semantic": "gripper_position",
         },
     },
     "action": {
         "joint_positions": {
             "start": 0,
-            "end": 6,
+            "end": 5,
             "semantic": "joint_position",
         },
         "gripper_position": {
-            "start": 6,
-            "end": 7,
+            "start": 5,
+            "end": 6,
             "semantic": "gripper_position",
         },
     },
@@ -69,9 +84,499 @@ def validate_dataset(dataset_dir: Path) -> list[str]:
     return warnings
 
 
+CACHE_NAME = ".prepare_cache.json"
+CACHE_VERSION = 1
+_EPISODE_RE = re.compile(r"episode_(\d+)")
+# Integer columns whose row-group min/max reveal episode / frame numbering.
+_INDEX_COLUMNS = ("episode_index", "frame_index", "index")
+
+
+def inspect_parquet(path: str) -> Dict[str, Any]:
+    """Row count, schema and index ranges from the parquet footer."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("pyarrow is required for --deep: pip install pyarrow")
+
+    pf = pq.ParquetFile(path)
+    meta = pf.metadata
+    names = [meta.schema.column(i).path for i in range(meta.num_columns)]
+    ranges: Dict[str, Optional[List[int]]] = {}
+    for column in _INDEX_COLUMNS:
+        if column not in names:
+            continue
+        col = names.index(column)
+        lo: Optional[int] = None
+        hi: Optional[int] = None
+        for rg in range(meta.num_row_groups):
+            stats = meta.row_group(rg).column(col).statistics
+            if stats is None or not stats.has_min_max:
+                lo = hi = None
+                break
+            lo = stats.min if lo is None else min(lo, stats.min)
+            hi = stats.max if hi is None else max(hi, stats.max)
+        if lo is None and meta.num_rows:
+            # Writer skipped statistics: read just this one integer column.
+            values = pf.read(columns=[column]).column(0)
+            lo, hi = int(values.to_numpy().min()), int(values.to_numpy().max())
+        ranges[column] = None if lo is None else [int(lo), int(hi)]
+    return {
+        "kind": "parquet",
+        "rows": meta.num_rows,
+        "row_groups": meta.num_row_groups,
+        "schema": str(pf.schema_arrow.remove_metadata()),
+        "ranges": ranges,
+    }
+
+
+def inspect_video(path: str) -> Dict[str, Any]:
+    """Frame count / fps / size from the container header."""
+    try:
+        import cv2
+    except ImportError:
+        raise ImportError("opencv is required for --deep: pip install opencv-python")
+
+    cap = cv2.VideoCapture(path)
+    try:
+        if not cap.isOpened():
+            raise ValueError("cannot open video")
+        return {
+            "kind": "video",
+            "frames": int(cap.get(cv2.CAP_PROP_FRAME_COUNT)),
+            "fps": round(float(cap.get(cv2.CAP_PROP_FPS)), 3),
+            "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        }
+    finally:
+        cap.release()
+
+
+def _inspect(job: Tuple[str, str]) -> Dict[str, Any]:
+    kind, path = job
+    try:
+        return (inspect_parquet if kind == "parquet" else inspect_video)(path)
+    except ImportError:
+        raise
+    except Exception as exc:  # corrupt / truncated files are findings, not crashes
+        return {"kind": kind, "error": f"{type(exc).__name__}: {exc}"}
+
+
+class FileCache:
+    """Per-file results keyed by relative path, valid while size and mtime match."""
+
+    def __init__(self, path: Optional[Path]) -> None:
+        self.path = path
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        if path is not None and path.exists():
+            try:
+                data = json.loads(path.read_text())
+                if data.get("version") == CACHE_VERSION:
+                    self._entries = data.get("files", {})
+            except (OSError, ValueError):
+                pass
+
+    def get(self, key: str, section: str, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None or entry["size"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns:
+            return None
+        return entry.get(section)
+
+    def put(self, key: str, section: str, stat: os.stat_result, result: Dict[str, Any]) -> None:
+        entry = self._entries.get(key)
+        if entry is None or entry["size"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns:
+            entry = self._entries[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        entry[section] = result
+        self._dirty = True
+
+    def prune(self, keep: Set[str]) -> None:
+        for key in [k for k in self._entries if k not in keep]:
+            del self._entries[key]
+            self._dirty = True
+
+    def save(self) -> None:
+        if self.path is None or not self._dirty:
+            return
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps({"version": CACHE_VERSION, "files": self._entries}))
+        tmp.replace(self.path)
+        self._dirty = False
+
+
+def run_cached(
+    dataset_dir: Path,
+    files: List[Path],
+    section: str,
+    worker: Callable[[Any], Dict[str, Any]],
+    job: Callable[[Path], Any],
+    cache: FileCache,
+    workers: int,
+) -> Tuple[Dict[str, Dict[str, Any]], int]:
+    """Results for ``files`` keyed by relative path, computing only stale ones in a process pool."""
+    results: Dict[str, Dict[str, Any]] = {}
+    stale: List[Tuple[str, os.stat_result, Any]] = []
+    for path in files:
+        key = path.relative_to(dataset_dir).as_posix()
+        stat = path.stat()
+        cached = cache.get(key, section, stat)
+        if cached is not None:
+            results[key] = cached
+        else:
+            stale.append((key, stat, job(path)))
+
+    jobs = [j for _, _, j in stale]
+    if len(stale) > 1 and workers != 1:
+        with ProcessPoolExecutor(max_workers=workers or None) as pool:
+            computed = list(pool.map(worker, jobs, chunksize=max(1, len(jobs) // 64)))
+    else:
+        computed = [worker(j) for j in jobs]
+    for (key, stat, _), result in zip(stale, computed):
+        results[key] = result
+        if "error" not in result:
+            cache.put(key, section, stat, result)
+    return results, len(stale)
+
+
+def _episode_of(path: str) -> Optional[int]:
+    match = _EPISODE_RE.search(path)
+    return int(match.group(1)) if match else None
+
+
+def _read_jsonl(path: Path) -> List[Dict[str, Any]]:
+    rows = []
+    with path.open() as fh:
+        for line in fh:
+            if line.strip():
+                rows.append(json.loads(line))
+    return rows
+
+
+def deep_validate(
+    dataset_dir: Path,
+    workers: int = 0,
+    use_cache: bool = True,
+    frame_tolerance: int = 1,
+) -> Tuple[List[str], Dict[str, int]]:
+    """Cross-check parquet/video metadata against meta/; returns (warnings, scan stats)."""
+    warnings: List[str] = []
+    cache = FileCache(dataset_dir / CACHE_NAME if use_cache else None)
+    parquets = sorted((dataset_dir / "data").rglob("*.parquet")) if (dataset_dir / "data").exists() else []
+    videos = sorted((dataset_dir / "videos").rglob("*.mp4")) if (dataset_dir / "videos").exists() else []
+
+    tables, parquet_scanned = run_cached(
+        dataset_dir, parquets, "validate", _inspect, lambda p: ("parquet", str(p)), cache, workers
+    )
+    clips, video_scanned = run_cached(
+        dataset_dir, videos, "validate", _inspect, lambda p: ("video", str(p)), cache, workers
+    )
+    cache.prune(set(tables) | set(clips))
+    cache.save()
+
+    for key, result in sorted({**tables, **clips}.items()):
+        if "error" in result:
+            warnings.append(f"{key}: unreadable ({result['error']})")
+
+    # Schema drift: every episode should share the majority schema.
+    schemas = Counter(r["schema"] for r in tables.values() if "schema" in r)
+    if len(schemas) > 1:
+        expected = schemas.most_common(1)[0][0]
+        drifted = sorted(k for k, r in tables.items() if r.get("schema", expected) != expected)
+        warnings.append(f"Schema drift in {len(drifted)} parquet file(s), e.g. {drifted[:3]}")
+
+    # Parquet ↔ episodes.jsonl.
+    rows_by_episode: Dict[int, int] = {}
+    unreadable = {_episode_of(k) for k, r in tables.items() if "error" in r}
+    index_ranges: List[Tuple[int, int, int]] = []
+    for key, result in tables.items():
+        ep = _episode_of(key)
+        if ep is None or "rows" not in result:
+            continue
+        rows_by_episode[ep] = result["rows"]
+        ranges = result["ranges"]
+        ep_range = ranges.get("episode_index")
+        if ep_range is not None and ep_range != [ep, ep]:
+            warnings.append(f"{key}: episode_index values {ep_range} do not match file episode {ep}")
+        frame_range = ranges.get("frame_index")
+        if frame_range is not None and result["rows"] and frame_range != [0, result["rows"] - 1]:
+            warnings.append(f"{key}: frame_index spans {frame_range} for {result['rows']} rows")
+        if ranges.get("index") is not None:
+            index_ranges.append((ep, *ranges["index"]))
+
+    episodes_path = dataset_dir / "meta" / "episodes.jsonl"
+    lengths: Dict[int, int] = {}
+    if episodes_path.exists():
+        for row in _read_jsonl(episodes_path):
+            lengths[int(row["episode_index"])] = int(row.get("length", -1))
+        if lengths:
+            missing = sorted(set(range(max(lengths) + 1)) - set(lengths))
+            if missing:
+                warnings.append(f"episodes.jsonl index gaps: {_ranges(missing)}")
+        for ep in sorted(set(lengths) - set(rows_by_episode) - unreadable):
+            warnings.append(f"episode {ep}: listed in episodes.jsonl but has no parquet file")
+        for ep in sorted(set(rows_by_episode) - set(lengths)):
+            warnings.append(f"episode {ep}: parquet file not listed in episodes.jsonl")
+        for ep in sorted(set(lengths) & set(rows_by_episode)):
+            if lengths[ep] != rows_by_episode[ep]:
+                warnings.append(f"episode {ep}: episodes.jsonl length {lengths[ep]} != parquet rows {rows_by_episode[ep]}")
+
+    info_path = dataset_dir / "meta" / "info.json"
+    if info_path.exists():
+        info = json.loads(info_path.read_text())
+        total = info.get("total_episodes")
+        found = len(set(rows_by_episode) | unreadable)
+        if total is not None and total != found:
+            warnings.append(f"info.json total_episodes={total} but {found} parquet episode(s) found")
+
+    # Global frame index must continue from one episode to the next without gaps or overlap.
+    index_ranges.sort()
+    for (prev_ep, _, prev_hi), (ep, lo, _) in zip(index_ranges, index_ranges[1:]):
+        if ep == prev_ep + 1 and lo != prev_hi + 1:
+            warnings.append(f"episode {ep}: global index starts at {lo}, expected {prev_hi + 1} (after episode {prev_ep})")
+
+    # Videos ↔ parquet rows, per camera key.
+    for key, result in sorted(clips.items()):
+        ep = _episode_of(key)
+        if ep is None or "frames" not in result:
+            continue
+        expected = rows_by_episode.get(ep, lengths.get(ep))
+        if expected is None:
+            warnings.append(f"{key}: video without a matching episode")
+        elif abs(result["frames"] - expected) > frame_tolerance:
+            warnings.append(f"{key}: {result['frames']} video frames but {expected} parquet rows")
+
+    stats = {
+        "parquet_files": len(parquets),
+        "video_files": len(videos),
+        "scanned": parquet_scanned + video_scanned,
+        "cached": len(parquets) + len(videos) - parquet_scanned - video_scanned,
+    }
+    return warnings, stats
+
+
+def _ranges(values: List[int]) -> str:
+    """Compact ``1-3, 7`` rendering of sorted integers."""
+    spans: List[str] = []
+    start = prev = values[0]
+    for value in values[1:] + [None]:  # type: ignore[list-item]
+        if value is not None and value == prev + 1:
+            prev = value
+            continue
+        spans.append(str(start) if start == prev else f"{start}-{prev}")
+        if value is not None:
+            start = prev = value
+    return ", ".join(spans)
+
+
+STATS_NAME = "stats.json"
+# Parquet column holding each modality group of SO100_DUALCAM_MODALITY.
+STATS_COLUMNS = {"state": "observation.state", "action": "action"}
+STATS_QUANTILES = {"q01": 0.01, "q99": 0.99}
+DIGEST_COMPRESSION = 100
+
+
+class StreamingStats:
+    """Mergeable per-dimension statistics for one vector column.
+
+    Count / mean / std / min / max are exact (Welford moments combined with
+    Chan's pairwise update); quantiles come from a t-digest per dimension.
+    Row groups, files and cached partial results can be merged in any order.
+    """
+
+    def __init__(self, dims: int, compression: int = DIGEST_COMPRESSION) -> None:
+        self.dims = dims
+        self.compression = compression
+        self.count = 0
+        self.mean = np.zeros(dims)
+        self.m2 = np.zeros(dims)
+        self.min = np.full(dims, np.inf)
+        self.max = np.full(dims, -np.inf)
+        # Per dimension: (centroid means, centroid weights), sorted by mean.
+        self.centroids: List[Tuple[np.ndarray, np.ndarray]] = [(np.empty(0), np.empty(0)) for _ in range(dims)]
+
+    def update(self, batch: np.ndarray) -> None:
+        """Fold in a (rows, dims) batch."""
+        batch = np.asarray(batch, dtype=np.float64)
+        if not len(batch):
+            return
+        part = StreamingStats(self.dims, self.compression)
+        part.count = len(batch)
+        part.mean = batch.mean(axis=0)
+        part.m2 = ((batch - part.mean) ** 2).sum(axis=0)
+        part.min = batch.min(axis=0)
+        part.max = batch.max(axis=0)
+        ones = np.ones(len(batch))
+        part.centroids = [(batch[:, d], ones) for d in range(self.dims)]
+        self.merge(part)
+
+    def merge(self, other: "StreamingStats") -> None:
+        if other.dims != self.dims:
+            raise ValueError(f"cannot merge {other.dims}-dim statistics into {self.dims}-dim statistics")
+        if not other.count:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean = self.mean + delta * (other.count / total)
+        self.m2 = self.m2 + other.m2 + delta**2 * (self.count * other.count / total)
+        self.count = total
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+        self.centroids = [
+            _compress(np.concatenate((m1, m2)), np.concatenate((w1, w2)), self.compression)
+            for (m1, w1), (m2, w2) in zip(self.centroids, other.centroids)
+        ]
+
+    def quantile(self, q: float) -> np.ndarray:
+        out = np.empty(self.dims)
+        for d, (means, weights) in enumerate(self.centroids):
+            mids = (np.cumsum(weights) - weights / 2) / weights.sum()
+            # Centroid means sit at their mid ranks; the extremes are exact.
+            out[d] = np.interp(q, np.r_[0.0, mids, 1.0], np.r_[self.min[d], means, self.max[d]])
+        return out
+
+    def summary(self) -> Dict[str, Any]:
+        """Normalization entry for meta/stats.json."""
+        result = {
+            "mean": self.mean.tolist(),
+            "std": np.sqrt(self.m2 / max(self.count, 1)).tolist(),
+            "min": self.min.tolist(),
+            "max": self.max.tolist(),
+        }
+        for name, q in STATS_QUANTILES.items():
+            result[name] = self.quantile(q).tolist()
+        result["count"] = [self.count]
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.mean.tolist(),
+            "m2": self.m2.tolist(),
+            "min": self.min.tolist(),
+            "max": self.max.tolist(),
+            "centroids": [[m.tolist(), w.astype(np.int64).tolist()] for m, w in self.centroids],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], compression: int = DIGEST_COMPRESSION) -> "StreamingStats":
+        stats = cls(len(data["mean"]), compression)
+        stats.count = data["count"]
+        stats.mean = np.asarray(data["mean"], dtype=np.float64)
+        stats.m2 = np.asarray(data["m2"], dtype=np.float64)
+        stats.min = np.asarray(data["min"], dtype=np.float64)
+        stats.max = np.asarray(data["max"], dtype=np.float64)
+        stats.centroids = [
+            (np.asarray(m, dtype=np.float64), np.asarray(w, dtype=np.float64)) for m, w in data["centroids"]
+        ]
+        return stats
+
+
+def _compress(means: np.ndarray, weights: np.ndarray, compression: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Merge sorted centroids that share a unit of the t-digest k1 scale (fine at the tails, coarse mid-range)."""
+    order = np.argsort(means, kind="stable")
+    means, weights = means[order], weights[order]
+    mids = (np.cumsum(weights) - weights / 2) / weights.sum()
+    k = np.floor(compression / (2 * np.pi) * np.arcsin(np.clip(2 * mids - 1, -1.0, 1.0)))
+    starts = np.flatnonzero(np.r_[True, k[1:] != k[:-1]])
+    merged = np.add.reduceat(weights, starts)
+    return np.add.reduceat(means * weights, starts) / merged, merged
+
+
+def _vectors(column: Any) -> np.ndarray:
+    """(rows, dims) float64 matrix from a list / fixed-size-list parquet column."""
+    import pyarrow as pa
+
+    arr = column.combine_chunks()
+    if isinstance(arr.type, pa.FixedSizeListType):
+        width = arr.type.list_size
+    else:
+        lengths = np.diff(arr.offsets.to_numpy())
+        width = int(lengths[0]) if len(lengths) else 0
+        if (lengths != width).any():
+            raise ValueError(f"ragged vectors (lengths {int(lengths.min())}..{int(lengths.max())})")
+    values = arr.flatten().to_numpy(zero_copy_only=False)
+    return values.astype(np.float64, copy=False).reshape(len(arr), width)
+
+
+def file_stats(path: str) -> Dict[str, Any]:
+    """Per-column StreamingStats for one parquet file, one row group at a time."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("pyarrow is required for --stats: pip install pyarrow")
+
+    pf = pq.ParquetFile(path)
+    columns = [c for c in STATS_COLUMNS.values() if c in pf.schema_arrow.names]
+    accumulators: Dict[str, StreamingStats] = {}
+    for rg in range(pf.num_row_groups):
+        table = pf.read_row_group(rg, columns=columns)
+        for name in columns:
+            batch = _vectors(table.column(name))
+            acc = accumulators.setdefault(name, StreamingStats(batch.shape[1]))
+            acc.update(batch)
+    return {"rows": pf.metadata.num_rows, "columns": {k: v.to_dict() for k, v in accumulators.items()}}
+
+
+def _file_stats(path: str) -> Dict[str, Any]:
+    try:
+        return file_stats(path)
+    except ImportError:
+        raise
+    except Exception as exc:
+        return {"error": f"{type(exc).__name__}: {exc}"}
+
+
+def compute_stats(
+    dataset_dir: Path,
+    workers: int = 0,
+    use_cache: bool = True,
+) -> Tuple[Dict[str, Any], List[str], Dict[str, int]]:
+    """Merged normalization stats over all episodes; returns (stats, warnings, scan stats).
+
+    Per-file accumulators are cached next to the --deep results, so after
+    appending episodes only the new parquet files are read.
+    """
+    warnings: List[str] = []
+    cache = FileCache(dataset_dir / CACHE_NAME if use_cache else None)
+    parquets = sorted((dataset_dir / "data").rglob("*.parquet")) if (dataset_dir / "data").exists() else []
+    videos = sorted((dataset_dir / "videos").rglob("*.mp4")) if (dataset_dir / "videos").exists() else []
+    per_file, scanned = run_cached(dataset_dir, parquets, "stats", _file_stats, str, cache, workers)
+    cache.prune({p.relative_to(dataset_dir).as_posix() for p in parquets + videos})
+    cache.save()
+
+    merged: Dict[str, StreamingStats] = {}
+    for key, result in sorted(per_file.items()):
+        if "error" in result:
+            warnings.append(f"{key}: no statistics ({result['error']})")
+            continue
+        for name, data in result["columns"].items():
+            part = StreamingStats.from_dict(data)
+            acc = merged.setdefault(name, StreamingStats(part.dims))
+            if part.dims != acc.dims:
+                warnings.append(f"{key}: {name} has {part.dims} dims, expected {acc.dims}; skipped")
+                continue
+            acc.merge(part)
+
+    for group, column in STATS_COLUMNS.items():
+        needed = max(spec["end"] for spec in SO100_DUALCAM_MODALITY[group].values())
+        if column not in merged:
+            warnings.append(f"No {column} column for modality group '{group}'")
+        elif merged[column].dims < needed:
+            warnings.append(f"{column} has {merged[column].dims} dims but modality '{group}' ranges need {needed}")
+
+    stats = {name: acc.summary() for name, acc in merged.items()}
+    return stats, warnings, {"parquet_files": len(parquets), "scanned": scanned, "cached": len(parquets) - scanned}
+
+
 def main() -> int:
-    parser = argparse.ArgumentParser(description=__doc__)
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument("--dataset-dir", required=True, help="Path to LeRobot dataset")
+    parser.add_argument("--deep", action="store_true", help="Inspect every parquet/mp4 and cross-check metadata")
+    parser.add_argument("--stats", action="store_true", help=f"Compute normalization statistics into meta/{STATS_NAME}")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Processes for --deep / --stats (0 = CPU count, 1 = inline)")
+    parser.add_argument("--no-cache", action="store_true", help=f"Ignore and do not update {CACHE_NAME}")
+    parser.add_argument("--frame-tolerance", type=int, default=1,
+                        help="Allowed difference between video frame count and parquet rows")
     args = parser.parse_args()
 
     dataset_dir = Path(args.dataset_dir).resolve()
@@ -83,6 +588,23 @@ def main() -> int:
 
     # Validate structure.
     warnings = validate_dataset(dataset_dir)
+    if args.deep:
+        deep_warnings, scan = deep_validate(
+            dataset_dir,
+            workers=args.workers,
+            use_cache=not args.no_cache,
+            frame_tolerance=args.frame_tolerance,
+        )
+        warnings.extend(deep_warnings)
+        print(
+            f"  Deep check: {scan['parquet_files']} parquet, {scan['video_files']} video file(s); "
+            f"{scan['scanned']} inspected, {scan['cached']} from cache"
+        )
+    stats = None
+    if args.stats:
+        stats, stats_warnings, scan = compute_stats(dataset_dir, workers=args.workers, use_cache=not args.no_cache)
+        warnings.extend(stats_warnings)
+        print(f"  Stats: {scan['parquet_files']} parquet file(s); {scan['scanned']} read, {scan['cached']} from cache")
     for w in warnings:
         print(f"  WARNING: {w}")
 
@@ -95,6 +617,12 @@ def main() -> int:
         json.dump(SO100_DUALCAM_MODALITY, fh, indent=2)
     print(f"  Created {modality_path}")
 
+    if stats:
+        stats_path = meta_dir / STATS_NAME
+        with open(stats_path, "w") as fh:
+            json.dump(stats, fh, indent=2)
+        print(f"  Wrote {stats_path}")
+
     if not warnings:
         print("\nDataset is ready for GR00T fine-tuning!")
     else:
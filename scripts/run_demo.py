@@ -12,7 +12,16 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from autonomy import Goal, ObjClass, PerceptionModule, Planner, SimRobot, StepExecutor, Track1Agent
-from autonomy.telemetry import InMemorySink, JsonlSink, MultiSink, StdoutSink, UdpSink
+from autonomy.sim_robot import SceneConfig
+from autonomy.telemetry import (
+    SINK_POLICIES,
+    BufferedJsonlSink,
+    InMemorySink,
+    MultiSink,
+    SinkWorker,
+    StdoutSink,
+    UdpSink,
+)
 from autonomy.telemetry_http import TelemetryHttpFeed
 
 
@@ -23,10 +32,38 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--max-retries-step", type=int, default=2)
     parser.add_argument("--max-replans", type=int, default=3)
     parser.add_argument("--max-ticks", type=int, default=80)
+    parser.add_argument("--scene-objects", type=int, default=0,
+                        help="Generate a cluttered table with this many objects (0 = default 3-object scene)")
     parser.add_argument("--jsonl", default="runs/demo_telemetry.jsonl", help="Path for telemetry JSONL")
+    parser.add_argument("--jsonl-rotate-mb", type=float, default=0.0,
+                        help="Rotate telemetry files after this many MB (0 disables); use a .gz path to compress")
+    parser.add_argument("--jsonl-per-episode", action="store_true", help="Start a new telemetry file per episode")
     parser.add_argument("--http-port", type=int, default=0, help="Serve telemetry feed on this port (0 disables)")
     parser.add_argument("--udp", default="", help="Optional UDP host:port sink for bridge processes")
+    parser.add_argument(
+        "--udp-keyframe-every",
+        type=int,
+        default=0,
+        help="Delta-encode UDP telemetry with a keyframe every N frames (0 = full frames)",
+    )
+    parser.add_argument("--udp-batch-ms", type=float, default=0.0,
+                        help="Coalesce UDP telemetry frames sent within this window (0 sends each frame immediately)")
+    parser.add_argument("--udp-mtu", type=int, default=1200, help="Maximum UDP datagram size; larger frames are chunked")
+    parser.add_argument("--sink-mode", choices=["sync", "async"], default="sync",
+                        help="async gives every telemetry sink its own queue and thread")
+    parser.add_argument("--sink-policy", choices=list(SINK_POLICIES), default="drop_oldest",
+                        help="Backpressure policy for async live sinks (the JSONL log and memory sink always block)")
+    parser.add_argument("--sink-sample-every", type=int, default=1,
+                        help="With --sink-policy sample, forward every Nth frame")
+    parser.add_argument("--timeline-limit", type=int, default=0,
+                        help="Frames per episode timeline kept in memory; older ones spill to disk (0 = unbounded)")
+    parser.add_argument("--memory-frames", type=int, default=0,
+                        help="Frames the in-memory sink keeps in RAM (0 = unbounded)")
+    parser.add_argument("--memory-drop", action="store_true",
+                        help="Discard frames beyond --memory-frames instead of spilling them to a temp file")
     parser.add_argument("--episodes", type=int, default=1, help="Number of episodes to run")
+    parser.add_argument("--record", default="",
+                        help="Record episodes as a LeRobot-format dataset in this directory (needs pyarrow)")
     parser.add_argument("--verbose", action="store_true", help="Print compact telemetry frames")
     return parser.parse_args()
 
@@ -37,16 +74,31 @@ def main() -> int:
     target_class = ObjClass(args.goal_target)
     goal = Goal(goal_type="put_in_bin", target_obj_class=target_class)
 
-    jsonl_sink = JsonlSink(args.jsonl)
-    memory_sink = InMemorySink()
+    jsonl_sink = BufferedJsonlSink(
+        args.jsonl,
+        rotate_bytes=int(args.jsonl_rotate_mb * 1024 * 1024),
+        rotate_per_episode=args.jsonl_per_episode,
+    )
+    memory_sink = InMemorySink(max_frames=args.memory_frames or None, spill=not args.memory_drop)
     sinks: List[object] = [jsonl_sink, memory_sink]
+    if args.sink_mode == "async":
+        # Durable sinks never drop frames; --sink-policy only applies to the live ones.
+        sinks = [SinkWorker(sink, policy="block") for sink in sinks]
 
     if args.verbose:
         sinks.append(StdoutSink())
 
     if args.udp:
         host, port = args.udp.split(":", maxsplit=1)
-        sinks.append(UdpSink(host=host, port=int(port)))
+        sinks.append(
+            UdpSink(
+                host=host,
+                port=int(port),
+                delta_keyframe_interval=args.udp_keyframe_every,
+                batch_window_ms=args.udp_batch_ms,
+                mtu=args.udp_mtu,
+            )
+        )
 
     feed = None
     if args.http_port:
@@ -56,18 +108,30 @@ def main() -> int:
 
             class FeedSink:
                 def emit(self, frame):
-                    feed.update(frame.to_dict())
+                    feed.update_frame(frame)
 
             sinks.append(FeedSink())
         except OSError as exc:
             print(f"warning: telemetry feed disabled (could not bind port {args.http_port}: {exc})")
             feed = None
 
-    sink = MultiSink(sinks)
+    sink = MultiSink(
+        sinks,
+        async_mode=args.sink_mode == "async",
+        policy=args.sink_policy,
+        sample_every=args.sink_sample_every,
+    )
+
+    recorder = None
+    if args.record:
+        from autonomy.dataset_recorder import LeRobotRecorder
+
+        recorder = LeRobotRecorder(args.record, robot_type="so100_sim", video=False)
 
     planner = Planner()
     perception = PerceptionModule()
-    robot = SimRobot(seed=args.seed)
+    scene = SceneConfig(num_objects=args.scene_objects) if args.scene_objects else None
+    robot = SimRobot(seed=args.seed, scene=scene)
     executor = StepExecutor(planner)
     agent = Track1Agent(
         robot=robot,
@@ -77,6 +141,8 @@ def main() -> int:
         sink=sink,
         max_retries_per_step=args.max_retries_step,
         max_replans=args.max_replans,
+        recorder=recorder,
+        timeline_limit=args.timeline_limit or None,
     )
 
     successes = 0
@@ -97,6 +163,8 @@ def main() -> int:
                     f"fail_reason={result.metrics.fail_reason}"
                 )
             )
+            # Drops the timeline's spill file now rather than at garbage collection.
+            result.close()
 
         success_rate = successes / max(args.episodes, 1)
         print(f"summary episodes={args.episodes} success_rate={success_rate:.3f} telemetry={args.jsonl}")
@@ -109,6 +177,12 @@ def main() -> int:
 
     finally:
         sink.close()
+        if recorder is not None:
+            recorder.close()
+            print(f"dataset={args.record} recorder={recorder.stats()}")
+        print(f"telemetry_writer={jsonl_sink.stats()}")
+        if args.sink_mode == "async":
+            print(f"telemetry_sinks={sink.sink_stats()}")
         if feed is not None:
             feed.stop()
 
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""Run several Track-1 cells (sim or real) in one process.
+
+All cells publish through one telemetry feed under /robots/<id>/latest,
+/history and /stream (GET /robots lists them). Real cells share a single
+YOLO-World model through SharedDetector, which batches frames from every
+cell's cameras.
+
+Usage:
+  python scripts/run_fleet.py --robots 4 --episodes 5 --http-port 8765
+  python scripts/run_fleet.py --config fleet.json --http-port 8765
+
+fleet.json (real SO-ARM100 cells):
+  {"robots": [
+    {"id": "left", "port": "/dev/ttyACM0", "cameras": {"wrist": 0, "front": 2}},
+    {"id": "right", "port": "/dev/ttyACM1", "cameras": {"wrist": 4, "front": 6}}
+  ]}
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from autonomy import Goal, ObjClass, PerceptionModule, Planner, SimRobot, StepExecutor, Track1Agent
+from autonomy.executor import parse_deadlines
+from autonomy.metrics import REGISTRY
+from autonomy.orchestrator import FleetOrchestrator
+from autonomy.sim_robot import SceneConfig
+from autonomy.telemetry import BufferedJsonlSink, MultiSink
+from autonomy.telemetry_http import TelemetryHttpFeed
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run a fleet of Track-1 cells with shared perception and telemetry")
+    parser.add_argument("--robots", type=int, default=4, help="Simulated cells (ignored with --config)")
+    parser.add_argument("--config", default="", help="JSON file describing real robot cells")
+    parser.add_argument("--episodes", type=int, default=3, help="Episodes per cell")
+    parser.add_argument("--seed", type=int, default=7, help="Base seed; sim cell i uses seed + 1000 * i + episode")
+    parser.add_argument("--goal-target", default="cup", choices=[c.value for c in ObjClass])
+    parser.add_argument("--max-retries-step", type=int, default=2)
+    parser.add_argument("--max-replans", type=int, default=3)
+    parser.add_argument("--max-ticks", type=int, default=80)
+    parser.add_argument("--scene-objects", type=int, default=0,
+                        help="Generate a cluttered table with this many objects per sim cell (0 = default scene)")
+    parser.add_argument("--http-port", type=int, default=8765, help="Shared telemetry feed port (0 disables)")
+    parser.add_argument("--jsonl-dir", default="runs/fleet", help="Per-robot telemetry JSONL directory ('' disables)")
+    parser.add_argument("--stall-s", type=float, default=10.0, help="Report cells with no frame for this long")
+    parser.add_argument("--status-every", type=float, default=5.0, help="Seconds between fleet status lines")
+    parser.add_argument("--yolo-classes", nargs="+", default=["cup", "bottle", "bin", "box"],
+                        help="Open-vocabulary classes for the shared detector (real cells)")
+    parser.add_argument("--yolo-model", default="s", choices=["s", "m", "l"])
+    parser.add_argument("--max-batch", type=int, default=8, help="Max cells per shared detector batch")
+    parser.add_argument("--step-deadline", action="append", default=[], metavar="ACTION=SECONDS",
+                        help="Override a real cell's step deadline, e.g. GRASP=5 (repeatable; 0 removes it)")
+    parser.add_argument("--ik-cache", default="runs/ik_workspace.npz")
+    return parser.parse_args()
+
+
+def sim_cells(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    scene = SceneConfig(num_objects=args.scene_objects) if args.scene_objects else None
+    cells = []
+    for i in range(args.robots):
+        seed = args.seed + 1000 * i
+        robot = SimRobot(seed=seed, scene=scene)
+        cells.append(
+            {
+                "id": f"sim_{i}",
+                "robot": robot,
+                "perception": PerceptionModule(),
+                "reset": lambda idx, robot=robot, seed=seed: robot.reset(seed=seed + idx),
+            }
+        )
+    return cells
+
+
+def real_cells(args: argparse.Namespace, config: Dict[str, Any], shared_detector: Any) -> List[Dict[str, Any]]:
+    from autonomy.kinematics import IKSolver, IKWorkspaceCache
+    from autonomy.lerobot_adapter import LeRobotAdapter
+    from autonomy.perception_providers import CameraPerceptionProvider
+
+    workspace = IKWorkspaceCache.load_or_build(args.ik_cache, IKSolver())
+    cells = []
+    for spec in config["robots"]:
+        ik_solver = IKSolver()
+        ik_solver.cache = workspace
+        cameras = spec.get("cameras", {"wrist": 0, "front": 2})
+        robot = LeRobotAdapter(
+            robot_type=spec.get("robot_type", "so100_follower"),
+            port=spec["port"],
+            camera_config=cameras,
+            ik_solver=ik_solver,
+        )
+        provider = CameraPerceptionProvider(camera_config=cameras, detector=shared_detector.client(spec["id"]))
+        cells.append(
+            {
+                "id": spec["id"],
+                "robot": robot,
+                "perception": PerceptionModule(provider=provider),
+                "reset": lambda idx, robot=robot: robot.reset(),
+                "provider": provider,
+            }
+        )
+    return cells
+
+
+def main() -> int:
+    args = parse_args()
+    goal = Goal(goal_type="put_in_bin", target_obj_class=ObjClass(args.goal_target))
+
+    feed: Optional[TelemetryHttpFeed] = None
+    if args.http_port:
+        try:
+            feed = TelemetryHttpFeed(port=args.http_port)
+            feed.start()
+        except OSError as exc:
+            print(f"warning: telemetry feed disabled (could not bind port {args.http_port}: {exc})")
+            feed = None
+
+    shared_detector = None
+    if args.config:
+        from autonomy.perception_providers import SharedDetector, YOLOWorldDetector
+
+        config = json.loads(Path(args.config).read_text())
+        detector = YOLOWorldDetector(classes=args.yolo_classes, model_size=args.yolo_model)
+        shared_detector = SharedDetector(detector, max_batch=args.max_batch)
+        cells = real_cells(args, config, shared_detector)
+    else:
+        cells = sim_cells(args)
+
+    # Sim steps never block; real cells get per-action deadlines so a hung serial read fails the step.
+    deadlines = parse_deadlines(args.step_deadline) if args.config else None
+    orchestrator = FleetOrchestrator(feed=feed, stall_s=args.stall_s)
+    sinks: List[Any] = []
+    for cell in cells:
+        cell_sinks: List[object] = [orchestrator.telemetry_sink(cell["id"])]
+        if args.jsonl_dir:
+            cell_sinks.append(BufferedJsonlSink(str(Path(args.jsonl_dir) / f"{cell['id']}.jsonl")))
+        sink = MultiSink(cell_sinks)
+        sinks.append(sink)
+        planner = Planner()
+        registry = REGISTRY.with_labels(robot=cell["id"])
+        agent = Track1Agent(
+            robot=cell["robot"],
+            planner=planner,
+            perception=cell["perception"],
+            executor=StepExecutor(planner, deadlines=deadlines, registry=registry),
+            sink=sink,
+            max_retries_per_step=args.max_retries_step,
+            max_replans=args.max_replans,
+            registry=registry,
+        )
+        orchestrator.add_cell(
+            cell["id"], agent, goal, episodes=args.episodes, max_ticks=args.max_ticks, reset=cell["reset"]
+        )
+
+    if feed is not None:
+        print(f"telemetry feed at http://127.0.0.1:{args.http_port}/robots")
+
+    def print_status(status: Dict[str, Dict[str, Any]]) -> None:
+        for robot_id, row in status.items():
+            flag = " STALLED" if row["stalled"] else ""
+            print(f"  {robot_id}: episodes={row['episodes']} successes={row['successes']} "
+                  f"frames={row['frames']} since_frame_s={row['since_frame_s']}{flag}")
+
+    orchestrator.start()
+    try:
+        orchestrator.join(on_status=print_status, status_every_s=args.status_every)
+    except KeyboardInterrupt:
+        print("stopping after the current episodes...")
+        orchestrator.stop()
+        orchestrator.join()
+    finally:
+        for sink in sinks:
+            sink.close()
+        for cell in cells:
+            disconnect: Optional[Callable[[], None]] = getattr(cell["robot"], "disconnect", None)
+            if callable(disconnect):
+                disconnect()
+            if "provider" in cell:
+                cell["provider"].release()
+        if shared_detector is not None:
+            print(f"shared_detector={shared_detector.stats()}")
+            shared_detector.close()
+        if feed is not None:
+            feed.stop()
+
+    status = orchestrator.status()
+    episodes = sum(c.completed for c in orchestrator.cells.values())
+    successes = sum(c.successes for c in orchestrator.cells.values())
+    for robot_id, row in status.items():
+        error = f" error={row['error']}" if row["error"] else ""
+        print(f"robot={robot_id} episodes={row['episodes']} successes={row['successes']} frames={row['frames']}{error}")
+    print(f"summary robots={len(status)} episodes={episodes} success_rate={successes / max(episodes, 1):.3f}")
+    return 0 if all(row["error"] is None for row in status.values()) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
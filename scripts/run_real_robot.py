@@ -24,10 +24,12 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from autonomy import Goal, ObjClass, PerceptionModule, Planner, StepExecutor, Track1Agent
+from autonomy.executor import parse_deadlines
+from autonomy.kinematics import IKSolver, IKWorkspaceCache
 from autonomy.lerobot_adapter import LeRobotAdapter
 from autonomy.perception_providers import CameraPerceptionProvider, YOLOWorldDetector
 from autonomy.policy_router import PolicyRouter, PolicyType
-from autonomy.telemetry import InMemorySink, JsonlSink, MultiSink, StdoutSink
+from autonomy.telemetry import SINK_POLICIES, BufferedJsonlSink, InMemorySink, MultiSink, SinkWorker, StdoutSink
 from autonomy.telemetry_http import TelemetryHttpFeed
 
 
@@ -57,14 +59,33 @@ def parse_args() -> argparse.Namespace:
                         help="Object classes for YOLO-World detector")
     parser.add_argument("--yolo-model", default="s", choices=["s", "m", "l"],
                         help="YOLO-World model size")
+    parser.add_argument("--ik-cache", default="runs/ik_workspace.npz",
+                        help="IK workspace warm-start cache (built on first run)")
     parser.add_argument("--max-retries-step", type=int, default=2)
     parser.add_argument("--max-replans", type=int, default=3)
     parser.add_argument("--max-ticks", type=int, default=80)
     parser.add_argument("--episodes", type=int, default=1)
+    parser.add_argument("--step-deadline", action="append", default=[], metavar="ACTION=SECONDS",
+                        help="Override a step deadline, e.g. GRASP=5 (repeatable; 0 removes it)")
+    parser.add_argument("--no-step-deadlines", action="store_true",
+                        help="Run steps inline without deadlines (a hung robot call blocks the episode)")
+    parser.add_argument("--record", default="",
+                        help="Record episodes as a LeRobot-format dataset in this directory (needs pyarrow)")
     parser.add_argument("--seed", type=int, default=7)
-    parser.add_argument("--jsonl", default="runs/real_telemetry.jsonl")
+    parser.add_argument("--jsonl", default="runs/real_telemetry.jsonl",
+                        help="Telemetry path (.gz suffix compresses)")
+    parser.add_argument("--jsonl-rotate-mb", type=float, default=0.0,
+                        help="Rotate telemetry files after this many MB (0 disables)")
+    parser.add_argument("--jsonl-per-episode", action="store_true",
+                        help="Start a new telemetry file per episode")
     parser.add_argument("--http-port", type=int, default=8765,
                         help="Telemetry HTTP feed port (0 disables)")
+    parser.add_argument("--sink-mode", choices=["sync", "async"], default="sync",
+                        help="async gives every telemetry sink its own queue and thread")
+    parser.add_argument("--sink-policy", choices=list(SINK_POLICIES), default="drop_oldest",
+                        help="Backpressure policy for async live sinks (the JSONL log and memory sink always block)")
+    parser.add_argument("--sink-sample-every", type=int, default=1,
+                        help="With --sink-policy sample, forward every Nth frame")
     parser.add_argument("--verbose", action="store_true")
     return parser.parse_args()
 
@@ -74,10 +95,13 @@ def main() -> int:
 
     # --- Robot ---
     camera_config = {"wrist": args.camera_wrist, "front": args.camera_front}
+    ik_solver = IKSolver()
+    ik_solver.cache = IKWorkspaceCache.load_or_build(args.ik_cache, ik_solver)
     robot = LeRobotAdapter(
         robot_type=args.robot_type,
         port=args.robot_port,
         camera_config=camera_config,
+        ik_solver=ik_solver,
     )
 
     # --- Perception ---
@@ -104,9 +128,16 @@ def main() -> int:
     goal = Goal(goal_type="put_in_bin", target_obj_class=target_class)
 
     # --- Telemetry sinks ---
-    jsonl_sink = JsonlSink(args.jsonl)
+    jsonl_sink = BufferedJsonlSink(
+        args.jsonl,
+        rotate_bytes=int(args.jsonl_rotate_mb * 1024 * 1024),
+        rotate_per_episode=args.jsonl_per_episode,
+    )
     memory_sink = InMemorySink()
     sinks: List[object] = [jsonl_sink, memory_sink]
+    if args.sink_mode == "async":
+        # Durable sinks never drop frames; --sink-policy only applies to the live ones.
+        sinks = [SinkWorker(sink, policy="block") for sink in sinks]
 
     if args.verbose:
         sinks.append(StdoutSink())
@@ -119,18 +150,31 @@ def main() -> int:
 
             class FeedSink:
                 def emit(self, frame):
-                    feed.update(frame.to_dict())
+                    feed.update_frame(frame)
 
             sinks.append(FeedSink())
         except OSError as exc:
             print(f"warning: telemetry feed disabled ({exc})")
             feed = None
 
-    sink = MultiSink(sinks)
+    sink = MultiSink(
+        sinks,
+        async_mode=args.sink_mode == "async",
+        policy=args.sink_policy,
+        sample_every=args.sink_sample_every,
+    )
+
+    # --- Dataset recording (joint commands at control rate, camera frames as video) ---
+    recorder = None
+    if args.record:
+        from autonomy.dataset_recorder import LeRobotRecorder
+
+        recorder = LeRobotRecorder(args.record, robot_type="so100")
 
     # --- Agent ---
     planner = Planner()
-    executor = StepExecutor(planner)
+    deadlines = None if args.no_step_deadlines else parse_deadlines(args.step_deadline)
+    executor = StepExecutor(planner, deadlines=deadlines)
     agent = Track1Agent(
         robot=robot,
         planner=planner,
@@ -139,6 +183,7 @@ def main() -> int:
         sink=sink,
         max_retries_per_step=args.max_retries_step,
         max_replans=args.max_replans,
+        recorder=recorder,
     )
 
     # --- Run episodes ---
@@ -159,9 +204,11 @@ def main() -> int:
             print(
                 f"episode={idx + 1} success={result.metrics.success} "
                 f"steps={result.metrics.steps_executed} retries={result.metrics.retries} "
-                f"replans={result.metrics.replans} duration_s={result.metrics.duration_s:.2f} "
+                f"replans={result.metrics.replans} timeouts={result.metrics.timeouts} "
+                f"duration_s={result.metrics.duration_s:.2f} "
                 f"fail_reason={result.metrics.fail_reason}"
             )
+            print(f"ik_stats={ik_solver.stats.to_dict()}")
 
         success_rate = successes / max(args.episodes, 1)
         print(f"\nsummary episodes={args.episodes} success_rate={success_rate:.3f} telemetry={args.jsonl}")
@@ -174,6 +221,13 @@ def main() -> int:
 
     finally:
         sink.close()
+        executor.close()
+        if recorder is not None:
+            recorder.close()
+            print(f"dataset={args.record} recorder={recorder.stats()}")
+        print(f"telemetry_writer={jsonl_sink.stats()}")
+        if args.sink_mode == "async":
+            print(f"telemetry_sinks={sink.sink_stats()}")
         camera_provider.release()
         robot.disconnect()
         if feed is not None:
@@ -1,17 +1,32 @@
 #!/usr/bin/env python3
+"""Run randomized Track-1 trials, or sweep agent parameters over common seeds.
+
+Usage:
+  python scripts/run_trials.py --trials 20 --seed 42
+  python scripts/run_trials.py --trials 200 --sweep max_retries_per_step=0:3 --sweep max_replans=0,1,3
+  python scripts/run_trials.py --trials 200 --sweep max_retries_per_step=0:4 --sweep max_replans=0:5 \
+      --search random --samples 10
+  python scripts/run_trials.py --trials 500 --cache runs/trial_cache.sqlite   # re-runs only missing episodes
+"""
 from __future__ import annotations
 
 import argparse
 import csv
 import sys
 from pathlib import Path
+from typing import Callable, Dict, List, Optional
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from autonomy import Goal, ObjClass, PerceptionModule, Planner, SimRobot, StepExecutor, Track1Agent
+from autonomy.rollout import RolloutPool
+from autonomy.sim_robot import SceneConfig
+from autonomy.sweep import SequentialSweep, grid, parse_param, random_configs
 from autonomy.telemetry import InMemorySink, MultiSink
+from autonomy.trial_cache import TrialCache
+from autonomy.types import EpisodeMetrics
 
 
 def parse_args() -> argparse.Namespace:
@@ -22,20 +37,156 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--max-retries-step", type=int, default=2)
     parser.add_argument("--max-replans", type=int, default=3)
     parser.add_argument("--max-ticks", type=int, default=80)
+    parser.add_argument("--scene-objects", type=int, default=0,
+                        help="Generate a cluttered table with this many objects (0 = default 3-object scene)")
+    parser.add_argument("--lookahead", type=int, default=0,
+                        help="Monte Carlo rollouts per candidate when replanning (0 disables)")
+    parser.add_argument("--lookahead-workers", type=int, default=0,
+                        help="Processes for lookahead rollouts (0 runs them inline)")
+    parser.add_argument("--sweep", action="append", default=[], metavar="PARAM=VALUES",
+                        help="Sweep an agent parameter, e.g. max_replans=0,1,3 or max_retries_per_step=0:3 "
+                             "(repeatable; --trials becomes the per-config maximum)")
+    parser.add_argument("--search", choices=["grid", "random"], default="grid", help="Sweep search strategy")
+    parser.add_argument("--samples", type=int, default=8, help="Configs drawn by --search random")
+    parser.add_argument("--min-trials", type=int, default=10, help="Trials per config before early stopping")
+    parser.add_argument("--confidence", type=float, default=0.95,
+                        help="Confidence of the Wilson bounds used to stop configs that are clearly worse")
+    parser.add_argument("--cache", default="",
+                        help="SQLite episode cache; episodes already run with the same seed, goal, parameters "
+                             "and autonomy sources are reused, so interrupted runs resume")
+    parser.add_argument("--invalidate", choices=["stale", "all"], default=None,
+                        help="Before running, drop cache entries from other source versions (stale) or all of them")
     parser.add_argument("--csv", default="runs/trials.csv")
     return parser.parse_args()
 
 
-def main() -> int:
-    args = parse_args()
-    goal = Goal(goal_type="put_in_bin", target_obj_class=ObjClass(args.goal_target))
+def episode_params(
+    args: argparse.Namespace, max_retries_per_step: int, max_replans: int, max_ticks: int
+) -> Dict[str, int]:
+    """Everything besides seed and goal that determines an episode's outcome (the cache key)."""
+    return {
+        "max_retries_per_step": max_retries_per_step,
+        "max_replans": max_replans,
+        "max_ticks": max_ticks,
+        "scene_objects": args.scene_objects,
+        "lookahead": args.lookahead,
+    }
+
+
+def run_one(
+    cache: Optional[TrialCache],
+    agent: Callable[[], Track1Agent],
+    robot: SimRobot,
+    goal: Goal,
+    seed: int,
+    params: Dict[str, int],
+) -> EpisodeMetrics:
+    if cache is not None:
+        cached = cache.get(seed, goal, params)
+        if cached is not None:
+            return cached
+    robot.reset(seed=seed)
+    metrics = agent().run_episode(goal=goal, max_ticks=params["max_ticks"]).metrics
+    if cache is not None:
+        cache.put(seed, goal, params, metrics)
+    return metrics
+
+
+def run_sweep(args: argparse.Namespace, goal: Goal, robot: SimRobot, cache: Optional[TrialCache]) -> int:
+    try:
+        space = dict(parse_param(spec) for spec in args.sweep)
+    except ValueError as exc:
+        raise SystemExit(f"--sweep: {exc}")
+    if args.search == "grid":
+        configs = grid(space)
+    else:
+        configs = random_configs(space, args.samples, args.seed)
+    if not configs or args.trials < 1:
+        raise SystemExit("sweep has no configs to run (check --sweep values, --samples and --trials)")
+    agents: Dict[tuple, Track1Agent] = {}
+
+    def run(params: Dict[str, int], seed: int):
+        knobs = {
+            "max_retries_per_step": params.get("max_retries_per_step", args.max_retries_step),
+            "max_replans": params.get("max_replans", args.max_replans),
+        }
+        key = tuple(knobs.values())
 
+        def agent() -> Track1Agent:
+            if key in agents:
+                return agents[key]
+            planner = Planner()
+            lookahead = None
+            if args.lookahead:
+                lookahead = RolloutPool(
+                    k=args.lookahead,
+                    max_retries_per_step=knobs["max_retries_per_step"],
+                    workers=args.lookahead_workers,
+                )
+            agents[key] = Track1Agent(
+                robot=robot,
+                planner=planner,
+                perception=PerceptionModule(),
+                executor=StepExecutor(planner),
+                sink=MultiSink([InMemorySink(max_frames=1, spill=False)]),
+                lookahead=lookahead,
+                **knobs,
+            )
+            return agents[key]
+
+        # Common random numbers: every config replays the same seeded scene.
+        max_ticks = params.get("max_ticks", args.max_ticks)
+        return run_one(cache, agent, robot, goal, seed, episode_params(args, *knobs.values(), max_ticks))
+
+    seeds = [args.seed + i for i in range(args.trials)]
+    sweep = SequentialSweep(configs, run, seeds, min_trials=args.min_trials, confidence=args.confidence)
+
+    remaining = [len(configs)]
+
+    def progress(round_no: int, active) -> None:
+        if len(active) != remaining[0]:
+            remaining[0] = len(active)
+            print(f"round={round_no} active={len(active)}/{len(configs)} episodes={sweep.episodes}")
+
+    try:
+        ranked = sweep.execute(on_round=progress)
+    finally:
+        for agent in agents.values():
+            if agent.lookahead is not None:
+                agent.lookahead.close()
+    rows: List[Dict[str, object]] = [r.row(sweep.z) for r in ranked]
+
+    out = Path(args.csv)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with out.open("w", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+
+    widths = {k: max(len(k), *(len(str(r[k])) for r in rows)) for k in rows[0]}
+    print("  ".join(k.rjust(w) for k, w in widths.items()))
+    for row in rows:
+        print("  ".join(str(row[k]).rjust(w) for k, w in widths.items()))
+    full = len(configs) * args.trials
+    print(f"configs={len(configs)} episodes={sweep.episodes} of {full} ({sweep.episodes / max(full, 1):.0%}) csv={out}")
+    if cache is not None:
+        print(f"cache={cache.stats()}")
+    return 0
+
+
+def run_plain(args: argparse.Namespace, goal: Goal, robot: SimRobot, cache: Optional[TrialCache]) -> int:
     planner = Planner()
     perception = PerceptionModule()
-    robot = SimRobot(seed=args.seed)
     executor = StepExecutor(planner)
 
     sink = MultiSink([InMemorySink()])
+    lookahead = None
+    if args.lookahead:
+        lookahead = RolloutPool(
+            k=args.lookahead,
+            max_retries_per_step=args.max_retries_step,
+            workers=args.lookahead_workers,
+        )
     agent = Track1Agent(
         robot=robot,
         planner=planner,
@@ -44,6 +195,7 @@ def main() -> int:
         sink=sink,
         max_retries_per_step=args.max_retries_step,
         max_replans=args.max_replans,
+        lookahead=lookahead,
     )
 
     rows = []
@@ -51,10 +203,9 @@ def main() -> int:
     total_retries = 0
     total_replans = 0
 
+    params = episode_params(args, args.max_retries_step, args.max_replans, args.max_ticks)
     for i in range(args.trials):
-        robot.reset(seed=args.seed + i)
-        result = agent.run_episode(goal=goal, max_ticks=args.max_ticks)
-        m = result.metrics
+        m = run_one(cache, lambda: agent, robot, goal, args.seed + i, params)
         successes += int(m.success)
         total_retries += m.retries
         total_replans += m.replans
@@ -66,11 +217,16 @@ def main() -> int:
                 "steps_executed": m.steps_executed,
                 "retries": m.retries,
                 "replans": m.replans,
+                "timeouts": m.timeouts,
                 "duration_s": round(m.duration_s, 3),
+                "avg_step_ms": round(m.total_step_ms / max(m.steps_executed, 1), 3),
                 "fail_reason": m.fail_reason or "",
             }
         )
 
+    if lookahead is not None:
+        lookahead.close()
+
     out = Path(args.csv)
     out.parent.mkdir(parents=True, exist_ok=True)
     with out.open("w", newline="", encoding="utf-8") as fh:
@@ -84,8 +240,29 @@ def main() -> int:
     print(f"avg_retries={total_retries / max(args.trials, 1):.2f}")
     print(f"avg_replans={total_replans / max(args.trials, 1):.2f}")
     print(f"csv={out}")
+    if cache is not None:
+        print(f"cache={cache.stats()}")
     return 0
 
 
+def main() -> int:
+    args = parse_args()
+    goal = Goal(goal_type="put_in_bin", target_obj_class=ObjClass(args.goal_target))
+
+    scene = SceneConfig(num_objects=args.scene_objects) if args.scene_objects else None
+    robot = SimRobot(seed=args.seed, scene=scene)
+    cache = TrialCache(args.cache) if args.cache else None
+    if cache is not None and args.invalidate:
+        removed = cache.invalidate(everything=args.invalidate == "all")
+        print(f"cache_invalidated={removed}")
+    try:
+        if args.sweep:
+            return run_sweep(args, goal, robot, cache)
+        return run_plain(args, goal, robot, cache)
+    finally:
+        if cache is not None:
+            cache.close()
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
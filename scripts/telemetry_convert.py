@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Convert JSONL telemetry to the columnar binary format and query it.
+
+Usage:
+  python scripts/telemetry_convert.py runs/demo_telemetry.jsonl runs/demo_telemetry.tcol
+  python scripts/telemetry_convert.py runs/demo_telemetry.tcol --errors grasp_failed
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from autonomy.telemetry_columnar import ColumnarTelemetryReader, jsonl_to_columnar
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Convert/query columnar Track-1 telemetry")
+    parser.add_argument("src", help="JSONL(.gz) telemetry to convert, or an existing .tcol file")
+    parser.add_argument("dst", nargs="?", default="", help="Output .tcol path (default: <src>.tcol)")
+    parser.add_argument("--errors", default="", help="Print ticks whose last_error starts with this prefix")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    src = Path(args.src)
+    if src.suffix == ".tcol":
+        path = src
+    else:
+        path = Path(args.dst) if args.dst else src.with_name(src.name.split(".", 1)[0] + ".tcol")
+        start = time.perf_counter()
+        rows = jsonl_to_columnar(src, path)
+        print(f"converted rows={rows} in {time.perf_counter() - start:.2f}s -> {path}")
+
+    with ColumnarTelemetryReader(path) as reader:
+        ends = [end - 1 for _, end in reader.episodes]
+        print(f"rows={len(reader)} episodes={len(reader.episodes)} size_bytes={path.stat().st_size}")
+        if ends:
+            # Index into the mapped column inline; a view bound here would outlive the mapping.
+            print(f"success_rate={float(reader['success'][ends].mean()):.3f}")
+        print(f"errors={reader.counts('error')}")
+        if args.errors:
+            mask = reader.mask("error", args.errors)
+            episodes = reader["episode"][mask].tolist()
+            ticks = reader["tick"][mask].tolist()
+            print(f"matches={int(mask.sum())}")
+            del mask
+            for episode, tick in zip(episodes, ticks):
+                print(f"  episode={episode} tick={tick}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
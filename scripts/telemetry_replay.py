@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Replay recorded JSONL telemetry into a TelemetryHttpFeed.
+
+Usage:
+  python scripts/telemetry_replay.py runs/demo_telemetry.jsonl                 # 1x, original pacing
+  python scripts/telemetry_replay.py runs/*.jsonl.gz --speed 10 --loops 0      # 10x, until Ctrl-C
+  python scripts/telemetry_replay.py runs/demo_telemetry.jsonl --speed 0 --hold
+  python scripts/feed_loadgen.py --url http://127.0.0.1:8765 --clients 16     # in another shell
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from autonomy.telemetry_http import TelemetryHttpFeed
+from autonomy.telemetry_replay import load_all, replay
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Replay recorded telemetry into the HTTP feed")
+    parser.add_argument("paths", nargs="+", help="JSONL(.gz) telemetry files, replayed in order")
+    parser.add_argument("--speed", type=float, default=1.0, help="Playback speed multiplier (0 = as fast as possible)")
+    parser.add_argument("--loops", type=int, default=1, help="Times to replay the recording (0 = until interrupted)")
+    parser.add_argument("--max-gap", type=float, default=2.0,
+                        help="Cap (recorded seconds) on pauses between frames, e.g. across sessions")
+    parser.add_argument("--no-restamp", action="store_true", help="Keep the recorded ts_ms instead of the wall clock")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--history-limit", type=int, default=1000)
+    parser.add_argument("--hold", action="store_true", help="Keep serving the last frames after the replay ends")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    frames = load_all(args.paths)
+    if not frames:
+        print("no frames found", file=sys.stderr)
+        return 1
+
+    feed = TelemetryHttpFeed(host=args.host, port=args.port, history_limit=args.history_limit)
+    feed.start()
+    speed = "max" if args.speed <= 0 else f"{args.speed:g}x"
+    print(f"replaying frames={len(frames)} speed={speed} -> http://{args.host}:{args.port}/latest")
+
+    loops = itertools.count() if args.loops <= 0 else range(args.loops)
+    try:
+        for loop in loops:
+            stats = replay(
+                frames,
+                feed.update_bytes,
+                speed=args.speed,
+                max_gap_s=args.max_gap,
+                restamp=not args.no_restamp,
+            )
+            print(f"loop={loop} replay={stats} stream={feed.stream_stats()}")
+        if args.hold:
+            print("replay finished; serving until Ctrl-C")
+            while True:
+                time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        feed.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Aggregate episode stats across many JSONL(.gz) telemetry files.
+
+Usage:
+  python scripts/telemetry_stats.py                       # runs/*.jsonl*, grouped by fail_reason
+  python scripts/telemetry_stats.py runs/ --group-by error_kind --since-days 7
+  python scripts/telemetry_stats.py runs/day*.jsonl.gz --group-by day --workers 8 --json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from autonomy.telemetry_analytics import GROUP_KEYS, TelemetryIndex, aggregate, load_summaries
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Multi-file Track-1 telemetry analytics")
+    parser.add_argument("paths", nargs="*", default=[str(ROOT / "runs")],
+                        help="Telemetry files or directories (directories expand to *.jsonl / *.jsonl.gz)")
+    parser.add_argument("--group-by", choices=GROUP_KEYS, default="fail_reason")
+    parser.add_argument("--since-days", type=float, default=0.0, help="Only episodes that ended in the last N days")
+    parser.add_argument("--workers", type=int, default=0, help="Parallel file scanners (0 = CPU count)")
+    parser.add_argument("--index", default="", help="Summary index path (default: <first dir>/.telemetry_index.json)")
+    parser.add_argument("--no-index", action="store_true", help="Rescan every file and do not persist summaries")
+    parser.add_argument("--json", action="store_true", help="Print rows as JSON instead of a table")
+    return parser.parse_args()
+
+
+def expand(paths: List[str]) -> List[Path]:
+    files: List[Path] = []
+    for raw in paths:
+        path = Path(raw)
+        if path.is_dir():
+            files.extend(sorted(p for p in path.iterdir() if p.name.endswith((".jsonl", ".jsonl.gz"))))
+        elif path.exists():
+            files.append(path)
+        else:
+            print(f"skipping missing {path}", file=sys.stderr)
+    return files
+
+
+def main() -> int:
+    args = parse_args()
+    files = expand(args.paths)
+    if not files:
+        print("no telemetry files found", file=sys.stderr)
+        return 1
+
+    index = None
+    if not args.no_index:
+        first_dir = Path(args.paths[0]) if Path(args.paths[0]).is_dir() else files[0].parent
+        index = TelemetryIndex(args.index or first_dir / ".telemetry_index.json")
+
+    start = time.perf_counter()
+    summaries, scan = load_summaries(files, index=index, workers=args.workers)
+    if index is not None:
+        index.save()
+    since_ms = int((time.time() - args.since_days * 86400) * 1000) if args.since_days > 0 else None
+    rows = aggregate(summaries, group_by=args.group_by, since_ms=since_ms)
+    elapsed = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+
+    frames = sum(s["frames"] for s in summaries.values())
+    fallbacks = sum(s["json_fallbacks"] for s in summaries.values())
+    print(
+        f"files={scan['files']} scanned={scan['scanned']} cached={scan['cached']} "
+        f"frames={frames} json_fallbacks={fallbacks} elapsed_s={elapsed:.2f}"
+    )
+    columns = [args.group_by, "episodes", "frames", "success_rate", "mean_retries", "mean_replans", "mean_duration_s"]
+    widths = [max(len(c), *(len(str(r[c])) for r in rows)) if rows else len(c) for c in columns]
+    print("  ".join(c.ljust(w) for c, w in zip(columns, widths)).rstrip())
+    for row in rows:
+        print("  ".join(str(row[c]).ljust(w) for c, w in zip(columns, widths)).rstrip())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Receive framed UDP telemetry and republish it on a TelemetryHttpFeed.
+
+Usage:
+  python scripts/udp_bridge.py --listen 0.0.0.0:9870 --http-port 8765
+  python scripts/run_demo.py --udp 127.0.0.1:9870 --udp-batch-ms 20 --episodes 20
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from autonomy.telemetry_delta import DeltaDecoder
+from autonomy.telemetry_http import TelemetryHttpFeed
+from autonomy.telemetry_udp import UdpTelemetryReceiver
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="UDP telemetry → HTTP feed bridge")
+    parser.add_argument("--listen", default="0.0.0.0:9870", help="host:port to receive UdpSink datagrams on")
+    parser.add_argument("--http-port", type=int, default=8765, help="Port for the republished telemetry feed")
+    parser.add_argument("--http-host", default="127.0.0.1")
+    parser.add_argument("--reassembly-timeout", type=float, default=1.0,
+                        help="Seconds to wait for missing chunks of a large frame")
+    parser.add_argument("--stats-every", type=float, default=5.0, help="Seconds between stats lines (0 disables)")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    host, port = args.listen.rsplit(":", maxsplit=1)
+
+    feed = TelemetryHttpFeed(host=args.http_host, port=args.http_port)
+    decoder = DeltaDecoder()
+
+    def on_frame(_seq: int, body: bytes) -> None:
+        # Full frames are forwarded as received; only delta streams need a decode + re-encode.
+        if not body.startswith(b'{"t":'):
+            feed.update_bytes(body)
+            return
+        frame = decoder.decode(json.loads(body))
+        if frame is not None:
+            feed.update(frame)
+
+    receiver = UdpTelemetryReceiver(
+        on_frame,
+        host=host,
+        port=int(port),
+        reassembly_timeout_s=args.reassembly_timeout,
+    )
+    feed.start()
+    receiver.start()
+    print(f"udp_bridge listening on {host}:{receiver.port} -> http://{args.http_host}:{args.http_port}/latest")
+
+    try:
+        while True:
+            time.sleep(args.stats_every or 3600)
+            if args.stats_every:
+                print(f"udp_stats={receiver.stats()} delta_gaps={decoder.gaps}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        receiver.stop()
+        feed.stop()
+        print(f"udp_stats={receiver.stats()}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,15 +4,18 @@ import { useCallback, useEffect, useRef, useState } from "react";
 import { RoomEvent } from "livekit-client";
 import { useRoomContext } from "@livekit/components-react";
 import type { TelemetryData } from "../types";
+import { DeltaDecoder, isDeltaMessage } from "../lib/telemetryDelta";
 
 /**
  * Subscribes to the "telemetry" data channel in the current LiveKit room
- * and returns the latest parsed TelemetryData frame.
+ * and returns the latest parsed TelemetryData frame. Delta-encoded streams
+ * (keyframe + patch messages) are reassembled transparently.
  */
 export function useTelemetry(): TelemetryData | null {
   const room = useRoomContext();
   const [telemetry, setTelemetry] = useState<TelemetryData | null>(null);
   const decoder = useRef(new TextDecoder());
+  const deltas = useRef(new DeltaDecoder());
 
   const handleData = useCallback(
     (
@@ -23,10 +26,13 @@ export function useTelemetry(): TelemetryData | null {
     ) => {
       if (topic !== "telemetry") return;
       try {
-        const parsed: TelemetryData = JSON.parse(
-          decoder.current.decode(payload),
-        );
-        setTelemetry(parsed);
+        const parsed: unknown = JSON.parse(decoder.current.decode(payload));
+        if (!isDeltaMessage(parsed)) {
+          setTelemetry(parsed as TelemetryData);
+          return;
+        }
+        const frame = deltas.current.decode(parsed);
+        if (frame) setTelemetry(frame as unknown as TelemetryData);
       } catch {
         // Ignore malformed telemetry packets.
       }
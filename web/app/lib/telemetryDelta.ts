@@ -0,0 +1,93 @@
+// Decoder for keyframe + delta telemetry messages. Mirrors
+// autonomy/telemetry_delta.py; see that module for the wire format.
+
+type Json = null | boolean | number | string | Json[] | { [key: string]: Json };
+type JsonObject = { [key: string]: Json };
+
+export type DeltaMessage =
+  | { t: "k"; s: number; f: JsonObject }
+  | { t: "d"; s: number; b: number; p: JsonObject };
+
+const REPLACE = "=";
+const REMOVE = "-";
+const ORDER = "#order";
+
+const isObject = (v: unknown): v is JsonObject =>
+  v !== null && typeof v === "object" && !Array.isArray(v);
+
+export function isDeltaMessage(msg: unknown): msg is DeltaMessage {
+  return isObject(msg) && (msg.t === "k" || msg.t === "d") && typeof msg.s === "number";
+}
+
+export class DeltaDecoder {
+  private state: JsonObject | null = null;
+  private seq: number | null = null;
+  gaps = 0;
+
+  /** Full frame, or null while waiting for a keyframe after a lost or inapplicable delta. */
+  decode(msg: DeltaMessage): JsonObject | null {
+    if (msg.t === "k") {
+      this.state = msg.f;
+      this.seq = msg.s;
+      return this.state;
+    }
+    if (this.state === null || msg.b !== this.seq) {
+      this.gaps += 1;
+      this.state = null;
+      return null;
+    }
+    try {
+      this.state = applyPatch(this.state, msg.p) as JsonObject;
+    } catch (err) {
+      if (!(err instanceof PatchError)) throw err;
+      this.gaps += 1;
+      this.state = null;
+      return null;
+    }
+    this.seq = msg.s;
+    return this.state;
+  }
+}
+
+export class PatchError extends Error {}
+
+/** Throws PatchError for an "@<id>" key naming an element the list does not have. */
+export function applyPatch(node: Json | undefined, patch: Json): Json {
+  if (!isObject(patch)) return patch;
+  if (REPLACE in patch) return patch[REPLACE];
+  if (Array.isArray(node)) {
+    let out = node.slice();
+    const order = patch[ORDER];
+    if (Array.isArray(order)) {
+      const byId = new Map(node.filter(isObject).map((el) => [el.id, el]));
+      out = order.map((id) => byId.get(id) ?? { id });
+    }
+    let positions: Map<Json, number> | null = null;
+    for (const [key, sub] of Object.entries(patch)) {
+      if (key === ORDER) continue;
+      let idx: number;
+      if (key.startsWith("@")) {
+        positions ??= new Map(out.map((el, i) => [isObject(el) ? el.id : null, i]));
+        const found = positions.get(key.slice(1));
+        if (found === undefined) throw new PatchError(`patch references unknown list element id ${key.slice(1)}`);
+        idx = found;
+      } else {
+        idx = Number(key);
+      }
+      out[idx] = applyPatch(out[idx], sub);
+    }
+    return out;
+  }
+
+  const out: JsonObject = isObject(node) ? { ...node } : {};
+  const removed = patch[REMOVE];
+  if (Array.isArray(removed)) {
+    for (const key of removed) delete out[String(key)];
+  }
+  for (const [key, sub] of Object.entries(patch)) {
+    if (key === REMOVE) continue;
+    const real = key.startsWith("\\") ? key.slice(1) : key;
+    out[real] = applyPatch(out[real], sub);
+  }
+  return out;
+}
@@ -40,8 +40,26 @@ export interface MetricsSnapshot {
   success: boolean;
   retries: number;
   replans: number;
+  /** Steps that missed their execution deadline this episode. */
+  timeouts: number;
   steps_executed: number;
   duration_s: number;
   fail_reason: string | null;
+  last_step_ms: number;
+  avg_step_ms: number;
   success_rate_last10: number | null;
+  /** Present when telemetry fans out through an async MultiSink. */
+  sinks?: Record<string, SinkStats>;
+}
+
+export interface SinkStats {
+  policy: "block" | "drop_oldest" | "sample";
+  queue_depth: number;
+  emitted: number;
+  dropped: number;
+  sampled_out: number;
+  errors: number;
+  last_emit_ms: number;
+  avg_emit_ms: number;
+  max_emit_ms: number;
 }